@@ -6,105 +6,85 @@
 /*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
 /*                                                +#+#+#+#+#+   +#+           */
 /*   Created: 2026/01/04 13:34:43 by jhogonca          #+#    #+#             */
-/*   Updated: 2026/01/07 21:13:44 by jhogonca         ###   ########.fr       */
+/*   Updated: 2026/10/17 02:17:04 by jhogonca         ###   ########.fr       */
 /*                                                                            */
 /* ************************************************************************** */
 
 #include "board_internal.h"
 
-static bool	allocate_grid(t_board *board);
-static bool	allocate_snake_buffers(t_board *board);
-static bool	allocate_apples(t_board *board);
-
-t_board	*board_create(int size)
+static size_t	align8(size_t bytes)
 {
-	t_board	*board;
-
-	board = (t_board *)malloc(sizeof(t_board));
-	if (board == NULL)
-		return (NULL);
-	if (size < 8 || size > 20)
-		size = 10;
-	board->size = size;
-	board->max_snake_length = (size * size) - 1;
-	board->num_green_apples = 2 + (size - 10) / 3;
-	board->num_red_apples = 1 + (size - 10) / 5;
-	board->num_apples = board->num_green_apples + board->num_red_apples;
-	board->grid = NULL;
-	board->snake.x = NULL;
-	board->snake.y = NULL;
-	board->apples = NULL;
-	if (!allocate_grid(board)
-		|| !allocate_snake_buffers(board)
-		|| !allocate_apples(board))
-	{
-		board_destroy(board);
-		return (NULL);
-	}
-	board_reset(board);
-	return (board);
+	return ((bytes + 7) & ~(size_t)7);
 }
 
-void	board_destroy(t_board *board)
+static void	init_layout(t_board *layout, int size, int engine)
 {
-	int	i;
+	int	cells;
 
-	if (board == NULL)
-		return ;
-	if (board->grid != NULL)
-	{
-		i = 0;
-		while (i < board->size)
-		{
-			free(board->grid[i]);
-			i++;
-		}
-		free(board->grid);
-	}
-	free(board->snake.x);
-	free(board->snake.y);
-	free(board->apples);
-	free(board);
+	memset(layout, 0, sizeof(t_board));
+	cells = size * size;
+	layout->size = size;
+	layout->engine = engine;
+	layout->max_snake_length = cells - 1;
+	layout->num_green_apples = 2 + (size - 10) / 3;
+	layout->num_red_apples = 1 + (size - 10) / 5;
+	layout->num_apples = layout->num_green_apples + layout->num_red_apples;
+	layout->arena_size = align8(sizeof(t_board)) + align8(cells)
+		+ align8(layout->max_snake_length * sizeof(unsigned short))
+		+ 2 * align8(cells * sizeof(short))
+		+ layout->num_apples * sizeof(t_apple);
 }
 
-static bool	allocate_grid(t_board *board)
+/*
+** Point grid, snake ring, empty-cell index and apples into the arena that
+** starts at the board itself (see t_board in board.h).
+*/
+void	board_bind_arena(t_board *board)
 {
-	int		row;
-	size_t	row_bytes;
+	unsigned char	*cursor;
+	int				cells;
 
-	board->grid = (t_board_cell **)malloc(board->size * sizeof(t_board_cell *));
-	if (board->grid == NULL)
-		return (false);
-	row = 0;
-	while (row < board->size)
-		board->grid[row++] = NULL;
-	row = 0;
-	row_bytes = board->size * sizeof(t_board_cell);
-	while (row < board->size)
-	{
-		board->grid[row] = (t_board_cell *)malloc(row_bytes);
-		if (board->grid[row] == NULL)
-			return (false);
-		row++;
-	}
-	return (true);
+	cells = board->size * board->size;
+	cursor = (unsigned char *)board + align8(sizeof(t_board));
+	board->grid = cursor;
+	cursor += align8(cells);
+	board->snake.body = (unsigned short *)cursor;
+	cursor += align8(board->max_snake_length * sizeof(unsigned short));
+	board->empty_cells = (short *)cursor;
+	cursor += align8(cells * sizeof(short));
+	board->empty_pos = (short *)cursor;
+	cursor += align8(cells * sizeof(short));
+	board->apples = (t_apple *)cursor;
 }
 
-static bool	allocate_snake_buffers(t_board *board)
+/*
+** Unknown engines fall back to ENGINE_GRID, like bad sizes fall back to 10.
+*/
+t_board	*board_create_engine(int size, int engine)
 {
-	board->snake.x = (int *)malloc(board->max_snake_length * sizeof(int));
-	if (board->snake.x == NULL)
-		return (false);
-	board->snake.y = (int *)malloc(board->max_snake_length * sizeof(int));
-	if (board->snake.y == NULL)
-		return (false);
-	return (true);
+	t_board	layout;
+	t_board	*board;
+
+	if (size < MIN_BOARD_SIZE || size > MAX_BOARD_SIZE)
+		size = 10;
+	if (engine != ENGINE_BITBOARD)
+		engine = ENGINE_GRID;
+	init_layout(&layout, size, engine);
+	board = (t_board *)malloc(layout.arena_size);
+	if (board == NULL)
+		return (NULL);
+	*board = layout;
+	board_bind_arena(board);
+	memset(board->grid, EMPTY, size * size);
+	init_apples(board);
+	board_seed_default(board);
+	board_reset(board);
+	return (board);
 }
 
-static bool	allocate_apples(t_board *board)
+void	board_destroy(t_board *board)
 {
-	board->apples = (t_apple *)malloc(board->num_apples * sizeof(t_apple));
-	if (board->apples == NULL)
-		return (false);
-	return (true);
+	if (board != NULL)
+		free(board->undo);
+	free(board);
 }
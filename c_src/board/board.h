@@ -6,7 +6,7 @@
 /*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
 /*                                                +#+#+#+#+#+   +#+           */
 /*   Created: 2026/01/07 18:28:16 by jhogonca          #+#    #+#             */
-/*   Updated: 2026/01/07 20:52:37 by jhogonca         ###   ########.fr       */
+/*   Updated: 2026/10/17 02:20:04 by jhogonca         ###   ########.fr       */
 /*                                                                            */
 /* ************************************************************************** */
 
@@ -30,6 +30,26 @@
 # define REWARD_DEATH -50.0f
 # define REWARD_STEP -0.1f
 
+# define MIN_BOARD_SIZE 8
+# define MAX_BOARD_SIZE 20
+
+# define MASK_BODY 0
+# define MASK_GREEN 1
+# define MASK_RED 2
+# define MASK_HEAD 3
+# define MASK_LAYERS 4
+# define OCCUPIED_WORDS 7
+
+# define ENGINE_GRID 0
+# define ENGINE_BITBOARD 1
+
+# define QTABLE_STATES 4096
+# define QTABLE_ACTIONS 4
+
+# define BATCH_RUNNING 0
+# define BATCH_TERMINAL 1
+# define BATCH_TRUNCATED 2
+
 typedef enum e_direction
 {
 	UP = 0,
@@ -63,18 +83,41 @@ typedef struct s_apple
 	int	y;
 }	t_apple;
 
+/*
+** Snake segments are packed cells (y * size + x) in a ring buffer.
+*/
 typedef struct s_snake
 {
-	int	*x;
-	int	*y;
-	int	head_idx;
-	int	length;
+	unsigned short	*body;
+	int				head_idx;
+	int				length;
 }	t_snake;
 
+/*
+** A board is one allocation of arena_size bytes: this struct followed by
+** the flat row-major grid (one byte per cell), the snake ring, the
+** empty-cell index and the apple slots. The pointers below point into it.
+**
+** rows[y][layer] has bit x set and cols[x][layer] has bit y set for every
+** body segment, the head, green apple and red apple, so the vision rays of
+** board_get_state are a few bit scans instead of cell walks.
+**
+** occupied is the same information as one flat bitset of packed cells
+** (y * size + x), at most 400 bits. With ENGINE_BITBOARD the masks are the
+** only cell storage: grid and the empty-cell index are left untouched,
+** cells are decoded from the masks and apples spawn on the n-th clear bit
+** of occupied.
+**
+** undo is a separate, lazily grown stack of undo_capacity records filled by
+** board_push_move; it is never copied along with the arena. journal points
+** at the record being filled while such a move runs.
+*/
 typedef struct s_board
 {
-	t_board_cell	**grid;
+	unsigned char	*grid;
 	t_snake			snake;
+	int				engine;
+	size_t			arena_size;
 	int				size;
 	int				max_snake_length;
 	int				num_apples;
@@ -87,12 +130,110 @@ typedef struct s_board
 	int				green_apples_count;
 	int				red_apples_count;
 	t_apple			*apples;
+	short			*empty_cells;
+	short			*empty_pos;
+	int				empty_count;
+	unsigned long long	rng_state;
+	unsigned int	rows[MAX_BOARD_SIZE][MASK_LAYERS];
+	unsigned int	cols[MAX_BOARD_SIZE][MASK_LAYERS];
+	unsigned long long	occupied[OCCUPIED_WORDS];
+	struct s_undo_record	*undo;
+	struct s_undo_record	*journal;
+	int				undo_depth;
+	int				undo_capacity;
 }	t_board;
 
+/*
+** One-call summary of a move, filled by board_step.
+*/
+typedef struct s_step_result
+{
+	int				result;
+	float			reward;
+	bool			done;
+	unsigned short	state;
+	int				length;
+	int				score;
+}	t_step_result;
+
+/*
+** Scalar snapshot of a board, filled by board_get_status.
+*/
+typedef struct s_board_status
+{
+	int				score;
+	int				length;
+	int				max_length;
+	int				moves;
+	int				size;
+	unsigned short	state;
+	bool			game_over;
+}	t_board_status;
+
+typedef struct s_board_batch
+{
+	t_board	**boards;
+	int		count;
+	int		size;
+	int		max_moves;
+}	t_board_batch;
+
+/*
+** Caller-owned output buffers for board_batch_step, one slot per board.
+** lengths/max_lengths describe the episode that just ended when a board
+** is auto-reset, so callers can still log it.
+*/
+typedef struct s_batch_out
+{
+	unsigned short	*states;
+	float			*rewards;
+	unsigned char	*dones;
+	int				*lengths;
+	int				*max_lengths;
+}	t_batch_out;
+
+/*
+** Tabular Q-learner run entirely in C by board_qlearn_run. q is a dense
+** QTABLE_STATES x QTABLE_ACTIONS table (row = 12-bit state) and visited
+** marks the states the Python agent would have added to its dict. Both are
+** owned by the caller; epsilon is decayed in place after every episode.
+*/
+typedef struct s_qlearn
+{
+	double				*q;
+	unsigned char		*visited;
+	double				alpha;
+	double				gamma;
+	double				epsilon;
+	double				min_epsilon;
+	double				epsilon_decay;
+	int					max_steps;
+	bool				learn;
+	unsigned long long	rng_state;
+}	t_qlearn;
+
+typedef struct s_episode_stats
+{
+	int		steps;
+	double	reward;
+	int		length;
+	int		max_length;
+	double	epsilon;
+}	t_episode_stats;
+
 t_board				*board_create(int size);
+t_board				*board_create_engine(int size, int engine);
 void				board_destroy(t_board *board);
+t_board				*board_clone(const t_board *board);
+int					board_copy_into(t_board *dst, const t_board *src);
 void				board_reset(t_board *board);
+void				board_seed(t_board *board, unsigned long long seed);
 int					board_move(t_board *board, t_direction action);
+int					board_step(t_board *board, t_direction action,
+						t_step_result *out);
+int					board_push_move(t_board *board, t_direction action);
+int					board_undo(t_board *board);
+int					board_get_undo_depth(const t_board *board);
 bool				board_is_game_over(const t_board *board);
 int					board_get_score(const t_board *board);
 int					board_get_length(const t_board *board);
@@ -101,10 +242,34 @@ int					board_get_moves(const t_board *board);
 unsigned short		board_get_state(const t_board *board);
 t_board_cell		board_get_cell(const t_board *board, int x, int y);
 int					board_get_size(const t_board *board);
+int					board_get_engine(const t_board *board);
+void				board_get_status(const t_board *board,
+						t_board_status *out);
+const unsigned char	*board_get_grid(t_board *board);
+const unsigned short	*board_get_body(const t_board *board);
+int					board_get_head_index(const t_board *board);
+int					board_get_head(const t_board *board);
 float				board_get_reward_green_apple(void);
 float				board_get_reward_red_apple(void);
 float				board_get_reward_death(void);
 float				board_get_reward_step(void);
+float				board_get_reward(int result);
+t_board_batch		*board_batch_create(int count, int size);
+t_board_batch		*board_batch_create_engine(int count, int size,
+						int engine);
+void				board_batch_destroy(t_board_batch *batch);
+int					board_batch_get_size(const t_board_batch *batch);
+void				board_batch_seed(t_board_batch *batch,
+						unsigned long long seed);
+void				board_batch_set_max_moves(t_board_batch *batch,
+						int max_moves);
+void				board_batch_reset(t_board_batch *batch,
+						unsigned short *states);
+int					board_batch_step(t_board_batch *batch,
+						const int *actions, t_batch_out *out);
 void				board_print(const t_board *board);
+void				board_qlearn_seed(t_qlearn *agent, unsigned long long seed);
+int					board_qlearn_run(t_board *board, t_qlearn *agent,
+						t_episode_stats *stats, int episodes);
 
 #endif
@@ -6,77 +6,64 @@
 /*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
 /*                                                +#+#+#+#+#+   +#+           */
 /*   Created: 2026/01/07 16:21:22 by jhogonca          #+#    #+#             */
-/*   Updated: 2026/01/07 18:26:57 by jhogonca         ###   ########.fr       */
+/*   Updated: 2026/10/17 02:01:32 by jhogonca         ###   ########.fr       */
 /*                                                                            */
 /* ************************************************************************** */
 
 #include "board_internal.h"
 
-static void	find_empty_cells(t_board *board, int (*positions)[2], int *count)
+/*
+** Green apples use slots [0, num_green_apples), red ones the rest; an
+** unused slot holds (-1, -1).
+*/
+static int	find_apple_slot(t_board *board, int x, int y, t_board_cell type)
 {
-	int	y;
-	int	x;
+	int	i;
+	int	end;
 
-	y = 0;
-	while (y < board->size)
+	i = 0;
+	end = board->num_green_apples;
+	if (type == RED_APPLE)
 	{
-		x = 0;
-		while (x < board->size)
-		{
-			if (board->grid[y][x] == EMPTY)
-			{
-				positions[*count][0] = x;
-				positions[*count][1] = y;
-				(*count)++;
-			}
-			x++;
-		}
-		y++;
+		i = board->num_green_apples;
+		end = board->num_apples;
+	}
+	while (i < end)
+	{
+		if (board->apples[i].x == x && board->apples[i].y == y)
+			return (i);
+		i++;
 	}
+	return (-1);
 }
 
 static void	place_apple_on_grid(t_board *board, int x, int y, t_board_cell type)
 {
 	int	idx;
 
-	board->grid[y][x] = type;
-	if (type == GREEN_APPLE
-		&& board->green_apples_count < board->num_green_apples)
-	{
-		idx = board->green_apples_count;
-		board->apples[idx].x = x;
-		board->apples[idx].y = y;
+	idx = find_apple_slot(board, -1, -1, type);
+	if (idx < 0)
+		return ;
+	set_cell(board, y * board->size + x, type);
+	board->apples[idx].x = x;
+	board->apples[idx].y = y;
+	if (type == GREEN_APPLE)
 		board->green_apples_count++;
-	}
-	else if (type == RED_APPLE
-		&& board->red_apples_count < board->num_red_apples)
-	{
-		idx = board->num_green_apples;
-		board->apples[idx].x = x;
-		board->apples[idx].y = y;
+	else
 		board->red_apples_count++;
-	}
 }
 
 void	spawn_apple(t_board *board, t_board_cell type)
 {
-	int		empty_count;
-	int		total_cells;
-	int		(*positions)[2];
-	int		idx;
+	int	cell;
 
-	empty_count = 0;
-	total_cells = board->size * board->size;
-	positions = malloc(total_cells * sizeof(*positions));
-	if (positions == NULL)
+	if (board->empty_count <= 0)
 		return ;
-	find_empty_cells(board, positions, &empty_count);
-	if (empty_count > 0)
-	{
-		idx = rand() % empty_count;
-		place_apple_on_grid(board, positions[idx][0], positions[idx][1], type);
-	}
-	free(positions);
+	if (board->engine == ENGINE_BITBOARD)
+		cell = bitboard_pick_empty(board);
+	else
+		cell = board->empty_cells[board_rand(board, board->empty_count)];
+	place_apple_on_grid(board, cell % board->size, cell / board->size, type);
 }
 
 void	init_apples(t_board *board)
@@ -96,28 +83,16 @@ void	init_apples(t_board *board)
 
 void	remove_apple(t_board *board, int x, int y, t_board_cell type)
 {
-	int	i;
+	int	idx;
 
-	board->grid[y][x] = EMPTY;
+	set_cell(board, y * board->size + x, EMPTY);
+	idx = find_apple_slot(board, x, y, type);
+	if (idx < 0)
+		return ;
+	board->apples[idx].x = -1;
+	board->apples[idx].y = -1;
 	if (type == GREEN_APPLE)
-	{
 		board->green_apples_count--;
-		i = 0;
-		while (i < board->num_green_apples)
-		{
-			if (board->apples[i].x == x && board->apples[i].y == y)
-			{
-				board->apples[i].x = -1;
-				board->apples[i].y = -1;
-				break ;
-			}
-			i++;
-		}
-	}
-	else if (type == RED_APPLE)
-	{
+	else
 		board->red_apples_count--;
-		board->apples[board->num_green_apples].x = -1;
-		board->apples[board->num_green_apples].y = -1;
-	}
 }
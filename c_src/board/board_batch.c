@@ -0,0 +1,79 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   board_batch.c                                      :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 01:51:22 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:01:32 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "board_internal.h"
+
+t_board_batch	*board_batch_create(int count, int size)
+{
+	return (board_batch_create_engine(count, size, ENGINE_GRID));
+}
+
+t_board_batch	*board_batch_create_engine(int count, int size, int engine)
+{
+	t_board_batch	*batch;
+	int				i;
+
+	if (count <= 0)
+		return (NULL);
+	batch = (t_board_batch *)malloc(sizeof(t_board_batch));
+	if (batch == NULL)
+		return (NULL);
+	batch->count = count;
+	batch->max_moves = 0;
+	batch->boards = (t_board **)calloc(count, sizeof(t_board *));
+	i = 0;
+	while (batch->boards != NULL && i < count)
+	{
+		batch->boards[i] = board_create_engine(size, engine);
+		if (batch->boards[i++] == NULL)
+			break ;
+	}
+	if (batch->boards == NULL || batch->boards[count - 1] == NULL)
+	{
+		board_batch_destroy(batch);
+		return (NULL);
+	}
+	batch->size = batch->boards[0]->size;
+	return (batch);
+}
+
+void	board_batch_destroy(t_board_batch *batch)
+{
+	int	i;
+
+	if (batch == NULL)
+		return ;
+	if (batch->boards != NULL)
+	{
+		i = 0;
+		while (i < batch->count)
+			board_destroy(batch->boards[i++]);
+		free(batch->boards);
+	}
+	free(batch);
+}
+
+void	board_batch_set_max_moves(t_board_batch *batch, int max_moves)
+{
+	if (batch == NULL)
+		return ;
+	if (max_moves < 0)
+		max_moves = 0;
+	batch->max_moves = max_moves;
+}
+
+int	board_batch_get_size(const t_board_batch *batch)
+{
+	if (batch == NULL)
+		return (-1);
+	return (batch->size);
+}
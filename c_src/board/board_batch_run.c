@@ -0,0 +1,95 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   board_batch_run.c                                  :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:01:32 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:01:32 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "board_internal.h"
+
+/*
+** Board i draws from seed + i; splitmix64 in board_seed decorrelates the
+** neighbouring seeds.
+*/
+void	board_batch_seed(t_board_batch *batch, unsigned long long seed)
+{
+	int	i;
+
+	if (batch == NULL)
+		return ;
+	i = 0;
+	while (i < batch->count)
+	{
+		board_seed(batch->boards[i], seed + (unsigned long long)i);
+		i++;
+	}
+}
+
+void	board_batch_reset(t_board_batch *batch, unsigned short *states)
+{
+	int	i;
+
+	if (batch == NULL)
+		return ;
+	i = 0;
+	while (i < batch->count)
+	{
+		board_reset(batch->boards[i]);
+		if (states != NULL)
+			states[i] = board_get_state(batch->boards[i]);
+		i++;
+	}
+}
+
+static int	batch_step_one(t_board_batch *batch, int i, int action,
+		t_batch_out *out)
+{
+	t_board			*board;
+	t_step_result	step;
+
+	board = batch->boards[i];
+	board_step(board, action, &step);
+	out->rewards[i] = step.reward;
+	out->dones[i] = BATCH_RUNNING;
+	if (step.done)
+		out->dones[i] = BATCH_TERMINAL;
+	else if (batch->max_moves > 0 && board->moves >= batch->max_moves)
+		out->dones[i] = BATCH_TRUNCATED;
+	out->lengths[i] = step.length;
+	out->max_lengths[i] = board->max_length;
+	out->states[i] = step.state;
+	if (out->dones[i] == BATCH_RUNNING)
+		return (0);
+	board_reset(board);
+	out->states[i] = board_get_state(board);
+	return (1);
+}
+
+/*
+** Step every board once. Boards that die or reach max_moves are reset in
+** place and report the first state of their next episode, so the caller
+** never has to touch individual boards. Returns the number of episodes
+** that ended during this call.
+*/
+int	board_batch_step(t_board_batch *batch, const int *actions,
+		t_batch_out *out)
+{
+	int	finished;
+	int	i;
+
+	if (batch == NULL || actions == NULL || out == NULL)
+		return (-1);
+	finished = 0;
+	i = 0;
+	while (i < batch->count)
+	{
+		finished += batch_step_one(batch, i, actions[i], out);
+		i++;
+	}
+	return (finished);
+}
@@ -0,0 +1,76 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   board_bitboard.c                                   :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:01:27 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:06:55 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "board_internal.h"
+
+/*
+** Empty-cell selection for ENGINE_BITBOARD: the free cells are the clear
+** bits of board->occupied below size * size.
+*/
+static unsigned long long	free_word(const t_board *board, int w)
+{
+	int	cells;
+
+	cells = board->size * board->size - w * 64;
+	if (cells >= 64)
+		return (~board->occupied[w]);
+	return (~board->occupied[w] & ((1ull << cells) - 1ull));
+}
+
+/*
+** Index of the n-th set bit of word (n < popcount(word)): skip whole
+** bytes by popcount, then clear the low bits of the last byte.
+*/
+static int	select_bit(unsigned long long word, int n)
+{
+	int	base;
+	int	count;
+
+	base = 0;
+	count = __builtin_popcount((unsigned int)(word & 0xFF));
+	while (n >= count)
+	{
+		n -= count;
+		word >>= 8;
+		base += 8;
+		count = __builtin_popcount((unsigned int)(word & 0xFF));
+	}
+	while (n-- > 0)
+		word &= word - 1ull;
+	return (base + __builtin_ctzll(word));
+}
+
+/*
+** Draw a uniform free cell with a single board_rand call, like the grid
+** engine does. Returns the packed cell, or -1 when the board is full.
+*/
+int	bitboard_pick_empty(t_board *board)
+{
+	unsigned long long	word;
+	int					pick;
+	int					w;
+	int					count;
+
+	if (board->empty_count <= 0)
+		return (-1);
+	pick = board_rand(board, board->empty_count);
+	w = 0;
+	word = free_word(board, w);
+	count = __builtin_popcountll(word);
+	while (pick >= count)
+	{
+		pick -= count;
+		word = free_word(board, ++w);
+		count = __builtin_popcountll(word);
+	}
+	return (w * 64 + select_bit(word, pick));
+}
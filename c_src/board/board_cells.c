@@ -0,0 +1,99 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   board_cells.c                                      :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 01:55:18 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:17:04 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "board_internal.h"
+
+/*
+** The board keeps every EMPTY cell (as y * size + x) in empty_cells, with
+** empty_pos mapping a cell back to its slot (-1 when occupied). All grid
+** writes go through set_cell so spawning an apple is a single random pick.
+** set_cell also keeps the row/column occupancy masks in step with the grid.
+*/
+
+static void	empty_remove(t_board *board, int cell)
+{
+	int	slot;
+	int	last;
+
+	slot = board->empty_pos[cell];
+	if (slot < 0)
+		return ;
+	last = board->empty_cells[--board->empty_count];
+	board->empty_cells[slot] = last;
+	board->empty_pos[last] = slot;
+	board->empty_pos[cell] = -1;
+}
+
+static void	empty_insert(t_board *board, int cell)
+{
+	if (board->empty_pos[cell] >= 0)
+		return ;
+	board->empty_cells[board->empty_count] = cell;
+	board->empty_pos[cell] = board->empty_count;
+	board->empty_count++;
+}
+
+static int	mask_layer(t_board_cell type)
+{
+	if (type == SNAKE_BODY)
+		return (MASK_BODY);
+	if (type == GREEN_APPLE)
+		return (MASK_GREEN);
+	if (type == RED_APPLE)
+		return (MASK_RED);
+	if (type == SNAKE_HEAD)
+		return (MASK_HEAD);
+	return (-1);
+}
+
+void	toggle_mask(t_board *board, int cell, t_board_cell type)
+{
+	int	layer;
+	int	x;
+	int	y;
+
+	layer = mask_layer(type);
+	if (layer < 0)
+		return ;
+	x = cell % board->size;
+	y = cell / board->size;
+	board->rows[y][layer] ^= 1u << x;
+	board->cols[x][layer] ^= 1u << y;
+}
+
+/*
+** The bitboard engine only needs the free-cell count: it picks spawn cells
+** straight from the masks. During board_push_move every write is also
+** logged so board_undo can replay it backwards.
+*/
+void	set_cell(t_board *board, int cell, t_board_cell type)
+{
+	t_board_cell	old;
+
+	old = board_cell_at(board, cell);
+	if (old == type)
+		return ;
+	if (board->journal != NULL)
+		undo_log_cell(board, cell, old);
+	toggle_mask(board, cell, old);
+	toggle_mask(board, cell, type);
+	if ((old == EMPTY) != (type == EMPTY))
+		board->occupied[cell >> 6] ^= 1ull << (cell & 63);
+	if (board->engine == ENGINE_BITBOARD)
+		board->empty_count += (type == EMPTY) - (old == EMPTY);
+	else if (type == EMPTY)
+		empty_insert(board, cell);
+	else
+		empty_remove(board, cell);
+	if (board->engine == ENGINE_GRID)
+		board->grid[cell] = (unsigned char)type;
+}
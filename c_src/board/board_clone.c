@@ -0,0 +1,65 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   board_clone.c                                      :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:12:44 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:17:04 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "board_internal.h"
+
+/*
+** A board is a single arena (see t_board), so a copy is one memcpy plus
+** re-pointing grid, snake, index and apples into the destination. The RNG
+** state is part of the struct: a copy spawns the same apples as its source.
+** The undo stack lives outside the arena and stays with its board: a copy
+** starts with an empty history.
+*/
+
+t_board	*board_clone(const t_board *board)
+{
+	t_board	*copy;
+
+	if (board == NULL)
+		return (NULL);
+	copy = (t_board *)malloc(board->arena_size);
+	if (copy == NULL)
+		return (NULL);
+	memcpy(copy, board, board->arena_size);
+	board_bind_arena(copy);
+	copy->undo = NULL;
+	copy->journal = NULL;
+	copy->undo_depth = 0;
+	copy->undo_capacity = 0;
+	return (copy);
+}
+
+/*
+** Overwrite dst with src without allocating. Both boards must have the same
+** size and engine (hence the same arena layout). Returns 0, or -1 when they
+** are incompatible.
+*/
+int	board_copy_into(t_board *dst, const t_board *src)
+{
+	t_undo_record	*undo;
+	int				capacity;
+
+	if (dst == NULL || src == NULL || dst->size != src->size
+		|| dst->engine != src->engine || dst->arena_size != src->arena_size)
+		return (-1);
+	if (dst == src)
+		return (0);
+	undo = dst->undo;
+	capacity = dst->undo_capacity;
+	memcpy(dst, src, src->arena_size);
+	board_bind_arena(dst);
+	dst->undo = undo;
+	dst->journal = NULL;
+	dst->undo_depth = 0;
+	dst->undo_capacity = capacity;
+	return (0);
+}
@@ -0,0 +1,55 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   board_engine.c                                     :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:01:26 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:06:55 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "board_internal.h"
+
+t_board	*board_create(int size)
+{
+	return (board_create_engine(size, ENGINE_GRID));
+}
+
+int	board_get_engine(const t_board *board)
+{
+	if (!board)
+		return (-1);
+	return (board->engine);
+}
+
+static t_board_cell	mask_cell(const t_board *board, int cell)
+{
+	const unsigned int	*row;
+	unsigned int		bit;
+
+	if (!((board->occupied[cell >> 6] >> (cell & 63)) & 1ull))
+		return (EMPTY);
+	row = board->rows[cell / board->size];
+	bit = 1u << (cell % board->size);
+	if (row[MASK_BODY] & bit)
+		return (SNAKE_BODY);
+	if (row[MASK_HEAD] & bit)
+		return (SNAKE_HEAD);
+	if (row[MASK_GREEN] & bit)
+		return (GREEN_APPLE);
+	if (row[MASK_RED] & bit)
+		return (RED_APPLE);
+	return (EMPTY);
+}
+
+/*
+** Content of an in-bounds packed cell (y * size + x) for either engine.
+*/
+t_board_cell	board_cell_at(const t_board *board, int cell)
+{
+	if (board->engine == ENGINE_BITBOARD)
+		return (mask_cell(board, cell));
+	return ((t_board_cell)board->grid[cell]);
+}
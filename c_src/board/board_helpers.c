@@ -6,7 +6,7 @@
 /*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
 /*                                                +#+#+#+#+#+   +#+           */
 /*   Created: 2026/01/07 20:14:31 by jhogonca          #+#    #+#             */
-/*   Updated: 2026/01/07 20:58:57 by jhogonca         ###   ########.fr       */
+/*   Updated: 2026/10/17 02:01:32 by jhogonca         ###   ########.fr       */
 /*                                                                            */
 /* ************************************************************************** */
 
@@ -20,37 +20,39 @@ bool	board_is_game_over(const t_board *board)
 	return (board->game_over);
 }
 
-void	board_init_grid(t_board *board)
+/*
+** Rebuild the empty-cell index in cell order so a seeded reset does not
+** depend on the previous episode's history. The bitboard engine keeps only
+** the count.
+*/
+void	board_init_empty_index(t_board *board)
 {
 	int	i;
-	int	j;
 
+	board->empty_count = board->size * board->size;
+	if (board->engine == ENGINE_BITBOARD)
+		return ;
 	i = 0;
-	while (i < board->size)
+	while (i < board->size * board->size)
 	{
-		j = 0;
-		while (j < board->size)
-			board->grid[i][j++] = EMPTY;
+		board->empty_cells[i] = i;
+		board->empty_pos[i] = i;
 		i++;
 	}
 }
 
 void	board_init_snake(t_board *board)
 {
-	int	i;
-	int	j;
+	int	cell;
 
-	i = 1 + rand() % (board->size - 4);
-	j = 1 + rand() % (board->size - 4);
-	board->snake.x[0] = i;
-	board->snake.y[0] = j;
-	board->snake.x[1] = i;
-	board->snake.y[1] = j + 1;
-	board->snake.x[2] = i;
-	board->snake.y[2] = j + 2;
-	board->grid[j][i] = SNAKE_BODY;
-	board->grid[j + 1][i] = SNAKE_BODY;
-	board->grid[j + 2][i] = SNAKE_HEAD;
+	cell = 1 + board_rand(board, board->size - 4);
+	cell += (1 + board_rand(board, board->size - 4)) * board->size;
+	board->snake.body[0] = cell;
+	board->snake.body[1] = cell + board->size;
+	board->snake.body[2] = cell + 2 * board->size;
+	set_cell(board, cell, SNAKE_BODY);
+	set_cell(board, cell + board->size, SNAKE_BODY);
+	set_cell(board, cell + 2 * board->size, SNAKE_HEAD);
 	board->snake.length = 3;
 	board->snake.head_idx = 2;
 	board->max_length = 3;
@@ -63,5 +65,5 @@ t_board_cell	check_cell(const t_board *board, int x, int y)
 {
 	if (x < 0 || x >= board->size || y < 0 || y >= board->size)
 		return (WALL);
-	return (board->grid[y][x]);
+	return (board_cell_at(board, y * board->size + x));
 }
@@ -6,7 +6,7 @@
 /*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
 /*                                                +#+#+#+#+#+   +#+           */
 /*   Created: 2026/01/07 18:28:27 by jhogonca          #+#    #+#             */
-/*   Updated: 2026/01/07 20:45:27 by jhogonca         ###   ########.fr       */
+/*   Updated: 2026/10/17 02:17:04 by jhogonca         ###   ########.fr       */
 /*                                                                            */
 /* ************************************************************************** */
 
@@ -15,13 +15,66 @@
 
 # include "board.h"
 
+# define UNDO_MAX_WRITES 8
+# define UNDO_MAX_APPLES 8
+# define UNDO_MIN_CAPACITY 64
+
+/*
+** One set_cell write: the cell, its type before the write and, with
+** ENGINE_GRID, the empty-index slot it left (-1 if it was not EMPTY).
+*/
+typedef struct s_cell_write
+{
+	short			cell;
+	short			slot;
+	unsigned char	old;
+}	t_cell_write;
+
+/*
+** Everything board_push_move needs to take one move back: the cell writes
+** in order, the apple slots, the snake ring slot the move may overwrite and
+** the scalars before the move. A move writes at most six cells (red apple:
+** tail, apple, old head, new head, new tail, respawn).
+*/
+typedef struct s_undo_record
+{
+	t_cell_write		writes[UNDO_MAX_WRITES];
+	t_apple				apples[UNDO_MAX_APPLES];
+	unsigned long long	rng_state;
+	int					num_writes;
+	int					ring_idx;
+	unsigned short		ring_cell;
+	bool				game_over;
+	int					head_idx;
+	int					length;
+	int					score;
+	int					moves;
+	int					max_length;
+	int					green_apples_count;
+	int					red_apples_count;
+	int					empty_count;
+}	t_undo_record;
+
 void			spawn_apple(t_board *board, t_board_cell type);
 void			init_apples(t_board *board);
 void			remove_apple(t_board *board, int x, int y, t_board_cell type);
 int				board_get_size(const t_board *board);
 t_board_cell	check_cell(const t_board *board, int x, int y);
-void			move_snake(t_board *board, int new_x, int new_y, bool grow);
-void			board_init_grid(t_board *board);
+t_board_cell	board_cell_at(const t_board *board, int cell);
+int				bitboard_pick_empty(t_board *board);
+void			set_cell(t_board *board, int cell, t_board_cell type);
+void			toggle_mask(t_board *board, int cell, t_board_cell type);
+void			undo_log_cell(t_board *board, int cell, t_board_cell old);
+void			move_snake(t_board *board, int cell, bool grow);
+void			board_bind_arena(t_board *board);
+void			board_init_empty_index(t_board *board);
 void			board_init_snake(t_board *board);
+int				board_rand(t_board *board, int bound);
+int				rng_bounded(unsigned long long *state, int bound);
+unsigned long long	rng_seed_state(unsigned long long seed);
+void			board_seed_default(t_board *board);
+int				qlearn_select_action(t_qlearn *agent, int state);
+void			qlearn_update(t_qlearn *agent, int state, int action,
+				const t_step_result *step);
 
 #endif
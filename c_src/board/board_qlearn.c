@@ -0,0 +1,92 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   board_qlearn.c                                     :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:10:24 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 03:17:38 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "board_internal.h"
+
+/*
+** Same decisions as slither.agent.QLearningAgent: epsilon-greedy with a
+** uniform pick among tied best actions, and the one-step Q update.
+*/
+
+void	board_qlearn_seed(t_qlearn *agent, unsigned long long seed)
+{
+	if (agent == NULL)
+		return ;
+	agent->rng_state = rng_seed_state(seed);
+}
+
+static int	greedy_action(t_qlearn *agent, const double *row)
+{
+	int	best;
+	int	ties;
+	int	action;
+
+	best = 0;
+	ties = 1;
+	action = 0;
+	while (++action < QTABLE_ACTIONS)
+	{
+		if (row[action] > row[best])
+			ties = 0;
+		if (row[action] > row[best])
+			best = action;
+		ties += (row[action] == row[best]);
+	}
+	if (ties == 1)
+		return (best);
+	ties = rng_bounded(&agent->rng_state, ties);
+	action = best;
+	while (ties > 0)
+		ties -= (row[++action] == row[best]);
+	return (action);
+}
+
+/*
+** Rows are only marked visited while learning, as the Python agent only
+** creates them then: a frozen run leaves the table as it found it.
+*/
+int	qlearn_select_action(t_qlearn *agent, int state)
+{
+	if (agent->learn)
+		agent->visited[state] = 1;
+	if (agent->learn && rng_bounded(&agent->rng_state, 1 << 30)
+		< agent->epsilon * (1 << 30))
+		return (rng_bounded(&agent->rng_state, QTABLE_ACTIONS));
+	return (greedy_action(agent, agent->q + state * QTABLE_ACTIONS));
+}
+
+void	qlearn_update(t_qlearn *agent, int state, int action,
+			const t_step_result *step)
+{
+	double	target;
+	double	best;
+	double	*next;
+	double	*current;
+	int		i;
+
+	if (!agent->learn)
+		return ;
+	target = step->reward;
+	if (!step->done)
+	{
+		agent->visited[step->state] = 1;
+		next = agent->q + step->state * QTABLE_ACTIONS;
+		best = next[0];
+		i = 0;
+		while (++i < QTABLE_ACTIONS)
+			if (next[i] > best)
+				best = next[i];
+		target += agent->gamma * best;
+	}
+	current = agent->q + state * QTABLE_ACTIONS + action;
+	*current += agent->alpha * (target - *current);
+}
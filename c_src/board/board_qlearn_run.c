@@ -0,0 +1,73 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   board_qlearn_run.c                                 :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:10:38 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:10:38 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "board_internal.h"
+
+/*
+** One episode of train.py's run_episode loop: reset, then act/step/update
+** until the board is done or max_steps moves were played.
+*/
+static void	run_episode(t_board *board, t_qlearn *agent,
+				t_episode_stats *out)
+{
+	t_step_result	step;
+	int				state;
+	int				action;
+
+	board_reset(board);
+	state = board_get_state(board);
+	out->steps = 0;
+	out->reward = 0.0;
+	while (out->steps < agent->max_steps)
+	{
+		action = qlearn_select_action(agent, state);
+		board_step(board, action, &step);
+		if (agent->learn)
+			qlearn_update(agent, state, action, &step);
+		out->reward += step.reward;
+		state = step.state;
+		out->steps++;
+		if (step.done)
+			break ;
+	}
+	out->length = board->snake.length;
+	out->max_length = board->max_length;
+}
+
+/*
+** Play episodes back to back, decaying epsilon after each one while
+** learning. stats receives one entry per episode, with the epsilon in
+** effect after its decay. Returns the number of episodes played.
+*/
+int	board_qlearn_run(t_board *board, t_qlearn *agent,
+		t_episode_stats *stats, int episodes)
+{
+	int	i;
+
+	if (board == NULL || agent == NULL || agent->q == NULL
+		|| agent->visited == NULL || stats == NULL)
+		return (-1);
+	i = 0;
+	while (i < episodes)
+	{
+		run_episode(board, agent, &stats[i]);
+		if (agent->learn)
+		{
+			agent->epsilon *= agent->epsilon_decay;
+			if (agent->epsilon < agent->min_epsilon)
+				agent->epsilon = agent->min_epsilon;
+		}
+		stats[i].epsilon = agent->epsilon;
+		i++;
+	}
+	return (episodes);
+}
@@ -6,11 +6,11 @@
 /*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
 /*                                                +#+#+#+#+#+   +#+           */
 /*   Created: 2026/01/07 00:00:00 by jhogonca          #+#    #+#             */
-/*   Updated: 2026/01/07 19:48:02 by jhogonca         ###   ########.fr       */
+/*   Updated: 2026/10/17 02:01:32 by jhogonca         ###   ########.fr       */
 /*                                                                            */
 /* ************************************************************************** */
 
-#include "board.h"
+#include "board_internal.h"
 
 int	board_get_score(const t_board *board)
 {
@@ -46,5 +46,5 @@ t_board_cell	board_get_cell(const t_board *board, int x, int y)
 		return (EMPTY);
 	if (x < 0 || x >= board->size || y < 0 || y >= board->size)
 		return (WALL);
-	return (board->grid[y][x]);
+	return (board_cell_at(board, y * board->size + x));
 }
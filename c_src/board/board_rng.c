@@ -0,0 +1,75 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   board_rng.c                                        :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 01:54:04 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 03:02:08 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "board_internal.h"
+
+/*
+** Every board owns a xorshift64* generator, so runs are reproducible from a
+** seed and boards never contend on the process-global rand() state.
+*/
+
+/*
+** splitmix64 of the seed, never zero (xorshift would stay stuck at 0).
+*/
+unsigned long long	rng_seed_state(unsigned long long seed)
+{
+	seed += 0x9E3779B97F4A7C15ULL;
+	seed = (seed ^ (seed >> 30)) * 0xBF58476D1CE4E5B9ULL;
+	seed = (seed ^ (seed >> 27)) * 0x94D049BB133111EBULL;
+	seed ^= seed >> 31;
+	if (seed == 0)
+		seed = 0x9E3779B97F4A7C15ULL;
+	return (seed);
+}
+
+void	board_seed(t_board *board, unsigned long long seed)
+{
+	if (board == NULL)
+		return ;
+	board->rng_state = rng_seed_state(seed);
+}
+
+/*
+** Boards may be created from several threads at once (ctypes releases the
+** GIL), so the counter is bumped atomically: every call gets its own value.
+*/
+void	board_seed_default(t_board *board)
+{
+	static unsigned long long	counter;
+	unsigned long long			ticket;
+
+	ticket = __atomic_add_fetch(&counter, 1, __ATOMIC_RELAXED);
+	board_seed(board, (unsigned long long)time(NULL)
+		^ ((unsigned long long)(size_t)board << 16)
+		^ rng_seed_state(ticket));
+}
+
+/*
+** Uniform integer in [0, bound) using the multiply-shift range reduction.
+*/
+int	rng_bounded(unsigned long long *state, int bound)
+{
+	unsigned long long	x;
+
+	x = *state;
+	x ^= x >> 12;
+	x ^= x << 25;
+	x ^= x >> 27;
+	*state = x;
+	x = (x * 0x2545F4914F6CDD1DULL) >> 32;
+	return ((int)((x * (unsigned long long)bound) >> 32));
+}
+
+int	board_rand(t_board *board, int bound)
+{
+	return (rng_bounded(&board->rng_state, bound));
+}
@@ -6,21 +6,40 @@
 /*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
 /*                                                +#+#+#+#+#+   +#+           */
 /*   Created: 2026/01/07 21:15:00 by jhogonca          #+#    #+#             */
-/*   Updated: 2026/01/07 21:10:58 by jhogonca         ###   ########.fr       */
+/*   Updated: 2026/10/17 02:17:04 by jhogonca         ###   ########.fr       */
 /*                                                                            */
 /* ************************************************************************** */
 
 #include "board_internal.h"
 
-static void	init_rng(void)
+/*
+** Only the snake and the apples ever leave EMPTY behind, so clearing them
+** is enough to blank the grid without touching every cell. The occupancy
+** masks are small enough to just zero.
+*/
+static void	clear_touched_cells(t_board *board)
 {
-	static int	seeded;
+	int	idx;
+	int	i;
 
-	if (!seeded)
+	idx = board->snake.head_idx;
+	i = 0;
+	while (i++ < board->snake.length)
 	{
-		srand((unsigned int)time(NULL));
-		seeded = 1;
+		board->grid[board->snake.body[idx]] = EMPTY;
+		idx = (idx - 1 + board->max_snake_length) % board->max_snake_length;
 	}
+	i = 0;
+	while (i < board->num_apples)
+	{
+		if (board->apples[i].x >= 0)
+			board->grid[board->apples[i].y * board->size
+				+ board->apples[i].x] = EMPTY;
+		i++;
+	}
+	memset(board->rows, 0, sizeof(board->rows));
+	memset(board->cols, 0, sizeof(board->cols));
+	memset(board->occupied, 0, sizeof(board->occupied));
 }
 
 static void	spawn_initial_apples(t_board *board,
@@ -40,8 +59,9 @@ void	board_reset(t_board *board)
 {
 	if (board == NULL)
 		return ;
-	init_rng();
-	board_init_grid(board);
+	board->undo_depth = 0;
+	clear_touched_cells(board);
+	board_init_empty_index(board);
 	init_apples(board);
 	board_init_snake(board);
 	spawn_initial_apples(board, board->num_green_apples, GREEN_APPLE);
@@ -6,18 +6,12 @@
 /*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
 /*                                                +#+#+#+#+#+   +#+           */
 /*   Created: 2026/01/07 00:00:00 by jhogonca          #+#    #+#             */
-/*   Updated: 2026/01/11 20:05:45 by jhogonca         ###   ########.fr       */
+/*   Updated: 2026/10/17 01:59:05 by jhogonca         ###   ########.fr       */
 /*                                                                            */
 /* ************************************************************************** */
 
 #include "board_internal.h"
 
-#define VISION_BUFFER_SIZE 32
-
-static char	cell_to_symbol(t_board_cell cell);
-static void	build_line(char *buffer, int buf_size, const t_board *board, int x,
-				int y, int step_x, int step_y, bool reverse);
-
 int	board_get_size(const t_board *board)
 {
 	if (!board)
@@ -26,7 +20,26 @@ int	board_get_size(const t_board *board)
 }
 
 /*
-** Scan a direction and return encoded value (3 bits):
+** Distance from pos to the closest set bit of mask, looking towards higher
+** bits (step > 0) or lower bits (step < 0); -1 when there is none.
+*/
+static int	nearest_bit(unsigned int mask, int pos, int step)
+{
+	if (step > 0)
+	{
+		mask >>= pos + 1;
+		if (mask == 0)
+			return (-1);
+		return (__builtin_ctz(mask) + 1);
+	}
+	mask &= (1u << pos) - 1u;
+	if (mask == 0)
+		return (-1);
+	return (pos - (31 - __builtin_clz(mask)));
+}
+
+/*
+** Encode one vision ray (3 bits):
 ** 0 = empty path to wall
 ** 1 = danger (wall/body) adjacent
 ** 2 = danger nearby (2-3 cells)
@@ -34,151 +47,55 @@ int	board_get_size(const t_board *board)
 ** 4 = red apple visible
 ** 5 = body visible (not adjacent)
 */
-static unsigned short	scan_direction(const t_board *board,
-									int x, int y, int dx, int dy)
+static unsigned short	encode_ray(int danger, int green, int red)
 {
-	t_board_cell	cell;
-	int				dist;
-	int				first_danger;
-	int				first_green;
-	int				first_red;
-
-	dist = 0;
-	first_danger = -1;
-	first_green = -1;
-	first_red = -1;
-	while (1)
-	{
-		x += dx;
-		y += dy;
-		dist++;
-		cell = check_cell(board, x, y);
-		if (cell == WALL)
-		{
-			if (first_danger < 0)
-				first_danger = dist;
-			break ;
-		}
-		if (cell == SNAKE_BODY && first_danger < 0)
-			first_danger = dist;
-		if (cell == GREEN_APPLE && first_green < 0)
-			first_green = dist;
-		if (cell == RED_APPLE && first_red < 0)
-			first_red = dist;
-	}
-	if (first_danger == 1)
+	if (danger == 1)
 		return (1);
-	if (first_green > 0 && (first_danger < 0 || first_green < first_danger))
+	if (green > 0 && (danger < 0 || green < danger))
 		return (3);
-	if (first_red > 0 && (first_danger < 0 || first_red < first_danger))
+	if (red > 0 && (danger < 0 || red < danger))
 		return (4);
-	if (first_danger > 0 && first_danger <= 3)
+	if (danger > 0 && danger <= 3)
 		return (2);
-	if (first_danger > 0)
+	if (danger > 0)
 		return (5);
 	return (0);
 }
 
+/*
+** masks are the MASK_LAYERS occupancy words of the row or column the head
+** sits on, pos the head position along it. The wall is the danger when no
+** body segment lies between the head and the edge.
+*/
+static unsigned short	scan_line(const unsigned int *masks, int pos,
+							int step, int size)
+{
+	int	danger;
+
+	danger = nearest_bit(masks[MASK_BODY], pos, step);
+	if (danger < 0 && step > 0)
+		danger = size - pos;
+	else if (danger < 0)
+		danger = pos + 1;
+	return (encode_ray(danger, nearest_bit(masks[MASK_GREEN], pos, step),
+			nearest_bit(masks[MASK_RED], pos, step)));
+}
+
 unsigned short	board_get_state(const t_board *board)
 {
-	int				head_idx;
-	int				head_x;
-	int				head_y;
+	int				head;
+	int				x;
+	int				y;
 	unsigned short	state;
 
 	if (!board)
 		return (0);
-	head_idx = board->snake.head_idx;
-	head_x = board->snake.x[head_idx];
-	head_y = board->snake.y[head_idx];
-	state = 0;
-	state |= (scan_direction(board, head_x, head_y, 0, -1) << 9);
-	state |= (scan_direction(board, head_x, head_y, -1, 0) << 6);
-	state |= (scan_direction(board, head_x, head_y, 0, 1) << 3);
-	state |= (scan_direction(board, head_x, head_y, 1, 0) << 0);
+	head = board->snake.body[board->snake.head_idx];
+	x = head % board->size;
+	y = head / board->size;
+	state = scan_line(board->cols[x], y, -1, board->size) << 9;
+	state |= scan_line(board->rows[y], x, -1, board->size) << 6;
+	state |= scan_line(board->cols[x], y, 1, board->size) << 3;
+	state |= scan_line(board->rows[y], x, 1, board->size);
 	return (state);
 }
-
-void	board_print(const t_board *board)
-{
-	char	up[VISION_BUFFER_SIZE];
-	char	down[VISION_BUFFER_SIZE];
-	char	left[VISION_BUFFER_SIZE];
-	char	right[VISION_BUFFER_SIZE];
-	int		head_idx;
-	int		head_x;
-	int		head_y;
-	int		indent;
-	int		i;
-
-	if (board == NULL)
-		return ;
-	head_idx = board->snake.head_idx;
-	head_x = board->snake.x[head_idx];
-	head_y = board->snake.y[head_idx];
-	build_line(up, VISION_BUFFER_SIZE, board, head_x, head_y - 1, 0, -1, true);
-	build_line(down, VISION_BUFFER_SIZE,
-		board, head_x, head_y + 1, 0, 1, false);
-	build_line(left, VISION_BUFFER_SIZE,
-		board, head_x - 1, head_y, -1, 0, true);
-	build_line(right, VISION_BUFFER_SIZE, board,
-		head_x + 1, head_y, 1, 0, false);
-	indent = (int)strlen(left);
-	i = 0;
-	while (up[i] != '\0')
-	{
-		printf("%*s%c\n", indent, "", up[i]);
-		i++;
-	}
-	printf("%sH%s\n", left, right);
-	i = 0;
-	while (down[i] != '\0')
-	{
-		printf("%*s%c\n", indent, "", down[i]);
-		i++;
-	}
-}
-
-static char	cell_to_symbol(t_board_cell cell)
-{
-	if (cell == SNAKE_BODY)
-		return ('S');
-	if (cell == GREEN_APPLE)
-		return ('G');
-	if (cell == RED_APPLE)
-		return ('R');
-	return ('0');
-}
-
-static void	build_line(char *buffer, int buf_size, const t_board *board, int x,
-					int y, int step_x, int step_y, bool reverse)
-{
-	int		len;
-	int		limit;
-	int		i;
-	char	tmp;
-
-	len = 0;
-	limit = buf_size - 2;
-	while (x >= 0 && x < board->size && y >= 0 && y < board->size)
-	{
-		if (len == limit)
-			break ;
-		buffer[len++] = cell_to_symbol(board->grid[y][x]);
-		x += step_x;
-		y += step_y;
-	}
-	if (len < buf_size - 1)
-		buffer[len++] = 'W';
-	buffer[len] = '\0';
-	if (!reverse)
-		return ;
-	i = 0;
-	while (i < len / 2)
-	{
-		tmp = buffer[i];
-		buffer[i] = buffer[len - 1 - i];
-		buffer[len - 1 - i] = tmp;
-		i++;
-	}
-}
@@ -0,0 +1,36 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   board_status.c                                     :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:20:04 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:20:04 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "board_internal.h"
+
+/*
+** Every scalar a training loop or viewer reads, in one call. A NULL board
+** reports size 0 and game over.
+*/
+void	board_get_status(const t_board *board, t_board_status *out)
+{
+	if (out == NULL)
+		return ;
+	memset(out, 0, sizeof(t_board_status));
+	if (board == NULL)
+	{
+		out->game_over = true;
+		return ;
+	}
+	out->score = board->score;
+	out->length = board->snake.length;
+	out->max_length = board->max_length;
+	out->moves = board->moves;
+	out->size = board->size;
+	out->state = board_get_state(board);
+	out->game_over = board->game_over;
+}
@@ -0,0 +1,33 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   board_step.c                                       :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 01:53:19 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 01:53:19 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "board_internal.h"
+
+/*
+** Move, score and observe in a single call so bindings pay for one foreign
+** call per transition instead of move + game over + state queries.
+*/
+int	board_step(t_board *board, t_direction action, t_step_result *out)
+{
+	int	result;
+
+	result = board_move(board, action);
+	if (out == NULL)
+		return (result);
+	out->result = result;
+	out->reward = board_get_reward(result);
+	out->done = board_is_game_over(board);
+	out->state = board_get_state(board);
+	out->length = board_get_length(board);
+	out->score = board_get_score(board);
+	return (result);
+}
@@ -0,0 +1,96 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   board_undo.c                                       :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:16:00 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:16:00 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "board_internal.h"
+
+/*
+** board_push_move is board_move plus an undo record. The stack is only
+** (re)allocated when it is full, so a search that pushes and pops within
+** its capacity never touches the allocator.
+*/
+
+void	undo_log_cell(t_board *board, int cell, t_board_cell old)
+{
+	t_cell_write	*write;
+
+	if (board->journal->num_writes >= UNDO_MAX_WRITES)
+		return ;
+	write = &board->journal->writes[board->journal->num_writes++];
+	write->cell = (short)cell;
+	write->old = (unsigned char)old;
+	write->slot = -1;
+	if (board->engine == ENGINE_GRID && old == EMPTY)
+		write->slot = board->empty_pos[cell];
+}
+
+static int	grow_stack(t_board *board)
+{
+	t_undo_record	*records;
+	int				capacity;
+
+	capacity = board->undo_capacity * 2;
+	if (capacity < UNDO_MIN_CAPACITY)
+		capacity = UNDO_MIN_CAPACITY;
+	records = (t_undo_record *)realloc(board->undo,
+			capacity * sizeof(t_undo_record));
+	if (records == NULL)
+		return (-1);
+	board->undo = records;
+	board->undo_capacity = capacity;
+	return (0);
+}
+
+static void	snapshot(const t_board *board, t_undo_record *record)
+{
+	record->num_writes = 0;
+	record->ring_idx = (board->snake.head_idx + 1) % board->max_snake_length;
+	record->ring_cell = board->snake.body[record->ring_idx];
+	memcpy(record->apples, board->apples,
+		board->num_apples * sizeof(t_apple));
+	record->rng_state = board->rng_state;
+	record->game_over = board->game_over;
+	record->head_idx = board->snake.head_idx;
+	record->length = board->snake.length;
+	record->score = board->score;
+	record->moves = board->moves;
+	record->max_length = board->max_length;
+	record->green_apples_count = board->green_apples_count;
+	record->red_apples_count = board->red_apples_count;
+	record->empty_count = board->empty_count;
+}
+
+/*
+** Same result codes as board_move, or -2 (nothing moved) when the undo
+** stack cannot grow. Every successful call pushes exactly one record, even
+** when the move itself is rejected, so pushes and undos always pair up.
+*/
+int	board_push_move(t_board *board, t_direction action)
+{
+	int	result;
+
+	if (board == NULL)
+		return (-1);
+	if (board->undo_depth == board->undo_capacity && grow_stack(board) < 0)
+		return (-2);
+	board->journal = &board->undo[board->undo_depth++];
+	snapshot(board, board->journal);
+	result = board_move(board, action);
+	board->journal = NULL;
+	return (result);
+}
+
+int	board_get_undo_depth(const t_board *board)
+{
+	if (board == NULL)
+		return (0);
+	return (board->undo_depth);
+}
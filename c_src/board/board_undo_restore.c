@@ -0,0 +1,89 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   board_undo_restore.c                               :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:16:00 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:16:00 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "board_internal.h"
+
+/*
+** board_undo replays the logged writes of the last record backwards. Each
+** write is reversed against the exact state it produced, so the empty-cell
+** index gets back its old order too, not just its old contents: the next
+** spawn after an undo picks the same cell as it did the first time.
+*/
+
+static void	unremove_empty(t_board *board, int cell, int slot)
+{
+	int	last;
+
+	last = board->empty_cells[slot];
+	board->empty_cells[board->empty_count] = last;
+	board->empty_pos[last] = board->empty_count;
+	board->empty_count++;
+	board->empty_cells[slot] = cell;
+	board->empty_pos[cell] = slot;
+}
+
+static void	restore_cell(t_board *board, const t_cell_write *write)
+{
+	t_board_cell	now;
+
+	now = board_cell_at(board, write->cell);
+	toggle_mask(board, write->cell, now);
+	toggle_mask(board, write->cell, write->old);
+	if ((now == EMPTY) != (write->old == EMPTY))
+		board->occupied[write->cell >> 6] ^= 1ull << (write->cell & 63);
+	if (board->engine == ENGINE_BITBOARD)
+		return ;
+	if (now == EMPTY)
+	{
+		board->empty_count--;
+		board->empty_pos[write->cell] = -1;
+	}
+	else if (write->old == EMPTY)
+		unremove_empty(board, write->cell, write->slot);
+	board->grid[write->cell] = write->old;
+}
+
+static void	restore_scalars(t_board *board, const t_undo_record *record)
+{
+	board->snake.body[record->ring_idx] = record->ring_cell;
+	memcpy(board->apples, record->apples,
+		board->num_apples * sizeof(t_apple));
+	board->rng_state = record->rng_state;
+	board->game_over = record->game_over;
+	board->snake.head_idx = record->head_idx;
+	board->snake.length = record->length;
+	board->score = record->score;
+	board->moves = record->moves;
+	board->max_length = record->max_length;
+	board->green_apples_count = record->green_apples_count;
+	board->red_apples_count = record->red_apples_count;
+	board->empty_count = record->empty_count;
+}
+
+/*
+** Take back the last board_push_move. Returns 0, or -1 when there is
+** nothing to undo (board_move, board_step and board_reset empty the stack).
+*/
+int	board_undo(t_board *board)
+{
+	t_undo_record	*record;
+	int				i;
+
+	if (board == NULL || board->undo_depth == 0)
+		return (-1);
+	record = &board->undo[--board->undo_depth];
+	i = record->num_writes;
+	while (i-- > 0)
+		restore_cell(board, &record->writes[i]);
+	restore_scalars(board, record);
+	return (0);
+}
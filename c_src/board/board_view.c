@@ -0,0 +1,70 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   board_view.c                                       :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:18:09 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:18:09 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "board_internal.h"
+
+/*
+** Direct read access to the arena, so bindings can wrap the grid and the
+** snake ring in a buffer instead of calling board_get_cell per cell. The
+** pointers stay valid for the life of the board.
+*/
+
+/*
+** Row-major cells, one byte each (t_board_cell values). The bitboard engine
+** does not keep the grid up to date, so it is rebuilt from the masks here;
+** with ENGINE_GRID this is just the pointer.
+*/
+const unsigned char	*board_get_grid(t_board *board)
+{
+	int	cell;
+
+	if (board == NULL)
+		return (NULL);
+	if (board->engine == ENGINE_BITBOARD)
+	{
+		cell = 0;
+		while (cell < board->size * board->size)
+		{
+			board->grid[cell] = (unsigned char)board_cell_at(board, cell);
+			cell++;
+		}
+	}
+	return (board->grid);
+}
+
+/*
+** Snake ring buffer of max_snake_length packed cells. The head is at
+** board_get_head_index and the tail length - 1 slots before it, wrapping.
+*/
+const unsigned short	*board_get_body(const t_board *board)
+{
+	if (board == NULL)
+		return (NULL);
+	return (board->snake.body);
+}
+
+int	board_get_head_index(const t_board *board)
+{
+	if (board == NULL)
+		return (-1);
+	return (board->snake.head_idx);
+}
+
+/*
+** Packed head cell (y * size + x), or -1 without a snake.
+*/
+int	board_get_head(const t_board *board)
+{
+	if (board == NULL || board->snake.length <= 0)
+		return (-1);
+	return (board->snake.body[board->snake.head_idx]);
+}
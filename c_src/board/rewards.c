@@ -6,7 +6,7 @@
 /*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
 /*                                                +#+#+#+#+#+   +#+           */
 /*   Created: 2026/01/07 18:28:37 by jhogonca          #+#    #+#             */
-/*   Updated: 2026/01/07 20:53:17 by jhogonca         ###   ########.fr       */
+/*   Updated: 2026/10/17 01:51:22 by jhogonca         ###   ########.fr       */
 /*                                                                            */
 /* ************************************************************************** */
 
@@ -31,3 +31,14 @@ float	board_get_reward_step(void)
 {
 	return (REWARD_STEP);
 }
+
+float	board_get_reward(int result)
+{
+	if (result == ATE_GREEN_APPLE)
+		return (REWARD_GREEN_APPLE);
+	if (result == ATE_RED_APPLE)
+		return (REWARD_RED_APPLE);
+	if (result == HIT_WALL || result == HIT_SELF || result == LENGTH_ZERO)
+		return (REWARD_DEATH);
+	return (REWARD_STEP);
+}
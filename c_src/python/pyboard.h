@@ -0,0 +1,56 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   pyboard.h                                          :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:08:14 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 03:15:38 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#ifndef PYBOARD_H
+# define PYBOARD_H
+
+# define PY_SSIZE_T_CLEAN
+# include <Python.h>
+# include "../board/board.h"
+
+/*
+** slither.core._board.Board: a t_board owned by a Python object. step
+** points into the buffer of the bound StepInfo (a ctypes mirror of
+** t_step_result) so last_step is shared with Python without copies.
+*/
+typedef struct s_pyboard
+{
+	PyObject_HEAD
+	t_board			*board;
+	Py_buffer		step_view;
+	t_step_result	*step;
+}	t_pyboard;
+
+extern PyTypeObject	g_board_type;
+extern PyMethodDef	g_board_methods[];
+extern PyGetSetDef	g_board_getset[];
+
+int			pyboard_check(t_pyboard *self);
+PyObject	*pyboard_get_int(t_pyboard *self, void *closure);
+PyObject	*pyboard_get_state(t_pyboard *self, void *closure);
+
+PyObject	*pyboard_reset(t_pyboard *self, PyObject *unused);
+PyObject	*pyboard_seed(t_pyboard *self, PyObject *arg);
+PyObject	*pyboard_move(t_pyboard *self, PyObject *arg);
+PyObject	*pyboard_step(t_pyboard *self, PyObject *arg);
+PyObject	*pyboard_step_info(t_pyboard *self, PyObject *arg);
+PyObject	*pyboard_get_cell(t_pyboard *self, PyObject *const *args,
+				Py_ssize_t nargs);
+PyObject	*pyboard_print(t_pyboard *self, PyObject *unused);
+PyObject	*pyboard_close(t_pyboard *self, PyObject *unused);
+PyObject	*pyboard_copy_from(t_pyboard *self, PyObject *arg);
+PyObject	*pyboard_detach(t_pyboard *self, PyObject *unused);
+PyObject	*pyboard_push_move(t_pyboard *self, PyObject *arg);
+PyObject	*pyboard_pop_move(t_pyboard *self, PyObject *unused);
+int			pyboard_declare_gil_free(PyObject *module);
+
+#endif
@@ -0,0 +1,81 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   pyboard_attrs.c                                    :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:08:41 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 03:15:38 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "pyboard.h"
+
+static PyObject	*get_game_over(t_pyboard *self, void *closure)
+{
+	(void)closure;
+	if (!pyboard_check(self))
+		return (NULL);
+	return (PyBool_FromLong(board_is_game_over(self->board)));
+}
+
+static PyObject	*get_last_step(t_pyboard *self, void *closure)
+{
+	(void)closure;
+	if (self->step_view.obj == NULL)
+		Py_RETURN_NONE;
+	Py_INCREF(self->step_view.obj);
+	return (self->step_view.obj);
+}
+
+static PyObject	*get_address(t_pyboard *self, void *closure)
+{
+	(void)closure;
+	return (PyLong_FromVoidPtr(self->board));
+}
+
+PyMethodDef	g_board_methods[] = {
+{"reset", (PyCFunction)pyboard_reset, METH_NOARGS,
+	PyDoc_STR("Reset the board to initial state.")},
+{"seed", (PyCFunction)pyboard_seed, METH_O,
+	PyDoc_STR("Reseed the board's RNG; takes effect from the next reset().")},
+{"move", (PyCFunction)pyboard_move, METH_O,
+	PyDoc_STR("Move the snake; return the action result code.")},
+{"push_move", (PyCFunction)pyboard_push_move, METH_O,
+	PyDoc_STR("Move the snake and record how to undo it.")},
+{"pop_move", (PyCFunction)pyboard_pop_move, METH_NOARGS,
+	PyDoc_STR("Undo the last push_move(); IndexError if there is none.")},
+{"step", (PyCFunction)pyboard_step, METH_O,
+	PyDoc_STR("Perform one action; return (next_state, reward, done).")},
+{"step_info", (PyCFunction)pyboard_step_info, METH_O,
+	PyDoc_STR("Perform one action; return last_step.")},
+{"get_cell", (PyCFunction)(void (*)(void))pyboard_get_cell, METH_FASTCALL,
+	PyDoc_STR("Get the cell value at (x, y).")},
+{"print_board", (PyCFunction)pyboard_print, METH_NOARGS,
+	PyDoc_STR("Display the snake vision to stdout.")},
+{"copy_from", (PyCFunction)pyboard_copy_from, METH_O,
+	PyDoc_STR("Overwrite this board with another of the same size/engine.")},
+{"close", (PyCFunction)pyboard_close, METH_NOARGS,
+	PyDoc_STR("Free the C board; later calls raise RuntimeError.")},
+{"_detach", (PyCFunction)pyboard_detach, METH_NOARGS,
+	PyDoc_STR("Close without freeing; return the C board's address.")},
+{NULL, NULL, 0, NULL}
+};
+
+PyGetSetDef	g_board_getset[] = {
+{"score", (getter)pyboard_get_int, NULL, "Current score.", (void *)0},
+{"length", (getter)pyboard_get_int, NULL, "Snake length.", (void *)1},
+{"max_length", (getter)pyboard_get_int, NULL, "Longest length.", (void *)2},
+{"moves", (getter)pyboard_get_int, NULL, "Moves made.", (void *)3},
+{"size", (getter)pyboard_get_int, NULL, "Board dimension.", (void *)4},
+{"engine", (getter)pyboard_get_int, NULL, "Storage engine.", (void *)5},
+{"undo_depth", (getter)pyboard_get_int, NULL, "Moves pop_move can undo.",
+	(void *)6},
+{"state", (getter)pyboard_get_state, NULL, "12-bit vision state.", NULL},
+{"is_game_over", (getter)get_game_over, NULL, "Game over flag.", NULL},
+{"last_step", (getter)get_last_step, NULL, "StepInfo of the last step.",
+	NULL},
+{"address", (getter)get_address, NULL, "Address of the C board.", NULL},
+{NULL, NULL, NULL, NULL, NULL}
+};
@@ -0,0 +1,50 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   pyboard_copy.c                                     :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:13:13 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 03:15:38 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "pyboard.h"
+
+PyObject	*pyboard_copy_from(t_pyboard *self, PyObject *arg)
+{
+	t_pyboard	*other;
+
+	if (!PyObject_TypeCheck(arg, &g_board_type))
+	{
+		PyErr_SetString(PyExc_TypeError, "copy_from expects a board");
+		return (NULL);
+	}
+	other = (t_pyboard *)arg;
+	if (!pyboard_check(self) || !pyboard_check(other))
+		return (NULL);
+	if (board_copy_into(self->board, other->board) < 0)
+	{
+		PyErr_SetString(PyExc_ValueError,
+			"Boards differ in size or engine");
+		return (NULL);
+	}
+	memcpy(self->step, other->step, sizeof(t_step_result));
+	Py_RETURN_NONE;
+}
+
+/*
+** Hand the t_board over to the caller as an address for board_destroy and
+** leave this object closed, so memory read by live views outlives close().
+*/
+PyObject	*pyboard_detach(t_pyboard *self, PyObject *unused)
+{
+	PyObject	*address;
+
+	(void)unused;
+	address = PyLong_FromVoidPtr(self->board);
+	if (address != NULL)
+		self->board = NULL;
+	return (address);
+}
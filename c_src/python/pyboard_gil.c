@@ -0,0 +1,35 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   pyboard_gil.c                                      :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:43:43 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:43:43 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "pyboard.h"
+
+/*
+** A free-threaded interpreter re-enables the GIL when it imports a module
+** that does not opt out. A Board is only ever driven by the thread that
+** owns it and the module keeps no mutable global state, so it opts out.
+*/
+#ifdef Py_GIL_DISABLED
+
+int	pyboard_declare_gil_free(PyObject *module)
+{
+	return (PyUnstable_Module_SetGIL(module, Py_MOD_GIL_NOT_USED));
+}
+
+#else
+
+int	pyboard_declare_gil_free(PyObject *module)
+{
+	(void)module;
+	return (0);
+}
+
+#endif
@@ -0,0 +1,94 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   pyboard_play.c                                     :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:08:27 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 03:18:49 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "pyboard.h"
+
+PyObject	*pyboard_reset(t_pyboard *self, PyObject *unused)
+{
+	(void)unused;
+	if (!pyboard_check(self))
+		return (NULL);
+	board_reset(self->board);
+	Py_RETURN_NONE;
+}
+
+PyObject	*pyboard_seed(t_pyboard *self, PyObject *arg)
+{
+	unsigned long long	seed;
+
+	if (!pyboard_check(self))
+		return (NULL);
+	seed = PyLong_AsUnsignedLongLongMask(arg);
+	if (seed == (unsigned long long)-1 && PyErr_Occurred())
+		return (NULL);
+	board_seed(self->board, seed);
+	Py_RETURN_NONE;
+}
+
+PyObject	*pyboard_move(t_pyboard *self, PyObject *arg)
+{
+	long	direction;
+
+	if (!pyboard_check(self))
+		return (NULL);
+	direction = PyLong_AsLong(arg);
+	if (direction == -1 && PyErr_Occurred())
+		return (NULL);
+	return (PyLong_FromLong(board_move(self->board, (int)direction)));
+}
+
+/*
+** Same contract as the ctypes path: fill last_step, return
+** (state, reward, done). PyBool_FromLong cannot fail, the other two items
+** are checked before the tuple takes them.
+*/
+PyObject	*pyboard_step(t_pyboard *self, PyObject *arg)
+{
+	PyObject	*info;
+	PyObject	*state;
+	PyObject	*reward;
+	PyObject	*out;
+
+	info = pyboard_step_info(self, arg);
+	if (info == NULL)
+		return (NULL);
+	Py_DECREF(info);
+	state = PyLong_FromLong(self->step->state);
+	reward = PyFloat_FromDouble(self->step->reward);
+	out = NULL;
+	if (state != NULL && reward != NULL)
+		out = PyTuple_New(3);
+	if (out == NULL)
+	{
+		Py_XDECREF(state);
+		Py_XDECREF(reward);
+		return (NULL);
+	}
+	PyTuple_SET_ITEM(out, 0, state);
+	PyTuple_SET_ITEM(out, 1, reward);
+	PyTuple_SET_ITEM(out, 2, PyBool_FromLong(self->step->done));
+	return (out);
+}
+
+PyObject	*pyboard_step_info(t_pyboard *self, PyObject *arg)
+{
+	long	direction;
+
+	if (!pyboard_check(self))
+		return (NULL);
+	direction = PyLong_AsLong(arg);
+	if (direction == -1 && PyErr_Occurred())
+		return (NULL);
+	board_step(self->board, (int)direction, self->step);
+	Py_INCREF(self->step_view.obj);
+	return (self->step_view.obj);
+}
@@ -0,0 +1,75 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   pyboard_query.c                                    :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:08:27 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:17:04 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "pyboard.h"
+
+PyObject	*pyboard_get_cell(t_pyboard *self, PyObject *const *args,
+				Py_ssize_t nargs)
+{
+	long	x;
+	long	y;
+
+	if (nargs != 2)
+	{
+		PyErr_SetString(PyExc_TypeError, "get_cell expects (x, y)");
+		return (NULL);
+	}
+	if (!pyboard_check(self))
+		return (NULL);
+	x = PyLong_AsLong(args[0]);
+	y = PyLong_AsLong(args[1]);
+	if ((x == -1 || y == -1) && PyErr_Occurred())
+		return (NULL);
+	return (PyLong_FromLong(board_get_cell(self->board, (int)x, (int)y)));
+}
+
+PyObject	*pyboard_print(t_pyboard *self, PyObject *unused)
+{
+	(void)unused;
+	if (!pyboard_check(self))
+		return (NULL);
+	board_print(self->board);
+	fflush(stdout);
+	Py_RETURN_NONE;
+}
+
+PyObject	*pyboard_close(t_pyboard *self, PyObject *unused)
+{
+	(void)unused;
+	board_destroy(self->board);
+	self->board = NULL;
+	Py_RETURN_NONE;
+}
+
+/*
+** Integer getters share one function; closure indexes getters in the
+** order of g_board_getset.
+*/
+PyObject	*pyboard_get_int(t_pyboard *self, void *closure)
+{
+	static int	(*const getters[])(const t_board *) = {
+		board_get_score, board_get_length, board_get_max_length,
+		board_get_moves, board_get_size, board_get_engine,
+		board_get_undo_depth};
+
+	if (!pyboard_check(self))
+		return (NULL);
+	return (PyLong_FromLong(getters[(Py_intptr_t)closure](self->board)));
+}
+
+PyObject	*pyboard_get_state(t_pyboard *self, void *closure)
+{
+	(void)closure;
+	if (!pyboard_check(self))
+		return (NULL);
+	return (PyLong_FromLong(board_get_state(self->board)));
+}
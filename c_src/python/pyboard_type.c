@@ -0,0 +1,113 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   pyboard_type.c                                     :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:08:14 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:43:43 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "pyboard.h"
+
+int	pyboard_check(t_pyboard *self)
+{
+	if (self->board != NULL)
+		return (1);
+	PyErr_SetString(PyExc_RuntimeError, "Board is closed");
+	return (0);
+}
+
+static int	bind_step(t_pyboard *self, PyObject *last_step)
+{
+	if (PyObject_GetBuffer(last_step, &self->step_view, PyBUF_WRITABLE) < 0)
+		return (-1);
+	if (self->step_view.len < (Py_ssize_t) sizeof(t_step_result))
+	{
+		PyBuffer_Release(&self->step_view);
+		PyErr_SetString(PyExc_TypeError, "last_step buffer is too small");
+		return (-1);
+	}
+	self->step = (t_step_result *)self->step_view.buf;
+	return (0);
+}
+
+/*
+** Board(size, engine, last_step): last_step must expose a writable buffer
+** at least as large as t_step_result (slither.core.board.StepInfo).
+*/
+static int	board_init(t_pyboard *self, PyObject *args, PyObject *kwds)
+{
+	static char	*kwlist[] = {"size", "engine", "last_step", NULL};
+	int			size;
+	int			engine;
+	PyObject	*last_step;
+
+	if (!PyArg_ParseTupleAndKeywords(args, kwds, "iiO", kwlist,
+			&size, &engine, &last_step))
+		return (-1);
+	if (self->board != NULL || self->step_view.obj != NULL)
+	{
+		PyErr_SetString(PyExc_RuntimeError, "Board is already initialized");
+		return (-1);
+	}
+	if (bind_step(self, last_step) < 0)
+		return (-1);
+	self->board = board_create_engine(size, engine);
+	if (self->board == NULL)
+		PyErr_NoMemory();
+	return (-(self->board == NULL));
+}
+
+static void	board_dealloc(t_pyboard *self)
+{
+	board_destroy(self->board);
+	self->board = NULL;
+	if (self->step_view.obj != NULL)
+		PyBuffer_Release(&self->step_view);
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+PyTypeObject	g_board_type = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	.tp_name = "slither.core._board.Board",
+	.tp_doc = PyDoc_STR("C board engine without ctypes marshalling."),
+	.tp_basicsize = sizeof(t_pyboard),
+	.tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
+	.tp_new = PyType_GenericNew,
+	.tp_init = (initproc)board_init,
+	.tp_dealloc = (destructor)board_dealloc,
+	.tp_methods = g_board_methods,
+	.tp_getset = g_board_getset,
+};
+
+static struct PyModuleDef	g_board_module = {
+	PyModuleDef_HEAD_INIT,
+	.m_name = "_board",
+	.m_doc = PyDoc_STR("Native bindings for the Learn2Slither board."),
+	.m_size = -1,
+};
+
+PyMODINIT_FUNC	PyInit__board(void)
+{
+	PyObject	*module;
+
+	if (PyType_Ready(&g_board_type) < 0)
+		return (NULL);
+	module = PyModule_Create(&g_board_module);
+	if (module == NULL || pyboard_declare_gil_free(module) < 0)
+	{
+		Py_XDECREF(module);
+		return (NULL);
+	}
+	Py_INCREF(&g_board_type);
+	if (PyModule_AddObject(module, "Board", (PyObject *)&g_board_type) < 0)
+	{
+		Py_DECREF(&g_board_type);
+		Py_DECREF(module);
+		return (NULL);
+	}
+	return (module);
+}
@@ -0,0 +1,41 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   pyboard_undo.c                                     :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:17:04 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:17:04 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "pyboard.h"
+
+PyObject	*pyboard_push_move(t_pyboard *self, PyObject *arg)
+{
+	long	direction;
+	int		result;
+
+	if (!pyboard_check(self))
+		return (NULL);
+	direction = PyLong_AsLong(arg);
+	if (direction == -1 && PyErr_Occurred())
+		return (NULL);
+	result = board_push_move(self->board, (int)direction);
+	if (result == -2)
+		return (PyErr_Format(PyExc_MemoryError,
+				"Failed to grow the undo stack"));
+	return (PyLong_FromLong(result));
+}
+
+PyObject	*pyboard_pop_move(t_pyboard *self, PyObject *unused)
+{
+	(void)unused;
+	if (!pyboard_check(self))
+		return (NULL);
+	if (board_undo(self->board) < 0)
+		return (PyErr_Format(PyExc_IndexError,
+				"pop_move from an empty undo stack"));
+	Py_RETURN_NONE;
+}
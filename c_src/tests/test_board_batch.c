@@ -0,0 +1,119 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   test_board_batch.c                                 :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 01:52:01 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 01:52:01 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "tests.h"
+
+#define BATCH_SIZE 4
+
+static bool	test_batch_create_destroy(void)
+{
+	t_board_batch	*batch;
+
+	batch = board_batch_create(BATCH_SIZE, 12);
+	if (!check_condition(batch != NULL, "Batch creation failed"))
+		return (false);
+	if (!check_equal(batch->count, BATCH_SIZE, "Batch count mismatch"))
+		return (false);
+	if (!check_equal(batch->size, 12, "Batch size mismatch"))
+		return (false);
+	board_batch_destroy(batch);
+	board_batch_destroy(NULL);
+	return (check_condition(board_batch_create(0, 10) == NULL,
+			"Empty batch should not be created"));
+}
+
+static bool	test_batch_reset_fills_states(void)
+{
+	t_board_batch	*batch;
+	unsigned short	states[BATCH_SIZE];
+	int				i;
+
+	batch = board_batch_create(BATCH_SIZE, 10);
+	memset(states, 0xff, sizeof(states));
+	board_batch_reset(batch, states);
+	i = 0;
+	while (i < BATCH_SIZE)
+	{
+		if (!check_equal(states[i],
+				board_get_state(batch->boards[i]), "Reset state mismatch"))
+			return (false);
+		i++;
+	}
+	board_batch_destroy(batch);
+	return (true);
+}
+
+static bool	test_batch_step_auto_resets(void)
+{
+	t_board_batch	*batch;
+	t_batch_out		out;
+	int				actions[BATCH_SIZE];
+	unsigned char	dones[BATCH_SIZE];
+
+	batch = board_batch_create(BATCH_SIZE, 10);
+	out.states = (unsigned short [BATCH_SIZE]){0};
+	out.rewards = (float [BATCH_SIZE]){0};
+	out.dones = dones;
+	out.lengths = (int [BATCH_SIZE]){0};
+	out.max_lengths = (int [BATCH_SIZE]){0};
+	memset(actions, 0, sizeof(actions));
+	if (!check_equal(board_batch_step(batch, actions, &out), BATCH_SIZE,
+			"Moving into the body should end every episode"))
+		return (false);
+	if (!check_equal(dones[0], BATCH_TERMINAL, "Done flag not terminal")
+		|| !check_condition(out.rewards[0] == REWARD_DEATH, "Wrong reward")
+		|| !check_equal(batch->boards[0]->moves, 0, "Board not reset")
+		|| !check_equal(out.lengths[0], 3, "Final length not reported"))
+		return (false);
+	board_batch_destroy(batch);
+	return (true);
+}
+
+static bool	test_batch_truncates_at_max_moves(void)
+{
+	t_board_batch	*batch;
+	t_batch_out		out;
+	int				actions[BATCH_SIZE];
+	unsigned char	dones[BATCH_SIZE];
+
+	batch = board_batch_create(BATCH_SIZE, 10);
+	board_batch_set_max_moves(batch, 1);
+	out.states = (unsigned short [BATCH_SIZE]){0};
+	out.rewards = (float [BATCH_SIZE]){0};
+	out.dones = dones;
+	out.lengths = (int [BATCH_SIZE]){0};
+	out.max_lengths = (int [BATCH_SIZE]){0};
+	memset(actions, 0, sizeof(actions));
+	actions[0] = DOWN;
+	board_batch_step(batch, actions, &out);
+	if (!check_condition(dones[0] != BATCH_RUNNING,
+			"Board should stop after max moves"))
+		return (false);
+	if (!check_equal(batch->boards[0]->moves, 0, "Board not reset"))
+		return (false);
+	board_batch_destroy(batch);
+	return (true);
+}
+
+t_test_result	test_board_batch(void)
+{
+	t_test_result	result;
+
+	result.passed = 0;
+	result.failed = 0;
+	result.total = 0;
+	run_test("Batch create/destroy", test_batch_create_destroy, &result);
+	run_test("Batch reset states", test_batch_reset_fills_states, &result);
+	run_test("Batch step auto-reset", test_batch_step_auto_resets, &result);
+	run_test("Batch max moves", test_batch_truncates_at_max_moves, &result);
+	return (result);
+}
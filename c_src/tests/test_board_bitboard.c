@@ -0,0 +1,129 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   test_board_bitboard.c                              :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:01:50 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:01:50 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "tests.h"
+#include "../board/board_internal.h"
+
+/*
+** Decode the whole board through the public getter and check it against
+** the snake length, the apple counts and the free-cell count.
+*/
+static bool	cells_are_consistent(const t_board *board)
+{
+	int	counts[6];
+	int	cell;
+
+	memset(counts, 0, sizeof(counts));
+	cell = 0;
+	while (cell < board->size * board->size)
+	{
+		counts[board_get_cell(board, cell % board->size,
+				cell / board->size)]++;
+		cell++;
+	}
+	return (counts[SNAKE_HEAD] == 1
+		&& counts[SNAKE_HEAD] + counts[SNAKE_BODY] == board->snake.length
+		&& counts[GREEN_APPLE] == board->num_green_apples
+		&& counts[RED_APPLE] <= board->num_red_apples
+		&& counts[EMPTY] == board->empty_count);
+}
+
+static bool	test_engine_selection(void)
+{
+	t_board			*board;
+	t_board_batch	*batch;
+
+	board = board_create_engine(10, ENGINE_BITBOARD);
+	if (!check_equal(board_get_engine(board), ENGINE_BITBOARD,
+			"Bitboard engine not selected"))
+		return (false);
+	board_destroy(board);
+	board = board_create_engine(10, 42);
+	if (!check_equal(board_get_engine(board), ENGINE_GRID,
+			"Unknown engine should fall back to grid"))
+		return (false);
+	board_destroy(board);
+	batch = board_batch_create_engine(3, 12, ENGINE_BITBOARD);
+	if (!check_equal(board_get_engine(batch->boards[2]), ENGINE_BITBOARD,
+			"Batch boards should use the requested engine"))
+		return (false);
+	board_batch_destroy(batch);
+	return (true);
+}
+
+static bool	test_cells_during_play(void)
+{
+	t_board	*board;
+	int		size;
+	int		i;
+
+	size = MIN_BOARD_SIZE;
+	while (size <= MAX_BOARD_SIZE)
+	{
+		board = board_create_engine(size, ENGINE_BITBOARD);
+		board_seed(board, 77 + size);
+		board_reset(board);
+		i = 0;
+		while (i++ < 2000)
+		{
+			board_move(board, board_rand(board, 4));
+			if (board->game_over)
+				board_reset(board);
+			if (!check_condition(cells_are_consistent(board),
+					"Bitboard cells inconsistent during play"))
+				return (false);
+		}
+		board_destroy(board);
+		size += 4;
+	}
+	return (true);
+}
+
+static bool	test_seeded_replay(void)
+{
+	t_board	*a;
+	t_board	*b;
+	int		i;
+
+	a = board_create_engine(14, ENGINE_BITBOARD);
+	b = board_create_engine(14, ENGINE_BITBOARD);
+	board_seed(a, 5);
+	board_seed(b, 5);
+	board_reset(a);
+	board_reset(b);
+	i = 0;
+	while (i++ < 3000 && !board_is_game_over(a))
+	{
+		board_move(a, i % 7 % 4);
+		board_move(b, i % 7 % 4);
+		if (!check_equal(board_get_state(a), board_get_state(b),
+				"Seeded bitboards diverged"))
+			return (false);
+	}
+	board_destroy(a);
+	board_destroy(b);
+	return (true);
+}
+
+t_test_result	test_board_bitboard(void)
+{
+	t_test_result	result;
+
+	result.passed = 0;
+	result.failed = 0;
+	result.total = 0;
+	run_test("Engine selection", test_engine_selection, &result);
+	run_test("Cells consistent during play", test_cells_during_play,
+		&result);
+	run_test("Seeded replay", test_seeded_replay, &result);
+	return (result);
+}
@@ -0,0 +1,130 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   test_board_clone.c                                 :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:12:56 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:12:56 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "tests.h"
+#include "../board/board_internal.h"
+
+/*
+** Play the same moves on both boards; they must stay identical, including
+** every apple spawned from the copied RNG state.
+*/
+static bool	same_future(t_board *a, t_board *b, int moves)
+{
+	int	i;
+	int	cell;
+
+	i = 0;
+	while (i++ < moves)
+	{
+		if (board_move(a, i % 5 % 4) != board_move(b, i % 5 % 4)
+			|| board_get_state(a) != board_get_state(b))
+			return (false);
+		if (a->game_over)
+		{
+			board_reset(a);
+			board_reset(b);
+		}
+		cell = 0;
+		while (cell < a->size * a->size && board_cell_at(a, cell)
+			== board_cell_at(b, cell))
+			cell++;
+		if (cell != a->size * a->size)
+			return (false);
+	}
+	return (true);
+}
+
+static bool	test_clone_replays(void)
+{
+	t_board	*board;
+	t_board	*copy;
+	int		engine;
+
+	engine = ENGINE_GRID;
+	while (engine <= ENGINE_BITBOARD)
+	{
+		board = board_create_engine(12, engine);
+		board_seed(board, 99);
+		board_reset(board);
+		board_move(board, LEFT);
+		copy = board_clone(board);
+		if (!check_condition(copy != NULL, "Clone failed")
+			|| !check_condition(same_future(board, copy, 2000),
+				"Clone diverged from its source"))
+			return (false);
+		board_destroy(board);
+		board_destroy(copy);
+		engine++;
+	}
+	return (true);
+}
+
+static bool	test_copy_into_restores(void)
+{
+	t_board	*board;
+	t_board	*snapshot;
+	t_board	*replay;
+
+	board = board_create(10);
+	board_seed(board, 5);
+	board_reset(board);
+	snapshot = board_create(10);
+	replay = board_create(10);
+	if (!check_equal(board_copy_into(snapshot, board), 0, "Copy failed"))
+		return (false);
+	board_copy_into(replay, board);
+	same_future(board, replay, 300);
+	board_copy_into(board, snapshot);
+	board_copy_into(replay, snapshot);
+	if (!check_condition(same_future(board, replay, 300),
+			"Restored copies diverged"))
+		return (false);
+	board_destroy(board);
+	board_destroy(snapshot);
+	board_destroy(replay);
+	return (true);
+}
+
+static bool	test_copy_into_rejects(void)
+{
+	t_board	*small;
+	t_board	*large;
+	t_board	*bits;
+	bool	ok;
+
+	small = board_create(10);
+	large = board_create(12);
+	bits = board_create_engine(10, ENGINE_BITBOARD);
+	ok = check_equal(board_copy_into(small, large), -1, "Size mismatch")
+		&& check_equal(board_copy_into(small, bits), -1, "Engine mismatch")
+		&& check_equal(board_copy_into(NULL, small), -1, "NULL dst")
+		&& check_condition(board_clone(NULL) == NULL, "Clone of NULL");
+	board_destroy(small);
+	board_destroy(large);
+	board_destroy(bits);
+	return (ok);
+}
+
+t_test_result	test_board_clone(void)
+{
+	t_test_result	result;
+
+	result.passed = 0;
+	result.failed = 0;
+	result.total = 0;
+	run_test("Clone replays the future", test_clone_replays, &result);
+	run_test("Copy-into restores a snapshot", test_copy_into_restores,
+		&result);
+	run_test("Copy-into rejects mismatches", test_copy_into_rejects,
+		&result);
+	return (result);
+}
@@ -0,0 +1,121 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   test_board_empty_index.c                           :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 01:55:46 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 01:57:24 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "tests.h"
+#include "../board/board_internal.h"
+
+static bool	index_is_consistent(const t_board *board)
+{
+	int	cell;
+	int	empties;
+	int	pos;
+
+	empties = 0;
+	cell = 0;
+	while (cell < board->size * board->size)
+	{
+		pos = board->empty_pos[cell];
+		if (board->grid[cell] != EMPTY)
+		{
+			if (pos != -1)
+				return (false);
+		}
+		else if (pos < 0 || board->empty_cells[pos] != cell)
+			return (false);
+		else
+			empties++;
+		cell++;
+	}
+	return (empties == board->empty_count);
+}
+
+static bool	test_index_after_create(void)
+{
+	t_board	*board;
+	int		size;
+
+	size = 8;
+	while (size <= 20)
+	{
+		board = board_create(size);
+		if (!check_condition(index_is_consistent(board),
+				"Empty index inconsistent after create"))
+			return (false);
+		board_destroy(board);
+		size++;
+	}
+	return (true);
+}
+
+static bool	test_index_during_play(void)
+{
+	t_board	*board;
+	int		i;
+
+	board = board_create(12);
+	board_seed(board, 2026);
+	board_reset(board);
+	i = 0;
+	while (i < 5000)
+	{
+		board_move(board, board_rand(board, 4));
+		if (board->game_over)
+			board_reset(board);
+		if (!check_condition(index_is_consistent(board),
+				"Empty index inconsistent during play"))
+			return (false);
+		i++;
+	}
+	board_destroy(board);
+	return (true);
+}
+
+static bool	test_apples_present_during_play(void)
+{
+	t_board	*board;
+	int		i;
+	int		green;
+
+	board = board_create(15);
+	board_seed(board, 31);
+	board_reset(board);
+	i = 0;
+	while (i++ < 2000)
+	{
+		board_move(board, board_rand(board, 4));
+		if (board->game_over)
+			board_reset(board);
+		green = 0;
+		while (green < board->num_green_apples && board->apples[green].x >= 0
+			&& board->grid[board->apples[green].y * board->size
+				+ board->apples[green].x] == GREEN_APPLE)
+			green++;
+		if (!check_equal(green, board->num_green_apples, "Lost a green apple"))
+			return (false);
+	}
+	board_destroy(board);
+	return (true);
+}
+
+t_test_result	test_board_empty_index(void)
+{
+	t_test_result	result;
+
+	result.passed = 0;
+	result.failed = 0;
+	result.total = 0;
+	run_test("Index after create", test_index_after_create, &result);
+	run_test("Index during play", test_index_during_play, &result);
+	run_test("Apples kept during play", test_apples_present_during_play,
+		&result);
+	return (result);
+}
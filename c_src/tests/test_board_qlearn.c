@@ -0,0 +1,115 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   test_board_qlearn.c                                :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:11:52 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:11:52 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "tests.h"
+#include "../board/board_internal.h"
+
+static double			g_q[QTABLE_STATES * QTABLE_ACTIONS];
+static unsigned char	g_visited[QTABLE_STATES];
+
+static t_qlearn	make_agent(bool learn)
+{
+	t_qlearn	agent;
+
+	memset(g_q, 0, sizeof(g_q));
+	memset(g_visited, 0, sizeof(g_visited));
+	memset(&agent, 0, sizeof(agent));
+	agent.q = g_q;
+	agent.visited = g_visited;
+	agent.alpha = 0.1;
+	agent.gamma = 0.95;
+	agent.epsilon = 1.0;
+	agent.min_epsilon = 0.5;
+	agent.epsilon_decay = 0.99;
+	agent.max_steps = 200;
+	agent.learn = learn;
+	board_qlearn_seed(&agent, 7);
+	return (agent);
+}
+
+static bool	test_update_rule(void)
+{
+	t_qlearn		agent;
+	t_step_result	step;
+	double			delta;
+
+	agent = make_agent(true);
+	memset(&step, 0, sizeof(step));
+	step.reward = 10.0f;
+	step.state = 42;
+	g_q[42 * QTABLE_ACTIONS + 2] = 4.0;
+	g_q[7 * QTABLE_ACTIONS + 1] = 1.0;
+	qlearn_update(&agent, 7, 1, &step);
+	delta = g_q[7 * QTABLE_ACTIONS + 1] - (1.0 + 0.1 * (10.0 + 0.95 * 4.0
+				- 1.0));
+	if (!check_condition(delta < 1e-9 && delta > -1e-9,
+			"Q update does not match alpha/gamma rule"))
+		return (false);
+	return (check_condition(g_visited[42] == 1, "Next state not visited"));
+}
+
+static bool	test_training_run(void)
+{
+	t_qlearn		agent;
+	t_board			*board;
+	t_episode_stats	stats[300];
+	int				i;
+
+	agent = make_agent(true);
+	board = board_create(10);
+	board_seed(board, 3);
+	if (!check_equal(board_qlearn_run(board, &agent, stats, 300), 300,
+			"Wrong episode count"))
+		return (false);
+	i = 0;
+	while (i < 300 && stats[i].steps > 0 && stats[i].steps <= 200)
+		i++;
+	board_destroy(board);
+	if (!check_equal(i, 300, "Episode steps out of range"))
+		return (false);
+	return (check_condition(agent.epsilon == 0.5
+			&& stats[0].epsilon == 0.99, "Epsilon decay/floor mismatch"));
+}
+
+static bool	test_frozen_agent(void)
+{
+	t_qlearn		agent;
+	t_board			*board;
+	t_episode_stats	stats[50];
+	int				i;
+
+	agent = make_agent(false);
+	board = board_create(10);
+	board_qlearn_run(board, &agent, stats, 50);
+	board_destroy(board);
+	i = 0;
+	while (i < QTABLE_STATES * QTABLE_ACTIONS && g_q[i] == 0.0)
+		i++;
+	if (!check_equal(i, QTABLE_STATES * QTABLE_ACTIONS,
+			"Frozen agent changed the table"))
+		return (false);
+	return (check_condition(agent.epsilon == 1.0,
+			"Frozen agent decayed epsilon"));
+}
+
+t_test_result	test_board_qlearn(void)
+{
+	t_test_result	result;
+
+	result.passed = 0;
+	result.failed = 0;
+	result.total = 0;
+	run_test("Q update rule", test_update_rule, &result);
+	run_test("Training run", test_training_run, &result);
+	run_test("Frozen agent", test_frozen_agent, &result);
+	return (result);
+}
@@ -0,0 +1,111 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   test_board_rng.c                                   :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 01:54:17 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 01:54:17 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "tests.h"
+#include "../board/board_internal.h"
+
+static bool	test_same_seed_same_layout(void)
+{
+	t_board	*a;
+	t_board	*b;
+	bool	ok;
+
+	a = board_create(15);
+	b = board_create(15);
+	board_seed(a, 42);
+	board_seed(b, 42);
+	board_reset(a);
+	board_reset(b);
+	ok = check_condition(boards_share_layout(a, b), "Same seed gave different layout");
+	board_destroy(a);
+	board_destroy(b);
+	return (ok);
+}
+
+static bool	test_reseed_replays_trajectory(void)
+{
+	t_board	*board;
+	int		first[4];
+	int		i;
+
+	board = board_create(10);
+	board_seed(board, 7);
+	board_reset(board);
+	i = 0;
+	while (i < 4)
+		first[i++] = board_move(board, LEFT);
+	board_seed(board, 7);
+	board_reset(board);
+	i = 0;
+	while (i < 4)
+	{
+		if (!check_equal(board_move(board, LEFT), first[i++],
+				"Reseeded board diverged"))
+			return (false);
+	}
+	board_destroy(board);
+	return (true);
+}
+
+static bool	test_rand_stays_in_bounds(void)
+{
+	t_board	*board;
+	int		value;
+	int		i;
+
+	board = board_create(10);
+	board_seed(board, 123);
+	i = 0;
+	while (i < 10000)
+	{
+		value = board_rand(board, 1 + i % 97);
+		if (!check_condition(value >= 0 && value < 1 + i % 97,
+				"board_rand out of range"))
+			return (false);
+		i++;
+	}
+	board_destroy(board);
+	return (true);
+}
+
+static bool	test_batch_seed_is_reproducible(void)
+{
+	t_board_batch	*a;
+	t_board_batch	*b;
+	bool			ok;
+
+	a = board_batch_create(3, 10);
+	b = board_batch_create(3, 10);
+	board_batch_seed(a, 99);
+	board_batch_seed(b, 99);
+	board_batch_reset(a, NULL);
+	board_batch_reset(b, NULL);
+	ok = check_condition(boards_share_layout(a->boards[2], b->boards[2]),
+			"Seeded batches differ");
+	board_batch_destroy(a);
+	board_batch_destroy(b);
+	return (ok);
+}
+
+t_test_result	test_board_rng(void)
+{
+	t_test_result	result;
+
+	result.passed = 0;
+	result.failed = 0;
+	result.total = 0;
+	run_test("Same seed, same layout", test_same_seed_same_layout, &result);
+	run_test("Reseed replays moves", test_reseed_replays_trajectory, &result);
+	run_test("Rand within bounds", test_rand_stays_in_bounds, &result);
+	run_test("Batch seeding", test_batch_seed_is_reproducible, &result);
+	return (result);
+}
@@ -0,0 +1,141 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   test_board_undo.c                                  :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:16:26 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:16:26 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "tests.h"
+#include "../board/board_internal.h"
+
+/*
+** Cells, scalars, RNG and the live part of the empty-cell index must all
+** match, otherwise the next spawn could differ after an undo.
+*/
+static bool	same_board(const t_board *a, const t_board *b)
+{
+	int	i;
+
+	if (a->score != b->score || a->moves != b->moves
+		|| a->snake.length != b->snake.length || a->game_over != b->game_over
+		|| a->max_length != b->max_length || a->rng_state != b->rng_state
+		|| a->empty_count != b->empty_count || !boards_share_layout(a, b)
+		|| memcmp(a->rows, b->rows, sizeof(a->rows))
+		|| memcmp(a->occupied, b->occupied, sizeof(a->occupied)))
+		return (false);
+	i = 0;
+	while (i < a->size * a->size && board_cell_at(a, i) == board_cell_at(b, i)
+		&& (a->engine == ENGINE_BITBOARD || i >= a->empty_count
+			|| a->empty_cells[i] == b->empty_cells[i]))
+		i++;
+	return (i == a->size * a->size);
+}
+
+static bool	test_undo_round_trip(void)
+{
+	t_board	*board;
+	t_board	*before;
+	int		engine;
+	int		i;
+
+	engine = -1;
+	while (++engine <= ENGINE_BITBOARD)
+	{
+		board = board_create_engine(10, engine);
+		before = board_create_engine(10, engine);
+		board_seed(board, 17);
+		board_reset(board);
+		i = 0;
+		while (i < 2000 && board_copy_into(before, board) == 0
+			&& board_push_move(board, i % 7 % 4) != -2
+			&& board_undo(board) == 0 && same_board(board, before))
+		{
+			board_move(board, i++ % 7 % 4);
+			if (board->game_over)
+				board_reset(board);
+		}
+		board_destroy(board);
+		board_destroy(before);
+		if (!check_equal(i, 2000, "Undo did not restore the board"))
+			return (false);
+	}
+	return (true);
+}
+
+/*
+** Undoing a whole line of play and replaying it must give the same results,
+** apples included: the RNG and the empty-index order are both restored.
+*/
+static bool	test_undo_replays(void)
+{
+	t_board	*board;
+	t_board	*start;
+	int		results[80];
+	int		i;
+
+	board = board_create(12);
+	start = board_create(12);
+	board_seed(board, 3);
+	board_reset(board);
+	board_copy_into(start, board);
+	i = -1;
+	while (++i < 80)
+		results[i] = board_push_move(board, i % 5 % 4);
+	while (board_undo(board) == 0)
+		i--;
+	if (!check_equal(i, 0, "Wrong undo depth")
+		|| !check_condition(same_board(board, start), "Start not restored"))
+		return (false);
+	while (i < 80 && board_push_move(board, i % 5 % 4) == results[i])
+		i++;
+	board_destroy(board);
+	board_destroy(start);
+	return (check_equal(i, 80, "Replay diverged after undo"));
+}
+
+static bool	test_undo_history_resets(void)
+{
+	t_board	*board;
+	t_board	*copy;
+	bool	ok;
+
+	board = board_create(10);
+	ok = check_equal(board_undo(board), -1, "Undo on empty stack")
+		&& check_equal(board_undo(NULL), -1, "Undo on NULL");
+	board_push_move(board, UP);
+	board_push_move(board, LEFT);
+	copy = board_clone(board);
+	ok = ok && check_equal(board_get_undo_depth(board), 2, "Depth not 2")
+		&& check_equal(board_get_undo_depth(copy), 0, "Clone has history");
+	board_move(board, DOWN);
+	ok = ok && check_equal(board_get_undo_depth(board), 0, "Move kept stack");
+	board_push_move(board, RIGHT);
+	board_reset(board);
+	ok = ok && check_equal(board_get_undo_depth(board), 0, "Reset kept stack");
+	board_push_move(board, RIGHT);
+	board_copy_into(board, copy);
+	ok = ok && check_equal(board_get_undo_depth(board), 0, "Copy kept stack");
+	board_destroy(board);
+	board_destroy(copy);
+	return (ok);
+}
+
+t_test_result	test_board_undo(void)
+{
+	t_test_result	result;
+
+	result.passed = 0;
+	result.failed = 0;
+	result.total = 0;
+	run_test("Undo restores every move", test_undo_round_trip, &result);
+	run_test("Undo then replay gives the same game", test_undo_replays,
+		&result);
+	run_test("Plain moves, reset and copy clear the stack",
+		test_undo_history_resets, &result);
+	return (result);
+}
@@ -6,7 +6,7 @@
 /*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
 /*                                                +#+#+#+#+#+   +#+           */
 /*   Created: 2026/01/07 00:00:00 by jhogonca          #+#    #+#             */
-/*   Updated: 2026/01/07 20:31:07 by jhogonca         ###   ########.fr       */
+/*   Updated: 2026/10/17 01:57:24 by jhogonca         ###   ########.fr       */
 /*                                                                            */
 /* ************************************************************************** */
 
@@ -19,8 +19,8 @@ static bool	test_board_snake_initialized(void)
 	int		y;
 
 	board = board_create(10);
-	x = board->snake.x[board->snake.head_idx];
-	y = board->snake.y[board->snake.head_idx];
+	x = board->snake.body[board->snake.head_idx] % board->size;
+	y = board->snake.body[board->snake.head_idx] / board->size;
 	if (!check_condition(x >= 0 && x < 10, "Snake head X out of bounds"))
 		return (false);
 	if (!check_condition(y >= 0 && y < 10, "Snake head Y out of bounds"))
@@ -0,0 +1,124 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   test_board_view.c                                  :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 02:18:19 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:20:13 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "tests.h"
+
+static bool	grid_matches(t_board *board)
+{
+	const unsigned char	*grid;
+	int					cell;
+
+	grid = board_get_grid(board);
+	cell = 0;
+	while (cell < board->size * board->size
+		&& grid[cell] == board_get_cell(board, cell % board->size,
+			cell / board->size))
+		cell++;
+	return (cell == board->size * board->size);
+}
+
+static bool	test_grid_view(void)
+{
+	t_board	*board;
+	int		engine;
+	int		i;
+
+	engine = -1;
+	while (++engine <= ENGINE_BITBOARD)
+	{
+		board = board_create_engine(14, engine);
+		board_seed(board, 6);
+		board_reset(board);
+		i = 0;
+		while (i < 500 && grid_matches(board))
+		{
+			board_move(board, i++ % 6 % 4);
+			if (board_is_game_over(board))
+				board_reset(board);
+		}
+		board_destroy(board);
+		if (!check_equal(i, 500, "Grid view differs from board_get_cell"))
+			return (false);
+	}
+	return (true);
+}
+
+/*
+** Walking the ring from the head must visit the head, then body cells.
+*/
+static bool	test_body_ring(void)
+{
+	t_board					*board;
+	const unsigned short	*body;
+	int						idx;
+	int						cell;
+	int						i;
+
+	board = board_create(10);
+	board_move(board, LEFT);
+	body = board_get_body(board);
+	idx = board_get_head_index(board);
+	if (!check_equal(body[idx], board_get_head(board), "Head not at head index")
+		|| !check_equal(board_get_cell(board, body[idx] % 10, body[idx] / 10),
+			SNAKE_HEAD, "Head cell is not SNAKE_HEAD"))
+		return (false);
+	i = 1;
+	while (i < board_get_length(board))
+	{
+		cell = body[(idx - i + MAX_SNAKE_LENGTH) % MAX_SNAKE_LENGTH];
+		if (board_get_cell(board, cell % 10, cell / 10) != SNAKE_BODY)
+			break ;
+		i++;
+	}
+	board_destroy(board);
+	return (check_equal(i, 3, "Ring does not hold the body")
+		&& check_equal(board_get_head(NULL), -1, "Head of NULL board"));
+}
+
+static bool	test_status(void)
+{
+	t_board			*board;
+	t_board_status	status;
+	bool			ok;
+
+	board = board_create(12);
+	board_move(board, LEFT);
+	board_move(board, UP);
+	board_get_status(board, &status);
+	ok = check_equal(status.score, board_get_score(board), "Status score")
+		&& check_equal(status.length, board_get_length(board), "Status length")
+		&& check_equal(status.max_length, board_get_max_length(board),
+			"Status max length")
+		&& check_equal(status.moves, board_get_moves(board), "Status moves")
+		&& check_equal(status.size, 12, "Status size")
+		&& check_equal(status.state, board_get_state(board), "Status state")
+		&& check_equal(status.game_over, board_is_game_over(board),
+			"Status game over");
+	board_destroy(board);
+	board_get_status(NULL, &status);
+	return (ok && check_condition(status.game_over && status.size == 0,
+			"NULL board status"));
+}
+
+t_test_result	test_board_view(void)
+{
+	t_test_result	result;
+
+	result.passed = 0;
+	result.failed = 0;
+	result.total = 0;
+	run_test("Grid view matches cells (both engines)", test_grid_view,
+		&result);
+	run_test("Body ring and head accessors", test_body_ring, &result);
+	run_test("Status matches the getters", test_status, &result);
+	return (result);
+}
@@ -0,0 +1,110 @@
+/* ************************************************************************** */
+/*                                                                            */
+/*                                                        :::      ::::::::   */
+/*   test_board_vision.c                                :+:      :+:    :+:   */
+/*                                                    +:+ +:+         +:+     */
+/*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
+/*                                                +#+#+#+#+#+   +#+           */
+/*   Created: 2026/10/17 01:59:24 by jhogonca          #+#    #+#             */
+/*   Updated: 2026/10/17 02:01:55 by jhogonca         ###   ########.fr       */
+/*                                                                            */
+/* ************************************************************************** */
+
+#include "tests.h"
+#include "../board/board_internal.h"
+
+/*
+** Reference vision: walk every ray cell by cell on the grid, the way
+** board_get_state worked before the occupancy masks.
+*/
+static unsigned short	ref_encode(int danger, int green, int red)
+{
+	if (danger == 1)
+		return (1);
+	if (green > 0 && green < danger)
+		return (3);
+	if (red > 0 && red < danger)
+		return (4);
+	if (danger <= 3)
+		return (2);
+	return (5);
+}
+
+static unsigned short	ref_ray(const t_board *board, int d)
+{
+	static const int	step[4][2] = {{0, -1}, {-1, 0}, {0, 1}, {1, 0}};
+	int					first[6];
+	int					head;
+	int					dist;
+	t_board_cell		cell;
+
+	head = board->snake.body[board->snake.head_idx];
+	memset(first, -1, sizeof(first));
+	dist = 0;
+	cell = EMPTY;
+	while (cell != WALL)
+	{
+		dist++;
+		cell = check_cell(board, head % board->size + step[d][0] * dist,
+				head / board->size + step[d][1] * dist);
+		if (first[cell] < 0)
+			first[cell] = dist;
+	}
+	if (first[SNAKE_BODY] < 0)
+		first[SNAKE_BODY] = first[WALL];
+	return (ref_encode(first[SNAKE_BODY], first[GREEN_APPLE],
+			first[RED_APPLE]));
+}
+
+static bool	state_matches_rays(const t_board *board)
+{
+	unsigned short	expected;
+
+	expected = (ref_ray(board, UP) << 9) | (ref_ray(board, LEFT) << 6)
+		| (ref_ray(board, DOWN) << 3) | ref_ray(board, RIGHT);
+	return (check_equal(board_get_state(board), expected,
+			"State differs from ray scan"));
+}
+
+/*
+** Even sizes run on the grid engine, odd sizes on the bitboard engine.
+*/
+static bool	test_vision_during_play(void)
+{
+	t_board	*board;
+	int		size;
+	int		i;
+
+	size = MIN_BOARD_SIZE;
+	while (size <= MAX_BOARD_SIZE)
+	{
+		board = board_create_engine(size, size % 2);
+		board_seed(board, 1000 + size);
+		board_reset(board);
+		if (!state_matches_rays(board))
+			return (false);
+		i = 0;
+		while (i++ < 3000)
+		{
+			board_move(board, board_rand(board, 4));
+			if (board->game_over)
+				board_reset(board);
+			if (!state_matches_rays(board))
+				return (false);
+		}
+		board_destroy(board);
+		size++;
+	}
+	return (true);
+}
+
+t_test_result	test_board_vision(void)
+{
+	t_test_result	result;
+
+	result.passed = 0;
+	result.failed = 0;
+	result.total = 0;
+	run_test("Vision during play", test_vision_during_play, &result);
+	return (result);
+}
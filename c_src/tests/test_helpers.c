@@ -6,7 +6,7 @@
 /*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
 /*                                                +#+#+#+#+#+   +#+           */
 /*   Created: 2026/01/07 00:00:00 by jhogonca          #+#    #+#             */
-/*   Updated: 2026/01/07 17:54:31 by jhogonca         ###   ########.fr       */
+/*   Updated: 2026/10/17 01:57:24 by jhogonca         ###   ########.fr       */
 /*                                                                            */
 /* ************************************************************************** */
 
@@ -30,6 +30,23 @@ bool	check_equal(int a, int b, const char *msg)
 	return (true);
 }
 
+bool	boards_share_layout(const t_board *a, const t_board *b)
+{
+	int	i;
+
+	if (a->snake.body[a->snake.head_idx] != b->snake.body[b->snake.head_idx])
+		return (false);
+	i = 0;
+	while (i < a->num_apples)
+	{
+		if (a->apples[i].x != b->apples[i].x
+			|| a->apples[i].y != b->apples[i].y)
+			return (false);
+		i++;
+	}
+	return (true);
+}
+
 void	run_test(const char *name, bool (*test_fn)(void), t_test_result *result)
 {
 	printf("  Testing: %s...", name);
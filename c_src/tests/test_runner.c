@@ -6,7 +6,7 @@
 /*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
 /*                                                +#+#+#+#+#+   +#+           */
 /*   Created: 2026/01/07 00:00:00 by jhogonca          #+#    #+#             */
-/*   Updated: 2026/01/07 18:02:38 by jhogonca         ###   ########.fr       */
+/*   Updated: 2026/10/17 02:18:20 by jhogonca         ###   ########.fr       */
 /*                                                                            */
 /* ************************************************************************** */
 
@@ -44,6 +44,15 @@ static void	run_all_tests(t_test_result *all)
 	run_section(test_board_edge_cases, "Test: Edge Cases", all);
 	run_section(test_board_validation, "Test: Board Validation", all);
 	run_section(test_board_memory, "Test: Memory & Stress", all);
+	run_section(test_board_batch, "Test: Batched Boards", all);
+	run_section(test_board_rng, "Test: Seeded RNG", all);
+	run_section(test_board_empty_index, "Test: Empty-Cell Index", all);
+	run_section(test_board_vision, "Test: Vision State", all);
+	run_section(test_board_bitboard, "Test: Bitboard Engine", all);
+	run_section(test_board_qlearn, "Test: Native Q-Learning", all);
+	run_section(test_board_clone, "Test: Clone & Copy", all);
+	run_section(test_board_undo, "Test: Move Undo", all);
+	run_section(test_board_view, "Test: Grid & Body Views", all);
 }
 
 int	main(void)
@@ -6,7 +6,7 @@
 /*   By: jhogonca <jhogonca@student.42porto.com>    +#+  +:+       +#+        */
 /*                                                +#+#+#+#+#+   +#+           */
 /*   Created: 2026/01/07 00:00:00 by jhogonca          #+#    #+#             */
-/*   Updated: 2026/01/07 17:59:23 by jhogonca         ###   ########.fr       */
+/*   Updated: 2026/10/17 02:18:20 by jhogonca         ###   ########.fr       */
 /*                                                                            */
 /* ************************************************************************** */
 
@@ -34,10 +34,20 @@ t_test_result	test_board_creation(void);
 t_test_result	test_board_edge_cases(void);
 t_test_result	test_board_validation(void);
 t_test_result	test_board_memory(void);
+t_test_result	test_board_batch(void);
+t_test_result	test_board_rng(void);
+t_test_result	test_board_empty_index(void);
+t_test_result	test_board_vision(void);
+t_test_result	test_board_bitboard(void);
+t_test_result	test_board_qlearn(void);
+t_test_result	test_board_clone(void);
+t_test_result	test_board_undo(void);
+t_test_result	test_board_view(void);
 
 /* Helper functions */
 bool			check_condition(bool cond, const char *msg);
 bool			check_equal(int a, int b, const char *msg);
 void			run_test(const char *n, bool (*f)(void), t_test_result *r);
+bool			boards_share_layout(const t_board *a, const t_board *b);
 
 #endif
@@ -36,10 +36,11 @@ def draw_grid(
     pygame.draw.rect(screen, theme.grid_border, grid_rect, width=2)
 
     hidden_bg = tuple(max(0, c - 25) for c in theme.grid_background)
+    cells = board.grid.tolist()
 
     for y in range(size):
         for x in range(size):
-            cell = board.get_cell(x, y)
+            cell = cells[y][x]
             rect = pygame.Rect(
                 base_x + x * layout.cell_size,
                 base_y + y * layout.cell_size,
@@ -0,0 +1,213 @@
+"""CLI entry point for evaluating saved Learn2Slither models."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from slither.core import BoardEngine
+from slither.evaluation import (
+    CACHE_NAME,
+    METRICS,
+    compare,
+    discover_models,
+    evaluate,
+    load_cache,
+    load_policy,
+    save_cache,
+    summarize,
+    tournament,
+)
+
+
+def add_evaluation_options(parser: argparse.ArgumentParser) -> None:
+    add = parser.add_argument
+    add("--episodes", type=int, default=10_000, help="Seeded episodes")
+    add("--workers", type=int, default=None, help="Processes (all CPUs)")
+    add("--seed", type=int, default=0, help="Seed of the first episode")
+    add("--size", type=int, default=10, help="Board size")
+    add("--max-steps", type=int, default=500, help="Max steps")
+    add("--bitboard", action="store_true", help="Use the bitboard engine")
+    add("--confidence", type=float, default=0.95, help="CI level")
+    add("--output", type=Path, default=None, help="JSON report path")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Evaluate saved models")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Evaluate one model")
+    run.add_argument("model", type=Path, help="Q-table or compiled policy")
+    add_evaluation_options(run)
+
+    pair = commands.add_parser(
+        "compare", help="Compare models on the same seeded episodes"
+    )
+    pair.add_argument(
+        "models", type=Path, nargs="+", help="Baseline first, then the others"
+    )
+    add_evaluation_options(pair)
+
+    league = commands.add_parser(
+        "tournament", help="Rank every model of a directory"
+    )
+    league.add_argument("directory", type=Path, help="Checkpoint directory")
+    add_evaluation_options(league)
+    league.add_argument(
+        "--metric", choices=METRICS, default="length", help="Ranking metric"
+    )
+    league.add_argument(
+        "--cache", type=Path, default=None,
+        help=f"Results cache (default: DIRECTORY/{CACHE_NAME})",
+    )
+    league.add_argument(
+        "--json", action="store_true", help="Print JSON, not a table"
+    )
+
+    args = parser.parse_args()
+    if args.command == "compare" and len(args.models) < 2:
+        parser.error("compare needs at least two models")
+    if args.episodes <= 0:
+        parser.error("--episodes must be positive")
+    if not 0.0 < args.confidence < 1.0:
+        parser.error("--confidence must be between 0 and 1")
+    return args
+
+
+def evaluate_model(args: argparse.Namespace, model: Path):
+    """Play ``model`` on the seeded episodes chosen by ``args``."""
+    engine = BoardEngine.BITBOARD if args.bitboard else BoardEngine.GRID
+    return evaluate(
+        load_policy(model),
+        args.episodes,
+        workers=args.workers,
+        seed=args.seed,
+        size=args.size,
+        max_steps=args.max_steps,
+        engine=engine,
+    )
+
+
+def run_command(args: argparse.Namespace) -> dict[str, object]:
+    """Evaluate one model: its summary report."""
+    started = time.perf_counter()
+    episodes = evaluate_model(args, args.model)
+    report = {"model": str(args.model)}
+    report.update(summarize(episodes, args.confidence))
+    report["seconds"] = time.perf_counter() - started
+    return report
+
+
+def compare_command(args: argparse.Namespace) -> dict[str, object]:
+    """
+    Evaluate every model on the same seeded episodes (common random
+    numbers) and pair each one's results with the first model's.
+    """
+    started = time.perf_counter()
+    baseline, *others = [evaluate_model(args, path) for path in args.models]
+    report = {
+        "baseline": str(args.models[0]),
+        "episodes": args.episodes,
+        "seed": args.seed,
+        "confidence": args.confidence,
+        "models": {},
+        "comparisons": {},
+    }
+    for path, episodes in zip(args.models, [baseline, *others]):
+        summary = summarize(episodes, args.confidence)
+        report["models"][str(path)] = {
+            "metrics": summary["metrics"],
+            "deaths": summary["deaths"],
+        }
+    for path, episodes in zip(args.models[1:], others):
+        report["comparisons"][str(path)] = compare(
+            baseline, episodes, args.confidence
+        )
+    report["seconds"] = time.perf_counter() - started
+    return report
+
+
+def tournament_command(args: argparse.Namespace) -> dict[str, object]:
+    """
+    Rank every model of a directory, playing only those missing from the
+    results cache.
+    """
+    models = discover_models(args.directory)
+    if not models:
+        raise SystemExit(f"No models found in {args.directory}")
+    cache_path = args.cache or args.directory / CACHE_NAME
+    cache = load_cache(cache_path)
+    engine = BoardEngine.BITBOARD if args.bitboard else BoardEngine.GRID
+    started = time.perf_counter()
+    leaderboard = tournament(
+        models,
+        args.episodes,
+        workers=args.workers,
+        seed=args.seed,
+        size=args.size,
+        max_steps=args.max_steps,
+        engine=engine,
+        confidence=args.confidence,
+        metric=args.metric,
+        cache=cache,
+    )
+    save_cache(cache_path, cache)
+    return {
+        "directory": str(args.directory),
+        "episodes": args.episodes,
+        "seed": args.seed,
+        "metric": args.metric,
+        "evaluated": sum(not entry["cached"] for entry in leaderboard),
+        "leaderboard": leaderboard,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def format_leaderboard(report: dict[str, object]) -> str:
+    """Leaderboard as a text table, best model first."""
+    metric = report["metric"]
+    lines = [
+        f"{'Rank':>4}  {'Model':<32} {metric:>18} {'median':>8} "
+        f"{'p95':>8}  source"
+    ]
+    for entry in report["leaderboard"]:
+        stats = entry["metrics"][metric]
+        low, high = stats["ci"]
+        mean = f"{stats['mean']:.2f} ± {(high - low) / 2:.2f}"
+        lines.append(
+            f"{entry['rank']:>4}  {Path(entry['model']).name:<32} "
+            f"{mean:>18} {stats['median']:>8.2f} {stats['p95']:>8.2f}  "
+            f"{'cache' if entry['cached'] else 'played'}"
+        )
+    lines.append(
+        f"{report['evaluated']} of {len(report['leaderboard'])} models "
+        f"played over {report['episodes']} episodes "
+        f"in {report['seconds']:.1f}s"
+    )
+    return "\n".join(lines)
+
+
+COMMANDS = {
+    "run": run_command,
+    "compare": compare_command,
+    "tournament": tournament_command,
+}
+
+
+def main() -> None:
+    args = parse_args()
+    report = COMMANDS[args.command](args)
+    text = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text + "\n")
+    if args.command == "tournament" and not args.json:
+        print(format_leaderboard(report))
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -119,12 +119,13 @@ def run_episode(
 
     # Show initial state (step 0) with pause
     if viewer is not None and _RenderInfo is not None:
+        status = board.status()
         info = _RenderInfo(
             episode=episode,
             step=0,
             reward=0.0,
-            length=board.length,
-            score=board.score,
+            length=status.length,
+            score=status.score,
             done=False,
             fps=args.fps,
         )
@@ -142,7 +143,8 @@ def run_episode(
             # No viewer, pick random action
             action_idx = random.randrange(4)
         direction = get_direction(action_idx)
-        _, reward, done = board.step(direction)
+        step = board.step_info(direction)
+        reward, done = step.reward, step.done
 
         total_reward += reward
 
@@ -154,8 +156,8 @@ def run_episode(
                 episode=episode,
                 step=steps,
                 reward=reward,
-                length=board.length,
-                score=board.score,
+                length=step.length,
+                score=step.score,
                 done=done,
                 fps=args.fps,
             )
@@ -183,7 +185,7 @@ def main() -> None:
     if args.seed is not None:
         random.seed(args.seed)
 
-    board = GameBoard(size=args.size)
+    board = GameBoard(size=args.size, seed=args.seed)
     viewer = create_viewer(args.render, args.fps)
 
     # Show splash screen if viewer is enabled
@@ -198,12 +200,13 @@ def main() -> None:
     try:
         for ep in range(1, args.episodes + 1):
             result = run_episode(board, args, viewer, ep)
-            max_length = max(max_length, board.max_length)
+            status = board.status()
+            max_length = max(max_length, status.max_length)
             max_duration = max(max_duration, result.steps)
             episode_msg = (
                 f"Episode {ep:04d}: steps={result.steps} score={result.score} "
-                f"return={result.total_reward:.2f} length={board.length} "
-                f"max_length={board.max_length}"
+                f"return={result.total_reward:.2f} length={status.length} "
+                f"max_length={status.max_length}"
             )
             print(episode_msg)
     finally:
@@ -11,12 +11,19 @@ It includes:
 - A Python wrapper class for the C Board structure
 """
 
-from .core import GameBoard, BoardCell, Direction, Actions
+from .core import GameBoard, VecGameBoard, BoardCell, Direction, Actions
 from .agent import QLearningAgent
 
 __version__ = "0.1.0"
 __author__ = "Jhonata Pereira"
-__all__ = ["GameBoard", "BoardCell", "Direction", "Actions", "QLearningAgent"]
+__all__ = [
+    "GameBoard",
+    "VecGameBoard",
+    "BoardCell",
+    "Direction",
+    "Actions",
+    "QLearningAgent",
+]
 
 # Viewer is optional (requires pygame)
 try:  # pragma: no cover - optional dependency
@@ -4,10 +4,41 @@ from __future__ import annotations
 
 import json
 import random
+from array import array
 from pathlib import Path
-from typing import Dict, List, MutableMapping
+from typing import TYPE_CHECKING, List, MutableMapping, Sequence
 
-__all__ = ["QLearningAgent"]
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+from .core._types import DoneFlag
+from .core.qlearn import (
+    QTABLE_ACTIONS,
+    QTABLE_STATES,
+    QLearnParams,
+    run_qlearning,
+)
+from .qtable import (
+    DenseQTable,
+    is_binary_model,
+    read_binary_model,
+    write_binary_model,
+)
+from .symmetry import (
+    ACTION_FROM_CANONICAL,
+    ACTION_TO_CANONICAL,
+    CANONICAL_STATES,
+    CANONICAL_TRANSFORMS,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .core.board import GameBoard
+
+__all__ = ["BINARY_SUFFIX", "QLearningAgent"]
+
+BINARY_SUFFIX = ".bin"
 
 
 class QLearningAgent:
@@ -21,7 +52,11 @@ class QLearningAgent:
         min_epsilon: float = 0.1,
         epsilon_decay: float = 0.999,
         num_actions: int = 4,
+        dense: bool = False,
+        symmetric: bool = False,
     ) -> None:
+        if symmetric and num_actions != QTABLE_ACTIONS:
+            raise ValueError("symmetric states need exactly 4 actions")
         self.alpha = alpha
         self.gamma = gamma
         self.epsilon = epsilon
@@ -29,31 +64,76 @@ class QLearningAgent:
         self.epsilon_decay = epsilon_decay
         self.num_actions = num_actions
         self.learning_enabled = True
-        self.q_table: Dict[int, List[float]] = {}
+        self.dense = dense
+        # Learn one row per symmetry class of states (see symmetry.py);
+        # states and actions are mapped to the canonical frame on the way
+        # in and actions back on the way out.
+        self.symmetric = symmetric
+        self.q_table: MutableMapping[int, List[float]] = self._new_table()
+        # Source of every random draw: the ``random`` module by default, or
+        # a random.Random of its own for an agent driven from one thread.
+        self.rng = random
+        self._np_rng = None
+
+    # ------------------------------------------------------------------
+    def _new_table(self) -> MutableMapping[int, List[float]]:
+        """Empty table: DenseQTable in dense mode, a dict otherwise."""
+        if self.dense:
+            return DenseQTable(self.num_actions)
+        return {}
 
     # ------------------------------------------------------------------
     def _ensure_state(self, state: int) -> None:
         if state not in self.q_table:
             self.q_table[state] = [0.0 for _ in range(self.num_actions)]
 
+    # ------------------------------------------------------------------
+    def _to_canonical(self, state: int, action: int) -> tuple[int, int]:
+        transform = CANONICAL_TRANSFORMS[state]
+        action = ACTION_TO_CANONICAL[transform * self.num_actions + action]
+        return CANONICAL_STATES[state], action
+
     # ------------------------------------------------------------------
     def select_action(self, state: int, explore: bool = True) -> int:
-        self._ensure_state(state)
+        if self.symmetric:
+            offset = CANONICAL_TRANSFORMS[state] * self.num_actions
+            action = self._select_action(CANONICAL_STATES[state], explore)
+            return ACTION_FROM_CANONICAL[offset + action]
+        return self._select_action(state, explore)
+
+    # ------------------------------------------------------------------
+    def _select_action(self, state: int, explore: bool) -> int:
+        if not self.dense:
+            self._ensure_state(state)
+        elif self.learning_enabled:
+            self.q_table.visited[state] = 1
         if (
             explore
             and self.learning_enabled
-            and random.random() < self.epsilon
+            and self.rng.random() < self.epsilon
         ):
-            return random.randrange(self.num_actions)
-        return self.best_action(state)
+            return self.rng.randrange(self.num_actions)
+        return self._best_action(state)
 
     # ------------------------------------------------------------------
     def best_action(self, state: int) -> int:
+        if self.symmetric:
+            offset = CANONICAL_TRANSFORMS[state] * self.num_actions
+            action = self._best_action(CANONICAL_STATES[state])
+            return ACTION_FROM_CANONICAL[offset + action]
+        return self._best_action(state)
+
+    # ------------------------------------------------------------------
+    def _best_action(self, state: int) -> int:
+        if self.dense:
+            if self.learning_enabled:
+                self.q_table.visited[state] = 1
+            return self.q_table.best_action(state, self.rng)
         self._ensure_state(state)
         values = self.q_table[state]
         max_value = max(values)
         best = [i for i, v in enumerate(values) if v == max_value]
-        return random.choice(best)
+        return self.rng.choice(best)
 
     # ------------------------------------------------------------------
     def update(
@@ -63,16 +143,217 @@ class QLearningAgent:
         reward: float,
         next_state: int,
         done: bool,
+        weight: float = 1.0,
     ) -> None:
+        """One Q-learning step; ``weight`` scales its learning rate (the
+        importance-sampling weight of a prioritized replay sample)."""
         if not self.learning_enabled:
             return
+        if self.symmetric:
+            state, action = self._to_canonical(state, action)
+            next_state = CANONICAL_STATES[next_state]
+        if self.dense:
+            self._update_dense(
+                state, action, reward, next_state, done, weight
+            )
+            return
         self._ensure_state(state)
         target = reward
         if not done:
             self._ensure_state(next_state)
             target += self.gamma * max(self.q_table[next_state])
         current = self.q_table[state][action]
-        self.q_table[state][action] = current + self.alpha * (target - current)
+        step = self.alpha * weight
+        self.q_table[state][action] = current + step * (target - current)
+
+    # ------------------------------------------------------------------
+    def _update_dense(
+        self,
+        state: int,
+        action: int,
+        reward: float,
+        next_state: int,
+        done: bool,
+        weight: float = 1.0,
+    ) -> None:
+        table = self.q_table
+        values = table.values
+        table.visited[state] = 1
+        target = reward
+        if not done:
+            table.visited[next_state] = 1
+            target += self.gamma * table.max_value(next_state)
+        index = state * self.num_actions + action
+        values[index] += self.alpha * weight * (target - values[index])
+
+    # ------------------------------------------------------------------
+    def _vectorized(self) -> bool:
+        """Batched calls use NumPy on a dense table, a loop otherwise."""
+        return np is not None and self.dense
+
+    # ------------------------------------------------------------------
+    def _q_matrix(self) -> "np.ndarray":
+        """(states, num_actions) NumPy view over the dense table."""
+        values = np.frombuffer(self.q_table.values, dtype=np.float64)
+        return values.reshape(-1, self.num_actions)
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _np_map(table: array) -> "np.ndarray":
+        """NumPy view over one of the symmetry lookup arrays."""
+        return np.frombuffer(table, dtype=table.typecode)
+
+    # ------------------------------------------------------------------
+    def _rng(self) -> "np.random.Generator":
+        # Seeded from ``random`` so random.seed() keeps batched runs
+        # reproducible too.
+        if self._np_rng is None:
+            self._np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        return self._np_rng
+
+    # ------------------------------------------------------------------
+    def select_actions(
+        self,
+        states: Sequence[int],
+        explore: bool = True,
+        out=None,
+    ) -> Sequence[int]:
+        """Epsilon-greedy action for every state, ties broken at random.
+
+        On a dense table with NumPy installed this is a handful of array
+        operations with bulk random draws; otherwise it loops over
+        ``select_action``. ``out`` (a writable buffer of C ints such as
+        ``VecGameBoard.actions``) receives the actions and is returned."""
+        if not self._vectorized():
+            actions = out if out is not None else [0] * len(states)
+            for index, state in enumerate(states):
+                actions[index] = self.select_action(state, explore)
+            return actions
+        index = np.asarray(states, dtype=np.intp)
+        if self.symmetric:
+            offsets = self._np_map(CANONICAL_TRANSFORMS)[index]
+            offsets = offsets.astype(np.intp) * self.num_actions
+            index = self._np_map(CANONICAL_STATES)[index]
+        if self.learning_enabled:
+            np.frombuffer(self.q_table.visited, dtype=np.uint8)[index] = 1
+        rows = self._q_matrix()[index]
+        rng = self._rng()
+        best = rows == rows.max(axis=1, keepdims=True)
+        noise = rng.random(rows.shape)
+        actions = np.argmax(np.where(best, noise, -1.0), axis=1)
+        if explore and self.learning_enabled and self.epsilon > 0.0:
+            random_mask = rng.random(len(index)) < self.epsilon
+            actions[random_mask] = rng.integers(
+                0, self.num_actions, int(np.count_nonzero(random_mask))
+            )
+        if self.symmetric:
+            actions = self._np_map(ACTION_FROM_CANONICAL)[offsets + actions]
+        if out is None:
+            return actions
+        np.frombuffer(out, dtype=np.intc)[:] = actions
+        return out
+
+    # ------------------------------------------------------------------
+    def update_batch(
+        self,
+        states: Sequence[int],
+        actions: Sequence[int],
+        rewards: Sequence[float],
+        next_states: Sequence[int],
+        dones: Sequence[int],
+        weights: Sequence[float] | None = None,
+    ) -> None:
+        """Apply many Q-updates at once.
+
+        ``dones`` are booleans or DoneFlag values; DoneFlag.TRUNCATED
+        transitions are skipped because their next state is gone.
+        ``weights`` (the importance-sampling weights of a prioritized
+        replay batch) scale each transition's learning rate. The NumPy
+        path computes every target from the table as it was before the
+        batch; k transitions sharing a (state, action) pair move it by
+        ``1 - (1 - alpha) ** k`` towards their mean target (each factor
+        and the mean weighted by ``alpha * weight`` when weighted), which
+        is exactly k sequential updates when the targets agree."""
+        if not self.learning_enabled:
+            return
+        if not self._vectorized():
+            for index, done in enumerate(dones):
+                if done != DoneFlag.TRUNCATED:
+                    self.update(
+                        states[index],
+                        actions[index],
+                        rewards[index],
+                        next_states[index],
+                        done == DoneFlag.TERMINAL,
+                        1.0 if weights is None else weights[index],
+                    )
+            return
+        flags = np.asarray(dones, dtype=np.uint8)
+        keep = flags != DoneFlag.TRUNCATED
+        state = np.asarray(states, dtype=np.intp)[keep]
+        action = np.asarray(actions, dtype=np.intp)[keep]
+        reward = np.asarray(rewards, dtype=np.float64)[keep]
+        next_state = np.asarray(next_states, dtype=np.intp)[keep]
+        terminal = flags[keep] == DoneFlag.TERMINAL
+        if self.symmetric:
+            offsets = self._np_map(CANONICAL_TRANSFORMS)[state]
+            offsets = offsets.astype(np.intp) * self.num_actions
+            action = self._np_map(ACTION_TO_CANONICAL)[offsets + action]
+            state = self._np_map(CANONICAL_STATES)[state]
+            next_state = self._np_map(CANONICAL_STATES)[next_state]
+        matrix = self._q_matrix()
+        future = np.where(terminal, 0.0, matrix[next_state].max(axis=1))
+        targets = reward + self.gamma * future
+        flat = matrix.reshape(-1)
+        cells, inverse, counts = np.unique(
+            state * self.num_actions + action,
+            return_inverse=True,
+            return_counts=True,
+        )
+        if weights is None:
+            mean = np.bincount(inverse, weights=targets) / counts
+            step = 1.0 - (1.0 - self.alpha) ** counts
+        else:
+            rate = self.alpha * np.asarray(weights, dtype=np.float64)[keep]
+            mean = (np.bincount(inverse, weights=targets * rate)
+                    / np.bincount(inverse, weights=rate))
+            with np.errstate(divide="ignore"):
+                kept = np.bincount(inverse, weights=np.log1p(-rate))
+            step = 1.0 - np.exp(kept)
+        flat[cells] += step * (mean - flat[cells])
+        visited = np.frombuffer(self.q_table.visited, dtype=np.uint8)
+        visited[state] = 1
+        visited[next_state[~terminal]] = 1
+
+    # ------------------------------------------------------------------
+    def td_errors(
+        self,
+        states: Sequence[int],
+        actions: Sequence[int],
+        rewards: Sequence[float],
+        next_states: Sequence[int],
+        dones: Sequence[int],
+    ) -> list[float]:
+        """TD error of each transition under the current table (states not
+        in the table count as all zeros); the priorities of a prioritized
+        ReplayBuffer. Nothing is written to the table."""
+        zeros = [0.0] * self.num_actions
+        table = self.q_table
+        errors = []
+        for index, state in enumerate(states):
+            action = actions[index]
+            next_state = next_states[index]
+            if self.symmetric:
+                state, action = self._to_canonical(state, action)
+                next_state = CANONICAL_STATES[next_state]
+            target = rewards[index]
+            if dones[index] != DoneFlag.TERMINAL:
+                target += self.gamma * max(
+                    table[next_state] if next_state in table else zeros
+                )
+            row = table[state] if state in table else zeros
+            errors.append(target - row[action])
+        return errors
 
     # ------------------------------------------------------------------
     def decay_epsilon(self) -> None:
@@ -80,28 +361,112 @@ class QLearningAgent:
             return
         self.epsilon = max(self.min_epsilon, self.epsilon * self.epsilon_decay)
 
+    # ------------------------------------------------------------------
+    def train_native(
+        self,
+        board: "GameBoard",
+        episodes: int,
+        max_steps: int,
+        seed: int | None = None,
+    ) -> list[dict[str, float]]:
+        """Play whole episodes in C on a dense Q-table and merge the visited
+        states back (a DenseQTable is trained in place); returns one stats
+        dict per episode."""
+        if self.num_actions != QTABLE_ACTIONS:
+            raise ValueError("train_native needs exactly 4 actions")
+        if self.symmetric:
+            raise ValueError("train_native does not canonicalise states")
+        if self.dense:
+            if self.q_table.readonly:
+                raise ValueError("A memory-mapped Q-table is read-only")
+            q, visited = self.q_table.values, self.q_table.visited
+        else:
+            q = array("d", bytes(8 * QTABLE_STATES * QTABLE_ACTIONS))
+            visited = bytearray(QTABLE_STATES)
+            for state, values in self.q_table.items():
+                base = state * QTABLE_ACTIONS
+                q[base:base + QTABLE_ACTIONS] = array("d", values)
+                visited[state] = 1
+        params = QLearnParams(
+            alpha=self.alpha,
+            gamma=self.gamma,
+            epsilon=self.epsilon,
+            min_epsilon=self.min_epsilon,
+            epsilon_decay=self.epsilon_decay,
+            max_steps=max_steps,
+            learn=self.learning_enabled,
+        )
+        if seed is None:
+            seed = self.rng.getrandbits(64)
+        history = run_qlearning(
+            board.address, q, visited, params, episodes, seed
+        )
+        self.epsilon = params.epsilon
+        if self.dense:
+            return history
+        for state in range(QTABLE_STATES):
+            if visited[state]:
+                base = state * QTABLE_ACTIONS
+                self.q_table[state] = q[base:base + QTABLE_ACTIONS].tolist()
+        return history
+
     # ------------------------------------------------------------------
     def set_learning(self, enabled: bool) -> None:
         self.learning_enabled = enabled
         if not enabled:
             self.epsilon = 0.0
 
+    # ------------------------------------------------------------------
+    def _hyperparameters(self) -> dict[str, object]:
+        return {
+            "alpha": self.alpha,
+            "gamma": self.gamma,
+            "epsilon": self.epsilon,
+            "min_epsilon": self.min_epsilon,
+            "epsilon_decay": self.epsilon_decay,
+            "num_actions": self.num_actions,
+            "learning_enabled": self.learning_enabled,
+            "symmetric": self.symmetric,
+        }
+
+    # ------------------------------------------------------------------
+    def _apply_hyperparameters(
+        self, data: MutableMapping[str, object]
+    ) -> None:
+        self.alpha = float(data.get("alpha", self.alpha))
+        self.gamma = float(data.get("gamma", self.gamma))
+        self.epsilon = float(data.get("epsilon", self.epsilon))
+        self.min_epsilon = float(data.get("min_epsilon", self.min_epsilon))
+        decay = data.get("epsilon_decay", self.epsilon_decay)
+        self.epsilon_decay = float(decay)
+        self.num_actions = int(data.get("num_actions", self.num_actions))
+        self.learning_enabled = bool(data.get("learning_enabled", True))
+        self.symmetric = bool(data.get("symmetric", False))
+
     # ------------------------------------------------------------------
     def save_model(
         self,
         path: str | Path,
         metadata: MutableMapping[str, object] | None = None,
+        binary: bool | None = None,
     ) -> Path:
+        """Save hyperparameters, Q-table and metadata; ``binary=None``
+        writes the binary format for a ``.bin`` path and JSON otherwise."""
         file_path = Path(path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
+        if binary is None:
+            binary = file_path.suffix == BINARY_SUFFIX
+        if binary:
+            table = self.q_table
+            if not isinstance(table, DenseQTable):
+                table = DenseQTable(self.num_actions)
+                table.update(self.q_table)
+            write_binary_model(
+                file_path, table, self._hyperparameters(), dict(metadata or {})
+            )
+            return file_path
         payload = {
-            "alpha": self.alpha,
-            "gamma": self.gamma,
-            "epsilon": self.epsilon,
-            "min_epsilon": self.min_epsilon,
-            "epsilon_decay": self.epsilon_decay,
-            "num_actions": self.num_actions,
-            "learning_enabled": self.learning_enabled,
+            **self._hyperparameters(),
             "q_table": {
                 str(s): v for s, v in self.q_table.items()
             },
@@ -111,30 +476,44 @@ class QLearningAgent:
         return file_path
 
     # ------------------------------------------------------------------
-    def load_model(self, path: str | Path) -> None:
+    def load_model(self, path: str | Path, mmap: bool = False) -> None:
+        """Load a JSON or binary model (detected from the file's magic).
+
+        With ``mmap`` a binary model's table is memory-mapped read-only and
+        shared with every process mapping the same file; the agent is then
+        dense and frozen (as after ``set_learning(False)``). JSON models are
+        always parsed into a fresh table."""
         file_path = Path(path)
+        if is_binary_model(file_path):
+            params, _, table = read_binary_model(file_path, mapped=mmap)
+            self._apply_hyperparameters(params)
+            if mmap:
+                self.dense = True
+                self.q_table = table
+                self.set_learning(False)
+            elif self.dense:
+                self.q_table = table
+            else:
+                self.q_table = dict(table.items())
+            return
         data = json.loads(file_path.read_text())
-        self.alpha = float(data.get("alpha", self.alpha))
-        self.gamma = float(data.get("gamma", self.gamma))
-        self.epsilon = float(data.get("epsilon", self.epsilon))
-        self.min_epsilon = float(data.get("min_epsilon", self.min_epsilon))
-        decay = data.get("epsilon_decay", self.epsilon_decay)
-        self.epsilon_decay = float(decay)
-        self.num_actions = int(data.get("num_actions", self.num_actions))
-        self.learning_enabled = bool(data.get("learning_enabled", True))
+        self._apply_hyperparameters(data)
         raw_table = data.get("q_table", {})
-        self.q_table = {
-            int(state): [float(value) for value in values]
-            for state, values in raw_table.items()
-        }
+        self.q_table = self._new_table()
+        for state, values in raw_table.items():
+            self.q_table[int(state)] = [float(value) for value in values]
 
     # ------------------------------------------------------------------
-    def load_or_initialize(self, path: str | Path | None) -> None:
+    def load_or_initialize(
+        self,
+        path: str | Path | None,
+        mmap: bool = False,
+    ) -> None:
         if path is None:
             return
         file_path = Path(path)
         if file_path.exists():
-            self.load_model(file_path)
+            self.load_model(file_path, mmap=mmap)
 
     # ------------------------------------------------------------------
     def summary(self) -> dict[str, object]:
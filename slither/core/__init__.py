@@ -5,23 +5,29 @@ Provides low-level access to the C board engine through ctypes.
 """
 
 from ._library import board_lib
-from ._types import Actions, BoardCell, Direction
-from .board import GameBoard
+from ._types import Actions, BoardCell, BoardEngine, Direction, DoneFlag
+from .board import BoardStatus, GameBoard, StepInfo
 from .rewards import (
     REWARD_DEATH,
     REWARD_GREEN_APPLE,
     REWARD_RED_APPLE,
     REWARD_STEP,
 )
+from .vec_board import VecGameBoard
 
 __all__ = [
     "board_lib",
     "Actions",
     "BoardCell",
+    "BoardEngine",
+    "BoardStatus",
     "Direction",
+    "DoneFlag",
     "GameBoard",
     "REWARD_DEATH",
     "REWARD_GREEN_APPLE",
     "REWARD_RED_APPLE",
     "REWARD_STEP",
+    "StepInfo",
+    "VecGameBoard",
 ]
@@ -40,3 +40,28 @@ class Actions:
     LENGTH_ZERO: int = 5
 
     __slots__ = ()
+
+
+class DoneFlag:
+    """Per-environment done codes written by board_batch_step()."""
+
+    RUNNING: int = 0
+    TERMINAL: int = 1
+    TRUNCATED: int = 2
+
+    __slots__ = ()
+
+
+class BoardEngine:
+    """
+    Board storage engines accepted by board_create_engine().
+
+    Both spawn apples uniformly, but GRID picks by empty-cell index and
+    BITBOARD by the n-th clear bit, so one seed gives different apples on
+    each engine: compare seeded runs on the same engine only.
+    """
+
+    GRID: int = 0
+    BITBOARD: int = 1
+
+    __slots__ = ()
@@ -2,19 +2,82 @@
 GameBoard Python Wrapper
 
 Provides a high-level Python interface to the C board engine,
-handling memory management and type conversions.
+handling memory management and type conversions. Uses the native
+extension (slither.core._board) when built, ctypes otherwise.
 """
 
-from ctypes import c_void_p, c_int, c_bool
+import weakref
+from ctypes import (
+    POINTER,
+    Structure,
+    byref,
+    pointer,
+    c_bool,
+    c_float,
+    c_int,
+    c_ubyte,
+    c_ulonglong,
+    c_ushort,
+    c_void_p,
+)
 
 from ._library import board_lib
-from ._types import Actions
-from .rewards import (
-    REWARD_DEATH,
-    REWARD_GREEN_APPLE,
-    REWARD_RED_APPLE,
-    REWARD_STEP,
-)
+from ._types import BoardEngine
+
+
+class StepInfo(Structure):
+    """
+    Mirror of t_step_result, filled by board_step().
+
+    Each GameBoard owns one instance (``GameBoard.last_step``) that is
+    overwritten on every step, so reading it costs no extra foreign call.
+    """
+
+    _fields_ = [
+        ("result", c_int),
+        ("reward", c_float),
+        ("done", c_bool),
+        ("state", c_ushort),
+        ("length", c_int),
+        ("score", c_int),
+    ]
+
+    def __repr__(self) -> str:
+        """Return string representation of StepInfo."""
+        return (
+            f"StepInfo(result={self.result}, reward={self.reward:.1f}, "
+            f"done={self.done}, state={self.state}, length={self.length}, "
+            f"score={self.score})"
+        )
+
+
+class BoardStatus(Structure):
+    """
+    Mirror of t_board_status: every scalar of a board, filled in one call.
+
+    Returned by ``GameBoard.status()``; each call returns a new record, so a
+    status can be kept after the board moves on.
+    """
+
+    __slots__ = ()
+    _fields_ = [
+        ("score", c_int),
+        ("length", c_int),
+        ("max_length", c_int),
+        ("moves", c_int),
+        ("size", c_int),
+        ("state", c_ushort),
+        ("game_over", c_bool),
+    ]
+
+    def __repr__(self) -> str:
+        """Return string representation of BoardStatus."""
+        return (
+            f"BoardStatus(score={self.score}, length={self.length}, "
+            f"max_length={self.max_length}, moves={self.moves}, "
+            f"size={self.size}, state={self.state}, "
+            f"game_over={self.game_over})"
+        )
 
 
 # Define C function signatures
@@ -25,18 +88,46 @@ def _setup_c_functions() -> None:
     board_lib.board_create.argtypes = [c_int]
     board_lib.board_create.restype = c_void_p
 
+    # Board* board_create_engine(int size, int engine)
+    board_lib.board_create_engine.argtypes = [c_int, c_int]
+    board_lib.board_create_engine.restype = c_void_p
+
     # void board_destroy(Board* board)
     board_lib.board_destroy.argtypes = [c_void_p]
     board_lib.board_destroy.restype = None
 
+    # int board_copy_into(Board* dst, const Board* src)
+    board_lib.board_copy_into.argtypes = [c_void_p, c_void_p]
+    board_lib.board_copy_into.restype = c_int
+
     # void board_reset(Board* board)
     board_lib.board_reset.argtypes = [c_void_p]
     board_lib.board_reset.restype = None
 
+    # void board_seed(Board* board, unsigned long long seed)
+    board_lib.board_seed.argtypes = [c_void_p, c_ulonglong]
+    board_lib.board_seed.restype = None
+
     # int board_move(Board* board, Direction action)
     board_lib.board_move.argtypes = [c_void_p, c_int]
     board_lib.board_move.restype = c_int
 
+    # int board_step(Board* board, Direction action, StepResult* out)
+    board_lib.board_step.argtypes = [c_void_p, c_int, POINTER(StepInfo)]
+    board_lib.board_step.restype = c_int
+
+    # int board_push_move(Board* board, Direction action)
+    board_lib.board_push_move.argtypes = [c_void_p, c_int]
+    board_lib.board_push_move.restype = c_int
+
+    # int board_undo(Board* board)
+    board_lib.board_undo.argtypes = [c_void_p]
+    board_lib.board_undo.restype = c_int
+
+    # int board_get_undo_depth(const Board* board)
+    board_lib.board_get_undo_depth.argtypes = [c_void_p]
+    board_lib.board_get_undo_depth.restype = c_int
+
     # bool board_is_game_over(const Board* board)
     board_lib.board_is_game_over.argtypes = [c_void_p]
     board_lib.board_is_game_over.restype = c_bool
@@ -69,6 +160,30 @@ def _setup_c_functions() -> None:
     board_lib.board_get_size.argtypes = [c_void_p]
     board_lib.board_get_size.restype = c_int
 
+    # int board_get_engine(const Board* board)
+    board_lib.board_get_engine.argtypes = [c_void_p]
+    board_lib.board_get_engine.restype = c_int
+
+    # void board_get_status(const Board* board, BoardStatus* out)
+    board_lib.board_get_status.argtypes = [c_void_p, POINTER(BoardStatus)]
+    board_lib.board_get_status.restype = None
+
+    # const unsigned char* board_get_grid(Board* board)
+    board_lib.board_get_grid.argtypes = [c_void_p]
+    board_lib.board_get_grid.restype = c_void_p
+
+    # const unsigned short* board_get_body(const Board* board)
+    board_lib.board_get_body.argtypes = [c_void_p]
+    board_lib.board_get_body.restype = c_void_p
+
+    # int board_get_head_index(const Board* board)
+    board_lib.board_get_head_index.argtypes = [c_void_p]
+    board_lib.board_get_head_index.restype = c_int
+
+    # int board_get_head(const Board* board)
+    board_lib.board_get_head.argtypes = [c_void_p]
+    board_lib.board_get_head.restype = c_int
+
     # void board_print(const Board* board)
     board_lib.board_print.argtypes = [c_void_p]
     board_lib.board_print.restype = None
@@ -77,68 +192,107 @@ def _setup_c_functions() -> None:
 _setup_c_functions()
 
 
-class GameBoard:
+def _read_only_view(
+    owner: "GameBoard",
+    address: int,
+    nbytes: int,
+) -> memoryview:
     """
-    Python wrapper for the C Board structure.
+    Wrap ``nbytes`` of ``owner``'s C memory in a read-only memoryview (no
+    copy). The ctypes array under the view holds a reference to ``owner``,
+    so the board outlives every view, and is counted in ``owner._views``
+    so close() can leave the C memory to the last view.
+    """
+    memory = (c_ubyte * nbytes).from_address(address)
+    memory._owner = owner
+    owner._views += 1
+    weakref.finalize(memory, owner._release_view).atexit = False
+    return memoryview(memory).cast("B").toreadonly()
 
-    Provides a Pythonic interface to the C board engine while maintaining
-    proper memory management and error handling.
+
+class _CtypesBoard:
+    """
+    ctypes implementation of the board calls.
+
+    Base class of GameBoard when the native extension (slither.core._board,
+    built with ``make ext``) is not available. Both bases expose the same
+    methods and properties.
 
     Attributes:
         _board: Opaque pointer to C Board struct
-
-    Example:
-        >>> board = GameBoard()
-        >>> board.print_board()
-        >>> board.move(Direction.RIGHT)
-        >>> del board  # Automatic cleanup
+        _size: Board dimension, read once since it never changes
+        last_step: StepInfo filled by step() and step_info()
     """
 
-    __slots__ = ("_board",)
+    __slots__ = ("_board", "_size", "last_step", "_step_ref")
 
-    def __init__(self, size: int = 10) -> None:
+    def __init__(self, size: int, engine: int, last_step: StepInfo) -> None:
         """
-        Create a new game board.
-
-        Initializes a board with:
-        - Configurable size (8-20, default 10)
-        - Dynamic apple count based on size
-        - Snake with 3 segments
-        - Empty game state
+        Create the C board.
 
         Args:
             size: Board size (8-20, defaults to 10 if invalid)
+            engine: Storage engine (see BoardEngine)
+            last_step: StepInfo that step() and step_info() fill
 
         Raises:
             MemoryError: If board allocation fails
         """
-        self._board = board_lib.board_create(size)
+        self._board = board_lib.board_create_engine(size, engine)
         if not self._board:
             raise MemoryError("Failed to allocate memory for board")
+        self._size = board_lib.board_get_size(self._board)
+        self.last_step = last_step
+        self._step_ref = byref(last_step)
 
     def __del__(self) -> None:
         """Free memory when board is destroyed."""
-        if hasattr(self, "_board") and self._board:
+        self.close()
+
+    def close(self) -> None:
+        """Free the C board (safe to call more than once)."""
+        if getattr(self, "_board", None):
             board_lib.board_destroy(self._board)
             self._board = None
 
-    def __repr__(self) -> str:
-        """Return string representation of GameBoard."""
-        ptr_value = self._board or 0
-        return f"<GameBoard at {hex(ptr_value)}>"
+    def _detach(self) -> int:
+        """Close without freeing; return the C board's address."""
+        address = self._board or 0
+        self._board = None
+        return address
 
-    def __enter__(self) -> "GameBoard":
-        """Context manager entry."""
-        return self
+    @property
+    def address(self) -> int:
+        """Address of the C board (0 once closed)."""
+        return self._board or 0
 
-    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Context manager exit with automatic cleanup."""
-        self.__del__()
+    def copy_from(self, other: "_CtypesBoard") -> None:
+        """
+        Overwrite this board with ``other`` without allocating.
+
+        Args:
+            other: Board of the same size and engine
+
+        Raises:
+            ValueError: If the boards differ in size or engine
+        """
+        if board_lib.board_copy_into(self._board, other._board) < 0:
+            raise ValueError("Boards differ in size or engine")
+        pointer(self.last_step)[0] = other.last_step
 
     def reset(self) -> None:
         """Reset the board to initial state."""
         board_lib.board_reset(self._board)
 
+    def seed(self, seed: int) -> None:
+        """
+        Reseed the board's RNG; takes effect from the next reset().
+
+        Args:
+            seed: Any integer (reduced modulo 2**64)
+        """
+        board_lib.board_seed(self._board, seed & 0xFFFFFFFFFFFFFFFF)
+
     def move(self, direction: int) -> int:
         """
         Move the snake in the given direction.
@@ -151,6 +305,39 @@ class GameBoard:
         """
         return board_lib.board_move(self._board, direction)
 
+    def push_move(self, direction: int) -> int:
+        """
+        Move the snake and record how to take the move back.
+
+        Args:
+            direction: Direction enum value (UP, LEFT, DOWN, RIGHT)
+
+        Returns:
+            int: Action result code, as move() returns it
+
+        Raises:
+            MemoryError: If the undo stack cannot grow
+        """
+        result = board_lib.board_push_move(self._board, direction)
+        if result == -2:
+            raise MemoryError("Failed to grow the undo stack")
+        return result
+
+    def pop_move(self) -> None:
+        """
+        Undo the last push_move(), restoring the board exactly.
+
+        Raises:
+            IndexError: If there is no pushed move left to undo
+        """
+        if board_lib.board_undo(self._board) < 0:
+            raise IndexError("pop_move from an empty undo stack")
+
+    @property
+    def undo_depth(self) -> int:
+        """Number of pushed moves that pop_move() can take back."""
+        return board_lib.board_get_undo_depth(self._board)
+
     def print_board(self) -> None:
         """
         Display the board to stdout.
@@ -198,10 +385,14 @@ class GameBoard:
     @property
     def size(self) -> int:
         """Get board dimension (actual size)."""
-        size = board_lib.board_get_size(self._board)
-        if size < 0:
+        if not self._board:
             raise RuntimeError("Board pointer is null; size unavailable")
-        return size
+        return self._size
+
+    @property
+    def engine(self) -> int:
+        """Get the storage engine (a BoardEngine value)."""
+        return board_lib.board_get_engine(self._board)
 
     def get_cell(self, x: int, y: int) -> int:
         """Get the cell value at (x, y)."""
@@ -217,21 +408,205 @@ class GameBoard:
         Returns:
             tuple[int, float, bool]: (next_state, reward, done)
         """
-        result = board_lib.board_move(self._board, direction)
-
-        if result == Actions.ATE_GREEN_APPLE:
-            reward = REWARD_GREEN_APPLE
-        elif result == Actions.ATE_RED_APPLE:
-            reward = REWARD_RED_APPLE
-        elif result in (
-            Actions.HIT_WALL,
-            Actions.HIT_SELF,
-            Actions.LENGTH_ZERO,
-        ):
-            reward = REWARD_DEATH
-        else:
-            reward = REWARD_STEP
-
-        done = bool(board_lib.board_is_game_over(self._board))
-        state = board_lib.board_get_state(self._board)
-        return state, reward, done
+        board_lib.board_step(self._board, direction, self._step_ref)
+        step = self.last_step
+        return step.state, step.reward, step.done
+
+    def step_info(self, direction: int) -> StepInfo:
+        """
+        Perform one action and return the full step record.
+
+        Args:
+            direction: Direction enum value (UP, LEFT, DOWN, RIGHT)
+
+        Returns:
+            StepInfo: ``last_step``, overwritten by the next step
+        """
+        board_lib.board_step(self._board, direction, self._step_ref)
+        return self.last_step
+
+
+try:
+    from ._board import Board as _BoardBase
+except ImportError:  # pragma: no cover - extension not built
+    _BoardBase = _CtypesBoard
+
+NATIVE = _BoardBase is not _CtypesBoard
+
+
+class GameBoard(_BoardBase):
+    """
+    Python wrapper for the C Board structure.
+
+    Provides a Pythonic interface to the C board engine while maintaining
+    proper memory management and error handling. Calls go through the
+    native extension when it is built (``NATIVE`` is True), otherwise
+    through ctypes.
+
+    Attributes:
+        last_step: StepInfo of the most recent step() call
+
+    Example:
+        >>> board = GameBoard()
+        >>> board.print_board()
+        >>> board.move(Direction.RIGHT)
+        >>> del board  # Automatic cleanup
+    """
+
+    __slots__ = ("_views", "_detached")
+
+    def __init__(
+        self,
+        size: int = 10,
+        seed: int | None = None,
+        engine: int = BoardEngine.GRID,
+    ) -> None:
+        """
+        Create a new game board.
+
+        Initializes a board with:
+        - Configurable size (8-20, default 10)
+        - Dynamic apple count based on size
+        - Snake with 3 segments
+        - Empty game state
+
+        Args:
+            size: Board size (8-20, defaults to 10 if invalid)
+            seed: Seed for the board's own RNG (None = time based). With a
+                seed, snake placement and apple spawns are reproducible.
+            engine: BoardEngine.GRID (byte grid) or BoardEngine.BITBOARD
+                (cells kept only as bitmasks); unknown values use GRID.
+                The same seed spawns different apples on each engine.
+
+        Raises:
+            MemoryError: If board allocation fails
+        """
+        self._views = 0
+        self._detached = 0
+        super().__init__(size, engine, StepInfo())
+        if seed is not None:
+            self.seed(seed)
+            self.reset()
+
+    def __repr__(self) -> str:
+        """Return string representation of GameBoard."""
+        return f"<GameBoard at {hex(self.address)}>"
+
+    def close(self) -> None:
+        """
+        Free the C board (safe to call more than once).
+
+        While a ``grid`` or ``body`` view is alive the board closes at once
+        but its C memory is freed with the last view.
+        """
+        if not getattr(self, "_views", 0):
+            super().close()
+        elif self.address:
+            self._detached = self._detach()
+
+    def _open_address(self) -> int:
+        address = self.address
+        if not address:
+            raise RuntimeError("Board is closed")
+        return address
+
+    def _release_view(self) -> None:
+        self._views -= 1
+        if not self._views and self._detached:
+            board_lib.board_destroy(self._detached)
+            self._detached = 0
+
+    def status(self) -> BoardStatus:
+        """
+        Read score, length, max_length, moves, size, state and game over
+        with a single foreign call.
+
+        Returns:
+            BoardStatus: New record, not updated by later moves
+
+        Raises:
+            RuntimeError: If the board is closed
+        """
+        status = BoardStatus()
+        board_lib.board_get_status(self._open_address(), byref(status))
+        return status
+
+    @property
+    def grid(self) -> memoryview:
+        """
+        Read-only (size, size) view of the cells, straight over C memory.
+
+        Index it as ``grid[y, x]`` (BoardCell values); ``numpy.asarray(grid)``
+        wraps it without copying. With BoardEngine.GRID the view follows the
+        board as it moves; BoardEngine.BITBOARD rebuilds the grid from its
+        masks on each access, so read ``grid`` again after moving. The view
+        keeps the board's memory alive, even past close().
+        """
+        size = self.size
+        address = board_lib.board_get_grid(self._open_address())
+        view = _read_only_view(self, address, size * size)
+        return view.cast("B", (size, size))
+
+    @property
+    def body(self) -> memoryview:
+        """
+        Read-only view of the snake ring buffer (packed ``y * size + x``).
+
+        The head is at ``head_index`` and each earlier slot (wrapping) is the
+        next segment towards the tail. Prefer ``snake`` unless the per-call
+        list is too costly.
+        """
+        size = self.size
+        slots = size * size - 1
+        address = board_lib.board_get_body(self._open_address())
+        return _read_only_view(self, address, slots * 2).cast("H")
+
+    @property
+    def head_index(self) -> int:
+        """Slot of the head in ``body``."""
+        return board_lib.board_get_head_index(self._open_address())
+
+    @property
+    def head(self) -> tuple[int, int] | None:
+        """(x, y) of the snake head, or None without a snake."""
+        cell = board_lib.board_get_head(self._open_address())
+        if cell < 0:
+            return None
+        y, x = divmod(cell, self.size)
+        return x, y
+
+    @property
+    def snake(self) -> list[tuple[int, int]]:
+        """(x, y) of every segment, head first, read from ``body``."""
+        size = self.size
+        body = self.body
+        slots = len(body)
+        index = self.head_index
+        segments = []
+        for offset in range(self.length):
+            y, x = divmod(body[(index - offset) % slots], size)
+            segments.append((x, y))
+        return segments
+
+    def clone(self) -> "GameBoard":
+        """
+        Return an independent copy of this board.
+
+        The copy includes the RNG state, so the same moves spawn the same
+        apples on both boards. Planners that copy often should keep spare
+        boards and use copy_from(), which does not allocate.
+
+        Returns:
+            GameBoard: New board with the same size, engine and contents
+        """
+        other = type(self)(self.size, engine=self.engine)
+        other.copy_from(self)
+        return other
+
+    def __enter__(self) -> "GameBoard":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit with automatic cleanup."""
+        self.close()
@@ -0,0 +1,144 @@
+"""
+Native Q-learning rollouts.
+
+ctypes bindings for board_qlearn_run(), which plays whole training episodes
+inside the C engine on a dense Q-table: action selection, the move, the
+state encoding, the Q update and epsilon decay never return to Python.
+"""
+
+from array import array
+from ctypes import (
+    POINTER,
+    Structure,
+    byref,
+    c_bool,
+    c_double,
+    c_int,
+    c_ubyte,
+    c_ulonglong,
+    c_void_p,
+)
+
+from ._library import board_lib
+
+QTABLE_STATES = 4096
+QTABLE_ACTIONS = 4
+
+
+class QLearnParams(Structure):
+    """Mirror of t_qlearn (dense table pointers + hyperparameters)."""
+
+    _fields_ = [
+        ("q", POINTER(c_double)),
+        ("visited", POINTER(c_ubyte)),
+        ("alpha", c_double),
+        ("gamma", c_double),
+        ("epsilon", c_double),
+        ("min_epsilon", c_double),
+        ("epsilon_decay", c_double),
+        ("max_steps", c_int),
+        ("learn", c_bool),
+        ("rng_state", c_ulonglong),
+    ]
+
+
+class EpisodeStats(Structure):
+    """Mirror of t_episode_stats, one per episode played."""
+
+    _fields_ = [
+        ("steps", c_int),
+        ("reward", c_double),
+        ("length", c_int),
+        ("max_length", c_int),
+        ("epsilon", c_double),
+    ]
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the stats in the format of train.py's run_episode()."""
+        return {
+            "steps": self.steps,
+            "reward": self.reward,
+            "length": self.length,
+            "max_length": self.max_length,
+            "epsilon": self.epsilon,
+        }
+
+
+def _setup_c_functions() -> None:
+    """Configure C function signatures and return types."""
+
+    # void board_qlearn_seed(QLearn* agent, unsigned long long seed)
+    board_lib.board_qlearn_seed.argtypes = [
+        POINTER(QLearnParams),
+        c_ulonglong,
+    ]
+    board_lib.board_qlearn_seed.restype = None
+
+    # int board_qlearn_run(Board* board, QLearn* agent,
+    #                      EpisodeStats* stats, int episodes)
+    board_lib.board_qlearn_run.argtypes = [
+        c_void_p,
+        POINTER(QLearnParams),
+        POINTER(EpisodeStats),
+        c_int,
+    ]
+    board_lib.board_qlearn_run.restype = c_int
+
+
+_setup_c_functions()
+
+
+def run_qlearning(
+    board_address: int,
+    q: array,
+    visited: bytearray,
+    params: QLearnParams,
+    episodes: int,
+    seed: int,
+) -> list[dict[str, float]]:
+    """
+    Play ``episodes`` training episodes on a board entirely in C.
+
+    Args:
+        board_address: ``GameBoard.address`` of the board to play on
+        q: QTABLE_STATES * QTABLE_ACTIONS doubles (an array('d') or any
+            writable buffer of format "d", such as shared memory), updated
+            in place
+        visited: QTABLE_STATES flags, set for every state the agent saw
+        params: Hyperparameters; ``params.epsilon`` is decayed in place
+        episodes: Number of episodes to play
+        seed: Seed of the exploration RNG (reduced modulo 2**64)
+
+    Returns:
+        list[dict[str, float]]: Per-episode steps, reward, length,
+        max_length and epsilon (after that episode's decay)
+
+    Raises:
+        ValueError: If the table buffers have the wrong size
+        RuntimeError: If the C call rejects its arguments
+    """
+    if len(q) != QTABLE_STATES * QTABLE_ACTIONS or memoryview(q).format != "d":
+        raise ValueError("q must be a buffer of 4096 * 4 doubles")
+    if len(visited) != QTABLE_STATES:
+        raise ValueError("visited must hold 4096 flags")
+    # Plain assignment rather than cast(), whose reference cycle would
+    # keep the buffers exported (and shared memory open) until a GC pass.
+    params.q = (c_double * len(q)).from_buffer(q)
+    params.visited = (c_ubyte * len(visited)).from_buffer(visited)
+    board_lib.board_qlearn_seed(byref(params), seed & 0xFFFFFFFFFFFFFFFF)
+    stats = (EpisodeStats * max(episodes, 1))()
+    played = board_lib.board_qlearn_run(
+        board_address, byref(params), stats, episodes
+    )
+    if played < 0:
+        raise RuntimeError("board_qlearn_run rejected its arguments")
+    return [stats[index].as_dict() for index in range(played)]
+
+
+__all__ = [
+    "EpisodeStats",
+    "QLearnParams",
+    "QTABLE_ACTIONS",
+    "QTABLE_STATES",
+    "run_qlearning",
+]
@@ -4,7 +4,7 @@ Values are fetched via ctypes from the compiled library.
 This keeps the Python and C implementations in sync.
 """
 
-from ctypes import c_float
+from ctypes import c_float, c_int
 
 from ._library import board_lib
 
@@ -21,6 +21,10 @@ board_lib.board_get_reward_death.restype = c_float
 board_lib.board_get_reward_step.argtypes = []
 board_lib.board_get_reward_step.restype = c_float
 
+# float board_get_reward(int result)
+board_lib.board_get_reward.argtypes = [c_int]
+board_lib.board_get_reward.restype = c_float
+
 # Load constants once from the C library
 REWARD_GREEN_APPLE: float = float(board_lib.board_get_reward_green_apple())
 REWARD_RED_APPLE: float = float(board_lib.board_get_reward_red_apple())
@@ -0,0 +1,222 @@
+"""
+VecGameBoard Python Wrapper
+
+Drives many C boards with a single foreign call per step. Inputs and outputs
+live in preallocated ``array.array`` buffers shared with the C engine, so
+they can be wrapped zero-copy (e.g. ``numpy.frombuffer``) by callers that
+want vectorised math.
+"""
+
+from array import array
+from ctypes import (
+    POINTER,
+    Structure,
+    c_float,
+    c_int,
+    c_ubyte,
+    c_ulonglong,
+    c_ushort,
+    c_void_p,
+    cast,
+)
+from typing import Iterable
+
+from ._library import board_lib
+from ._types import BoardEngine
+
+
+class _BatchOut(Structure):
+    """Mirror of t_batch_out (caller-owned output buffers)."""
+
+    _fields_ = [
+        ("states", POINTER(c_ushort)),
+        ("rewards", POINTER(c_float)),
+        ("dones", POINTER(c_ubyte)),
+        ("lengths", POINTER(c_int)),
+        ("max_lengths", POINTER(c_int)),
+    ]
+
+
+# Define C function signatures
+def _setup_c_functions() -> None:
+    """Configure C function signatures and return types."""
+
+    # BoardBatch* board_batch_create(int count, int size)
+    board_lib.board_batch_create.argtypes = [c_int, c_int]
+    board_lib.board_batch_create.restype = c_void_p
+
+    # BoardBatch* board_batch_create_engine(int count, int size, int engine)
+    board_lib.board_batch_create_engine.argtypes = [c_int, c_int, c_int]
+    board_lib.board_batch_create_engine.restype = c_void_p
+
+    # void board_batch_destroy(BoardBatch* batch)
+    board_lib.board_batch_destroy.argtypes = [c_void_p]
+    board_lib.board_batch_destroy.restype = None
+
+    # int board_batch_get_size(const BoardBatch* batch)
+    board_lib.board_batch_get_size.argtypes = [c_void_p]
+    board_lib.board_batch_get_size.restype = c_int
+
+    # void board_batch_set_max_moves(BoardBatch* batch, int max_moves)
+    board_lib.board_batch_set_max_moves.argtypes = [c_void_p, c_int]
+    board_lib.board_batch_set_max_moves.restype = None
+
+    # void board_batch_seed(BoardBatch* batch, unsigned long long seed)
+    board_lib.board_batch_seed.argtypes = [c_void_p, c_ulonglong]
+    board_lib.board_batch_seed.restype = None
+
+    # void board_batch_reset(BoardBatch* batch, unsigned short* states)
+    board_lib.board_batch_reset.argtypes = [c_void_p, POINTER(c_ushort)]
+    board_lib.board_batch_reset.restype = None
+
+    # int board_batch_step(BoardBatch* batch, const int* actions,
+    #                      BatchOut* out)
+    board_lib.board_batch_step.argtypes = [
+        c_void_p,
+        POINTER(c_int),
+        POINTER(_BatchOut),
+    ]
+    board_lib.board_batch_step.restype = c_int
+
+
+_setup_c_functions()
+
+
+def _pointer(buffer: array, ctype):
+    """Return a ctypes pointer aliasing an ``array.array`` buffer."""
+    return cast((ctype * len(buffer)).from_buffer(buffer), POINTER(ctype))
+
+
+class VecGameBoard:
+    """
+    A batch of independent boards stepped together in C.
+
+    Finished boards (death or ``max_steps`` reached) are reset automatically
+    and report the first state of their next episode; ``dones`` tells which
+    environments ended and why (see ``DoneFlag``), while ``lengths`` and
+    ``max_lengths`` keep the final figures of the episode that just ended.
+
+    The buffers returned by ``reset``/``step`` are reused on every call.
+
+    Example:
+        >>> envs = VecGameBoard(256, size=10, max_steps=500)
+        >>> states = envs.reset()
+        >>> states, rewards, dones = envs.step([0] * envs.num_envs)
+    """
+
+    __slots__ = (
+        "_batch",
+        "_out",
+        "_actions_ptr",
+        "_states_ptr",
+        "num_envs",
+        "size",
+        "actions",
+        "states",
+        "rewards",
+        "dones",
+        "lengths",
+        "max_lengths",
+    )
+
+    def __init__(
+        self,
+        num_envs: int,
+        size: int = 10,
+        max_steps: int | None = None,
+        seed: int | None = None,
+        engine: int = BoardEngine.GRID,
+    ) -> None:
+        """
+        Create ``num_envs`` boards of the given size.
+
+        Args:
+            num_envs: Number of boards in the batch (must be positive)
+            size: Board size (8-20, defaults to 10 if invalid)
+            max_steps: Truncate episodes after this many moves (None = never)
+            seed: Seed board ``i`` with ``seed + i`` (None = time based)
+            engine: Storage engine of every board (see BoardEngine)
+
+        Raises:
+            ValueError: If num_envs is not positive
+            MemoryError: If batch allocation fails
+        """
+        if num_envs <= 0:
+            raise ValueError("num_envs must be positive")
+        self._batch = board_lib.board_batch_create_engine(
+            num_envs, size, engine
+        )
+        if not self._batch:
+            raise MemoryError("Failed to allocate memory for board batch")
+        if max_steps is not None:
+            board_lib.board_batch_set_max_moves(self._batch, max_steps)
+        if seed is not None:
+            self.seed(seed)
+
+        self.num_envs = num_envs
+        self.size = board_lib.board_batch_get_size(self._batch)
+        self.actions = array("i", bytes(4 * num_envs))
+        self.states = array("H", bytes(2 * num_envs))
+        self.rewards = array("f", bytes(4 * num_envs))
+        self.dones = array("B", bytes(num_envs))
+        self.lengths = array("i", bytes(4 * num_envs))
+        self.max_lengths = array("i", bytes(4 * num_envs))
+
+        self._actions_ptr = _pointer(self.actions, c_int)
+        self._states_ptr = _pointer(self.states, c_ushort)
+        self._out = _BatchOut(
+            self._states_ptr,
+            _pointer(self.rewards, c_float),
+            _pointer(self.dones, c_ubyte),
+            _pointer(self.lengths, c_int),
+            _pointer(self.max_lengths, c_int),
+        )
+
+    def __del__(self) -> None:
+        """Free memory when the batch is destroyed."""
+        if getattr(self, "_batch", None):
+            board_lib.board_batch_destroy(self._batch)
+            self._batch = None
+
+    def __len__(self) -> int:
+        """Return the number of environments."""
+        return self.num_envs
+
+    def __repr__(self) -> str:
+        """Return string representation of VecGameBoard."""
+        return f"<VecGameBoard envs={self.num_envs} size={self.size}>"
+
+    def __enter__(self) -> "VecGameBoard":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit with automatic cleanup."""
+        self.__del__()
+
+    def seed(self, seed: int) -> None:
+        """Reseed every board (board ``i`` gets ``seed + i``)."""
+        board_lib.board_batch_seed(self._batch, seed & 0xFFFFFFFFFFFFFFFF)
+
+    def reset(self) -> array:
+        """Reset every board and return the initial states buffer."""
+        board_lib.board_batch_reset(self._batch, self._states_ptr)
+        return self.states
+
+    def step(
+        self, actions: Iterable[int] | None = None
+    ) -> tuple[array, array, array]:
+        """
+        Advance every board by one move.
+
+        Args:
+            actions: One direction per board. Omit it (or pass ``actions``
+                itself) to use values already written into ``self.actions``.
+
+        Returns:
+            tuple[array, array, array]: (next_states, rewards, dones)
+        """
+        if actions is not None and actions is not self.actions:
+            self.actions[:] = array("i", actions)
+        board_lib.board_batch_step(self._batch, self._actions_ptr, self._out)
+        return self.states, self.rewards, self.dones
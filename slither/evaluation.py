@@ -0,0 +1,465 @@
+"""Seeded, multi-process evaluation of frozen models."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import random
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from statistics import NormalDist, fmean, quantiles, stdev
+
+from .agent import BINARY_SUFFIX, QLearningAgent
+from .core._types import Actions, BoardEngine
+from .core.board import GameBoard
+from .policy import PolicyAgent, is_policy_file
+
+__all__ = [
+    "DEATH_CAUSES",
+    "Episodes",
+    "compare",
+    "describe",
+    "discover_models",
+    "evaluate",
+    "evaluate_many",
+    "load_cache",
+    "load_policy",
+    "model_digest",
+    "paired_difference",
+    "save_cache",
+    "summarize",
+    "tournament",
+]
+
+# Outcome of an episode that hit the step limit instead of dying.
+MAX_STEPS = -1
+
+DEATH_CAUSES = {
+    Actions.HIT_WALL: "HIT_WALL",
+    Actions.HIT_SELF: "HIT_SELF",
+    Actions.LENGTH_ZERO: "LENGTH_ZERO",
+    MAX_STEPS: "MAX_STEPS",
+}
+
+METRICS = ("length", "max_length", "steps", "reward")
+
+# Tournament results cache, kept next to the checkpoints it describes.
+CACHE_NAME = ".tournament-cache.json"
+CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Episodes:
+    """
+    Per-episode results of one model, in episode order.
+
+    Episode ``i`` was played with seed ``seed + i``, so two Episodes from
+    the same seed and count line up episode by episode.
+    """
+
+    seed: int
+    length: array
+    max_length: array
+    steps: array
+    reward: array
+    cause: array
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+
+def load_policy(path: str | Path) -> PolicyAgent:
+    """
+    Frozen greedy policy of a saved model: a compiled policy file as is,
+    or a JSON/binary Q-table compiled with PolicyAgent.from_agent.
+    """
+    if is_policy_file(path):
+        return PolicyAgent.load(path)
+    agent = QLearningAgent()
+    agent.load_model(path)
+    return PolicyAgent.from_agent(agent)
+
+
+# ----------------------------------------------------------------------
+def _play_chunk(
+    masks: bytes,
+    num_actions: int,
+    first_seed: int,
+    count: int,
+    board_kwargs: dict[str, int],
+    max_steps: int,
+) -> tuple[array, ...]:
+    policy = PolicyAgent(masks, num_actions)
+    board = GameBoard(**board_kwargs)
+    columns = (array("H"), array("H"), array("I"), array("d"), array("b"))
+    length, max_length, steps, reward, cause = columns
+    step = board.step
+    select = policy.select_action
+    for seed in range(first_seed, first_seed + count):
+        # Board and tie-breaks both restart from the episode's seed: the
+        # same episode always sees the same snake, apples and draws.
+        board.seed(seed)
+        board.reset()
+        policy.rng = random.Random(seed)
+        state = board.state
+        total = 0.0
+        done = False
+        moves = 0
+        while not done and moves < max_steps:
+            state, gain, done = step(select(state))
+            total += gain
+            moves += 1
+        status = board.status()
+        length.append(status.length)
+        max_length.append(status.max_length)
+        steps.append(moves)
+        reward.append(total)
+        result = board.last_step.result if done else MAX_STEPS
+        if (
+            result == Actions.ATE_RED_APPLE
+            and status.game_over
+            and status.length == 1
+        ):
+            # The engine reports ATE_RED_APPLE on the move that kills a
+            # length-1 snake (leaving its length at 1): a length-zero death.
+            result = Actions.LENGTH_ZERO
+        cause.append(result)
+    return columns
+
+
+def evaluate_many(
+    policies: list[PolicyAgent],
+    episodes: int,
+    workers: int | None = None,
+    seed: int = 0,
+    size: int = 10,
+    max_steps: int = 500,
+    engine: int = BoardEngine.GRID,
+) -> list[Episodes]:
+    """
+    evaluate() several policies on the same episodes with one pool, so
+    the workers stay busy across models.
+
+    Returns:
+        list[Episodes]: One per policy, in order
+
+    Raises:
+        ValueError: If episodes or workers is not positive
+    """
+    if episodes <= 0:
+        raise ValueError("episodes must be positive")
+    workers = workers or os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("workers must be positive")
+    board_kwargs = {"size": size, "engine": engine}
+    # A few chunks per worker keep the pool busy when episodes run long.
+    chunks = min(episodes, workers * 4 if workers > 1 else 1)
+    jobs = []
+    for policy in policies:
+        masks = policy.masks.tobytes()
+        start = seed
+        for index in range(chunks):
+            count = episodes // chunks + (index < episodes % chunks)
+            jobs.append(
+                (masks, policy.num_actions, start, count, board_kwargs,
+                 max_steps)
+            )
+            start += count
+    if workers == 1:
+        parts = [_play_chunk(*job) for job in jobs]
+    else:
+        with multiprocessing.get_context().Pool(workers) as pool:
+            parts = pool.starmap(_play_chunk, jobs)
+    results = []
+    for first in range(0, len(parts), chunks):
+        columns = parts[first]
+        for part in parts[first + 1:first + chunks]:
+            for column, values in zip(columns, part):
+                column.extend(values)
+        results.append(Episodes(seed, *columns))
+    return results
+
+
+def evaluate(
+    policy: PolicyAgent,
+    episodes: int,
+    workers: int | None = None,
+    seed: int = 0,
+    size: int = 10,
+    max_steps: int = 500,
+    engine: int = BoardEngine.GRID,
+) -> Episodes:
+    """
+    Play ``episodes`` seeded episodes of ``policy`` across a process pool.
+
+    Episode ``i`` reseeds the board and the tie-break generator with
+    ``seed + i``, so results do not depend on the number of workers and
+    every model evaluated with the same seed faces the same episodes.
+
+    Args:
+        policy: Frozen policy to play (see load_policy)
+        episodes: Number of episodes
+        workers: Processes; None uses every CPU, 1 plays in this process
+        seed: Seed of the first episode
+        size: Board size
+        max_steps: Step limit per episode
+        engine: Board storage engine
+
+    Returns:
+        Episodes: Per-episode results, in episode order
+
+    Raises:
+        ValueError: If episodes or workers is not positive
+    """
+    return evaluate_many(
+        [policy], episodes, workers, seed, size, max_steps, engine
+    )[0]
+
+
+# ----------------------------------------------------------------------
+def _z(confidence: float) -> float:
+    return NormalDist().inv_cdf((1.0 + confidence) / 2.0)
+
+
+def describe(values, confidence: float = 0.95) -> dict[str, object]:
+    """
+    Mean, spread and percentiles of a sample.
+
+    Returns:
+        dict: ``mean``, ``stdev``, ``median``, ``p5``, ``p95`` and ``ci``,
+        the normal-approximation confidence interval of the mean
+    """
+    values = list(values)
+    mean = fmean(values)
+    spread = stdev(values) if len(values) > 1 else 0.0
+    margin = _z(confidence) * spread / math.sqrt(len(values))
+    if len(values) > 1:
+        cuts = quantiles(values, n=20, method="inclusive")
+        p5, median, p95 = cuts[0], cuts[9], cuts[18]
+    else:
+        p5 = median = p95 = values[0]
+    return {
+        "mean": mean,
+        "stdev": spread,
+        "median": median,
+        "p5": p5,
+        "p95": p95,
+        "ci": [mean - margin, mean + margin],
+    }
+
+
+def summarize(
+    episodes: Episodes,
+    confidence: float = 0.95,
+) -> dict[str, object]:
+    """
+    JSON-ready report of an evaluation.
+
+    Returns:
+        dict: ``episodes``, ``seed``, ``confidence``, one describe() entry
+        per metric under ``metrics`` and the episode count of every death
+        cause (MAX_STEPS for episodes cut at the step limit) under
+        ``deaths``
+    """
+    deaths = dict.fromkeys(DEATH_CAUSES.values(), 0)
+    for cause in episodes.cause:
+        deaths[DEATH_CAUSES[cause]] += 1
+    return {
+        "episodes": len(episodes),
+        "seed": episodes.seed,
+        "confidence": confidence,
+        "metrics": {
+            name: describe(getattr(episodes, name), confidence)
+            for name in METRICS
+        },
+        "deaths": deaths,
+    }
+
+
+def paired_difference(
+    baseline,
+    candidate,
+    confidence: float = 0.95,
+) -> dict[str, object]:
+    """
+    Compare two samples episode by episode (candidate minus baseline).
+
+    With common random numbers both models face the same episodes, so
+    the apple-spawn luck they share cancels out of every difference: the
+    spread of the differences is what decides significance, not the much
+    larger spread of each model's own results.
+
+    Returns:
+        dict: ``mean`` difference, its ``stdev`` and ``ci``, the
+        two-sided normal ``z`` and ``p_value`` of "no difference",
+        ``wins``/``losses``/``ties`` of the candidate, and
+        ``variance_reduction``: how many times more episodes the same
+        confidence would need from independent episode streams (None
+        when the differences do not vary)
+    """
+    baseline = list(baseline)
+    candidate = list(candidate)
+    diffs = [b - a for a, b in zip(baseline, candidate)]
+    count = len(diffs)
+    mean = fmean(diffs)
+    spread = stdev(diffs) if count > 1 else 0.0
+    error = spread / math.sqrt(count)
+    if error:
+        z = mean / error
+        p_value = 2.0 * (1.0 - NormalDist().cdf(abs(z)))
+    else:
+        z = None
+        p_value = 1.0 if mean == 0 else 0.0
+    reduction = None
+    if spread and count > 1:
+        unpaired = stdev(baseline) ** 2 + stdev(candidate) ** 2
+        reduction = unpaired / spread ** 2
+    margin = _z(confidence) * error
+    return {
+        "mean": mean,
+        "stdev": spread,
+        "ci": [mean - margin, mean + margin],
+        "z": z,
+        "p_value": p_value,
+        "wins": sum(1 for diff in diffs if diff > 0),
+        "losses": sum(1 for diff in diffs if diff < 0),
+        "ties": sum(1 for diff in diffs if diff == 0),
+        "variance_reduction": reduction,
+    }
+
+
+def compare(
+    baseline: Episodes,
+    candidate: Episodes,
+    confidence: float = 0.95,
+) -> dict[str, dict[str, object]]:
+    """
+    paired_difference() of every metric of two evaluations.
+
+    Raises:
+        ValueError: If the evaluations were not played on the same
+            seeded episodes
+    """
+    if baseline.seed != candidate.seed or len(baseline) != len(candidate):
+        raise ValueError("evaluations must share their seed and episodes")
+    return {
+        name: paired_difference(
+            getattr(baseline, name), getattr(candidate, name), confidence
+        )
+        for name in METRICS
+    }
+
+
+# ----------------------------------------------------------------------
+def discover_models(directory: str | Path) -> list[Path]:
+    """
+    Every model file in ``directory``: JSON and binary Q-tables and
+    compiled policies, by name; hidden files (such as the tournament
+    cache) are skipped.
+    """
+    models = []
+    for path in sorted(Path(directory).iterdir()):
+        if path.name.startswith(".") or not path.is_file():
+            continue
+        if path.suffix in (".json", BINARY_SUFFIX) or is_policy_file(path):
+            models.append(path)
+    return models
+
+
+def model_digest(path: str | Path) -> str:
+    """SHA-256 of a model file: its identity in the tournament cache."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def load_cache(path: str | Path) -> dict[str, dict[str, object]]:
+    """
+    Results saved by save_cache(); empty if the file is missing or was
+    written by another cache version.
+    """
+    file_path = Path(path)
+    if not file_path.exists():
+        return {}
+    data = json.loads(file_path.read_text())
+    if data.get("version") != CACHE_VERSION:
+        return {}
+    return data["results"]
+
+
+def save_cache(path: str | Path, cache: dict[str, dict[str, object]]) -> Path:
+    """Write the tournament results cache as JSON."""
+    file_path = Path(path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"version": CACHE_VERSION, "results": cache}
+    file_path.write_text(json.dumps(data, indent=2) + "\n")
+    return file_path
+
+
+def tournament(
+    models: list[Path],
+    episodes: int,
+    workers: int | None = None,
+    seed: int = 0,
+    size: int = 10,
+    max_steps: int = 500,
+    engine: int = BoardEngine.GRID,
+    confidence: float = 0.95,
+    metric: str = "length",
+    cache: dict[str, dict[str, object]] | None = None,
+) -> list[dict[str, object]]:
+    """
+    Rank ``models`` on one shared set of seeded episodes.
+
+    A model's summary is cached under its content digest and the episode
+    settings, so a re-run only plays models that are new or changed since
+    the cache was filled; those are all played in one evaluate_many() pool.
+
+    Args:
+        models: Model files (see discover_models)
+        episodes, workers, seed, size, max_steps, engine: As evaluate()
+        confidence: Confidence level of the summaries
+        metric: Metric of METRICS whose mean ranks the models
+        cache: Summaries by key, filled in place (see load_cache)
+
+    Returns:
+        list[dict]: One entry per model, best first: ``rank``, ``model``,
+        ``digest``, ``cached`` (True when it was not played this time)
+        and its summarize() report
+
+    Raises:
+        ValueError: If metric is unknown
+    """
+    if metric not in METRICS:
+        raise ValueError(f"metric must be one of {', '.join(METRICS)}")
+    if cache is None:
+        cache = {}
+    settings = (
+        f"seed={seed} episodes={episodes} size={size} "
+        f"max_steps={max_steps} engine={engine} confidence={confidence}"
+    )
+    entries = []
+    pending: dict[str, Path] = {}
+    for path in models:
+        digest = model_digest(path)
+        key = f"{digest} {settings}"
+        entries.append({"model": str(path), "digest": digest,
+                        "cached": key in cache, "key": key})
+        if key not in cache:
+            pending.setdefault(key, path)
+    if pending:
+        results = evaluate_many(
+            [load_policy(path) for path in pending.values()],
+            episodes, workers, seed, size, max_steps, engine,
+        )
+        for key, result in zip(pending, results):
+            cache[key] = summarize(result, confidence)
+    for entry in entries:
+        entry.update(cache[entry.pop("key")])
+    entries.sort(key=lambda entry: -entry["metrics"][metric]["mean"])
+    return [
+        {"rank": rank, **entry}
+        for rank, entry in enumerate(entries, start=1)
+    ]
@@ -0,0 +1,567 @@
+"""Parallel training on one shared Q-table: processes or threads."""
+
+from __future__ import annotations
+
+import copy
+import multiprocessing
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Callable
+
+from .core._types import BoardEngine
+from .core.board import GameBoard
+from .core.qlearn import QTABLE_STATES
+from .qtable import DenseQTable
+from .ring import TransitionRing
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .agent import QLearningAgent
+
+__all__ = [
+    "gil_enabled",
+    "train_actor_learner",
+    "train_parallel",
+    "train_threaded",
+]
+
+EpisodeFn = Callable[[GameBoard, "QLearningAgent", int, bool], dict]
+
+
+def _table_bytes(num_actions: int) -> int:
+    return 8 * QTABLE_STATES * num_actions + QTABLE_STATES
+
+
+def _attach_table(memory: SharedMemory, num_actions: int) -> DenseQTable:
+    # float64 values first (8-byte aligned at the start of the segment),
+    # then one visited byte per state.
+    size = 8 * QTABLE_STATES * num_actions
+    table = DenseQTable.__new__(DenseQTable)
+    table.num_actions = num_actions
+    table.values = memory.buf[:size].cast("d")
+    table.visited = memory.buf[size:size + QTABLE_STATES]
+    return table
+
+
+def _detach_table(table: DenseQTable) -> None:
+    # Views must be released before the segment can be closed.
+    table.values.release()
+    table.visited.release()
+
+
+def _open_shared(name: str) -> SharedMemory:
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:  # pragma: no cover - Python < 3.13
+        # Workers share the parent's resource tracker, so registering the
+        # name again is a no-op and the parent's unlink() still clears it.
+        return SharedMemory(name=name)
+
+
+def _merge_histories(
+    agent: "QLearningAgent",
+    histories: list[list[dict[str, float]]],
+) -> list[dict[str, float]]:
+    # The agent keeps the least decayed epsilon; stats are interleaved
+    # round-robin and tagged with the process that played them.
+    finals = [history[-1]["epsilon"] for history in histories if history]
+    if finals and agent.learning_enabled:
+        agent.epsilon = max(finals)
+    merged = []
+    for turn in range(max(map(len, histories), default=0)):
+        for index, history in enumerate(histories):
+            if turn < len(history):
+                merged.append({**history[turn], "worker": index})
+    return merged
+
+
+def _worker(
+    name: str,
+    settings: dict[str, object],
+    episodes: int,
+    seed: int,
+    board_kwargs: dict[str, int],
+    max_steps: int,
+    play: EpisodeFn | None,
+) -> list[dict[str, float]]:
+    from .agent import QLearningAgent
+
+    memory = _open_shared(name)
+    agent = QLearningAgent(dense=True)
+    agent._apply_hyperparameters(settings)
+    agent.q_table = _attach_table(memory, agent.num_actions)
+    random.seed(seed)
+    board = GameBoard(seed=seed, **board_kwargs)
+    if play is None:
+        history = agent.train_native(board, episodes, max_steps, seed=seed)
+    else:
+        history = []
+        learn = agent.learning_enabled
+        for _ in range(episodes):
+            stats = play(board, agent, max_steps, learn)
+            agent.decay_epsilon()
+            stats["epsilon"] = agent.epsilon
+            history.append(stats)
+    # Not in a finally: a traceback would still hold views of the segment,
+    # and the process exit unmaps it anyway.
+    _detach_table(agent.q_table)
+    memory.close()
+    return history
+
+
+def train_parallel(
+    agent: "QLearningAgent",
+    episodes: int,
+    workers: int,
+    max_steps: int = 500,
+    size: int = 10,
+    seed: int | None = None,
+    engine: int = BoardEngine.GRID,
+    play: EpisodeFn | None = None,
+) -> list[dict[str, float]]:
+    """
+    Train ``agent`` with ``workers`` processes sharing one Q-table.
+
+    The table is copied into a shared memory segment that every worker
+    maps as a DenseQTable. Each worker plays its share of the episodes on
+    its own GameBoard with its own seed and epsilon schedule (starting
+    from ``agent.epsilon``) and writes its updates straight into the
+    shared table without locks, Hogwild-style: a racing update may be
+    lost, which tabular Q-learning tolerates, and no worker ever waits on
+    another. At the end the table is copied back into ``agent``.
+
+    Args:
+        agent: Agent to train (dict or dense table, not memory-mapped)
+        episodes: Episodes played in total, split evenly across workers
+        workers: Number of processes
+        max_steps: Step limit per episode
+        size: Board size
+        seed: Base seed; worker ``i`` uses ``seed + i``
+        engine: Board storage engine
+        play: ``play(board, agent, max_steps, learn) -> stats`` running
+            one episode in Python (train.py's run_episode); None plays
+            the episodes in C with train_native
+
+    Returns:
+        list[dict[str, float]]: Per-episode stats (with the ``worker``
+        index and the ``epsilon`` after that episode), interleaved across
+        workers in round-robin order
+
+    Raises:
+        ValueError: If workers is not positive, the agent is a compiled
+            policy or its table is read-only, or a C run is asked of a
+            symmetric agent
+    """
+    if workers <= 0:
+        raise ValueError("workers must be positive")
+    if not hasattr(agent, "q_table"):
+        raise ValueError("a compiled policy has no Q-table to share")
+    if getattr(agent.q_table, "readonly", False):
+        raise ValueError("A memory-mapped Q-table is read-only")
+    if play is None and agent.symmetric:
+        raise ValueError("train_native does not canonicalise states")
+    if seed is None:
+        seed = random.getrandbits(32)
+    num_actions = agent.num_actions
+    memory = SharedMemory(create=True, size=_table_bytes(num_actions))
+    table = _attach_table(memory, num_actions)
+    try:
+        table.update(agent.q_table)
+        settings = agent._hyperparameters()
+        board_kwargs = {"size": size, "engine": engine}
+        jobs = [
+            (
+                memory.name,
+                settings,
+                episodes // workers + (index < episodes % workers),
+                seed + index,
+                board_kwargs,
+                max_steps,
+                play,
+            )
+            for index in range(workers)
+        ]
+        with multiprocessing.get_context().Pool(workers) as pool:
+            histories = pool.starmap(_worker, jobs)
+        if agent.dense:
+            memoryview(agent.q_table.values)[:] = table.values
+            agent.q_table.visited[:] = table.visited
+        else:
+            agent.q_table.clear()
+            agent.q_table.update(table.items())
+    finally:
+        # Also when a worker failed: the segment must not outlive the run.
+        _detach_table(table)
+        try:
+            memory.close()
+        finally:
+            memory.unlink()
+
+    return _merge_histories(agent, histories)
+
+
+# ----------------------------------------------------------------------
+# Actor-learner: actors play on a snapshot of the policy and stream their
+# transitions through one TransitionRing each to a single learner.
+#
+# Segment layout: a 64-byte header holding the policy version (a seqlock:
+# odd while the learner writes the table), the float64 policy table, then
+# the rings.
+_POLICY_AT = 64
+
+
+def _policy_views(memory: SharedMemory, num_actions: int):
+    end = _POLICY_AT + 8 * QTABLE_STATES * num_actions
+    return memory.buf[:8].cast("Q"), memory.buf[_POLICY_AT:end].cast("d")
+
+
+def _publish_policy(version: memoryview, policy: memoryview, values) -> None:
+    # Seqlock writer: the version is odd while the table is being written.
+    version[0] += 1
+    policy[:] = memoryview(values)
+    version[0] += 1
+
+
+def _read_policy(
+    version: memoryview, policy: memoryview, local: memoryview
+) -> int:
+    # Seqlock reader: retry until a copy starts and ends on the same even
+    # version, i.e. no publication overlapped it.
+    while True:
+        stamp = version[0]
+        if stamp & 1:
+            time.sleep(0.0005)
+            continue
+        local[:] = policy
+        if version[0] == stamp:
+            return stamp
+
+
+def _ring(memory: SharedMemory, num_actions: int, index: int, capacity: int):
+    size = TransitionRing.nbytes(capacity)
+    start = _POLICY_AT + 8 * QTABLE_STATES * num_actions + index * size
+    return TransitionRing(memory.buf[start:start + size], capacity)
+
+
+def _actor(
+    name: str,
+    settings: dict[str, object],
+    episodes: int,
+    seed: int,
+    board_kwargs: dict[str, int],
+    max_steps: int,
+    index: int,
+    capacity: int,
+) -> list[dict[str, float]]:
+    from .agent import QLearningAgent
+
+    memory = _open_shared(name)
+    version, policy = _policy_views(memory, int(settings["num_actions"]))
+    ring = _ring(memory, int(settings["num_actions"]), index, capacity)
+    agent = QLearningAgent(dense=True)
+    agent._apply_hyperparameters(settings)
+    local = memoryview(agent.q_table.values)
+    random.seed(seed)
+    board = GameBoard(seed=seed, **board_kwargs)
+    seen = -1
+    history = []
+    for _ in range(episodes):
+        if version[0] != seen:
+            seen = _read_policy(version, policy, local)
+        board.reset()
+        state = board.state
+        total_reward = 0.0
+        steps = 0
+        while steps < max_steps:
+            action = agent.select_action(state)
+            next_state, reward, done = board.step(action)
+            ring.push(state, action, reward, next_state, done)
+            total_reward += reward
+            state = next_state
+            steps += 1
+            if done:
+                break
+        agent.decay_epsilon()
+        status = board.status()
+        history.append({
+            "steps": steps,
+            "reward": total_reward,
+            "length": status.length,
+            "max_length": status.max_length,
+            "epsilon": agent.epsilon,
+        })
+    ring.release()
+    local.release()
+    version.release()
+    policy.release()
+    memory.close()
+    return history
+
+
+def train_actor_learner(
+    agent: "QLearningAgent",
+    episodes: int,
+    actors: int,
+    max_steps: int = 500,
+    size: int = 10,
+    seed: int | None = None,
+    engine: int = BoardEngine.GRID,
+    batch_size: int = 256,
+    ring_capacity: int = 1 << 16,
+    sync_every: int = 8,
+) -> tuple[list[dict[str, float]], dict[str, float]]:
+    """
+    Train ``agent`` with ``actors`` playing processes and one learner.
+
+    Each actor process plays its share of the episodes with its own board,
+    seed and epsilon schedule, choosing moves from a private copy of the
+    policy and pushing every transition into its own TransitionRing in
+    shared memory. The calling process is the learner: it drains the rings
+    in batches into ``agent.update_batch`` and, every ``sync_every``
+    batches, publishes the table to the shared policy, which actors copy
+    at the start of their next episode. Simulation and learning thus run
+    on separate cores; a full ring blocks its actor (backpressure).
+
+    Args:
+        agent: Agent to train (its table must be writable)
+        episodes: Episodes played in total, split evenly across actors
+        actors: Number of actor processes
+        max_steps: Step limit per episode
+        size: Board size
+        seed: Base seed; actor ``i`` uses ``seed + i``
+        engine: Board storage engine
+        batch_size: Most transitions taken from one ring per update
+        ring_capacity: Slots per ring
+        sync_every: Learner batches between policy publications
+
+    Returns:
+        tuple: Per-episode stats (tagged with ``worker``, round-robin
+        across actors) and throughput counters: ``transitions``,
+        ``updates`` (batches), ``syncs``, ``stalls`` (pushes that found a
+        full ring), ``seconds`` and ``transitions_per_second``
+
+    Raises:
+        ValueError: If actors is not positive, the agent is a compiled
+            policy or its table is read-only
+        RuntimeError: If an actor process dies before finishing
+    """
+    if actors <= 0:
+        raise ValueError("actors must be positive")
+    if not hasattr(agent, "q_table"):
+        raise ValueError("a compiled policy has no Q-table to share")
+    if getattr(agent.q_table, "readonly", False):
+        raise ValueError("A memory-mapped Q-table is read-only")
+    if seed is None:
+        seed = random.getrandbits(32)
+    num_actions = agent.num_actions
+    learner = agent
+    if not agent.dense:
+        # Publishing copies the table as one block, so learn on a dense one.
+        learner = type(agent)(dense=True)
+        learner._apply_hyperparameters(agent._hyperparameters())
+        learner.q_table.update(agent.q_table)
+    size_bytes = (
+        _POLICY_AT
+        + 8 * QTABLE_STATES * num_actions
+        + actors * TransitionRing.nbytes(ring_capacity)
+    )
+    memory = SharedMemory(create=True, size=size_bytes)
+    counters = {"transitions": 0, "updates": 0, "syncs": 0}
+    version, policy = _policy_views(memory, num_actions)
+    rings = [
+        _ring(memory, num_actions, index, ring_capacity)
+        for index in range(actors)
+    ]
+    try:
+        policy[:] = memoryview(learner.q_table.values)
+        settings = learner._hyperparameters()
+        board_kwargs = {"size": size, "engine": engine}
+        jobs = [
+            (
+                memory.name,
+                settings,
+                episodes // actors + (index < episodes % actors),
+                seed + index,
+                board_kwargs,
+                max_steps,
+                index,
+                ring_capacity,
+            )
+            for index in range(actors)
+        ]
+        started = time.perf_counter()
+        others = set(multiprocessing.active_children())
+        with multiprocessing.get_context().Pool(actors) as pool:
+            # The pool replaces a worker that dies, but its task never
+            # completes: watch the original workers instead of waiting.
+            workers = set(multiprocessing.active_children()) - others
+            result = pool.starmap_async(_actor, jobs)
+            pending = 0
+            while True:
+                # Read before draining: once every actor has returned, an
+                # empty pass means nothing is left.
+                finished = result.ready()
+                drained = 0
+                for ring in rings:
+                    batch = ring.pop(batch_size)
+                    if batch is None:
+                        continue
+                    learner.update_batch(*batch)
+                    drained += len(batch[0])
+                    counters["updates"] += 1
+                    pending += 1
+                counters["transitions"] += drained
+                if pending >= sync_every:
+                    _publish_policy(version, policy, learner.q_table.values)
+                    counters["syncs"] += 1
+                    pending = 0
+                if drained == 0:
+                    if finished:
+                        break
+                    if not all(worker.is_alive() for worker in workers):
+                        raise RuntimeError("an actor process died")
+                    time.sleep(0.001)
+            histories = result.get()
+        counters["seconds"] = time.perf_counter() - started
+        counters["stalls"] = sum(ring.stalls for ring in rings)
+    finally:
+        # Also when an actor failed: the segment must not outlive the run.
+        for ring in rings:
+            ring.release()
+        version.release()
+        policy.release()
+        try:
+            memory.close()
+        finally:
+            memory.unlink()
+
+    if learner is not agent:
+        agent.q_table.clear()
+        agent.q_table.update(learner.q_table.items())
+    counters["transitions_per_second"] = (
+        counters["transitions"] / counters["seconds"]
+        if counters["seconds"] else 0.0
+    )
+    return _merge_histories(agent, histories), counters
+
+
+# ----------------------------------------------------------------------
+# Threads: one board per thread against one shared agent, in-process.
+def gil_enabled() -> bool:
+    """False only on a free-threaded build running without the GIL."""
+    is_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_enabled is None else is_enabled()
+
+
+def _thread(
+    agent: "QLearningAgent",
+    episodes: int,
+    seed: int,
+    board_kwargs: dict[str, int],
+    max_steps: int,
+    play: EpisodeFn | None,
+) -> list[dict[str, float]]:
+    board = GameBoard(seed=seed, **board_kwargs)
+    if play is None:
+        return agent.train_native(board, episodes, max_steps, seed=seed)
+    history = []
+    learn = agent.learning_enabled
+    for _ in range(episodes):
+        stats = play(board, agent, max_steps, learn)
+        agent.decay_epsilon()
+        stats["epsilon"] = agent.epsilon
+        history.append(stats)
+    return history
+
+
+def train_threaded(
+    agent: "QLearningAgent",
+    episodes: int,
+    threads: int,
+    max_steps: int = 500,
+    size: int = 10,
+    seed: int | None = None,
+    engine: int = BoardEngine.GRID,
+    play: EpisodeFn | None = None,
+) -> list[dict[str, float]]:
+    """
+    Train or evaluate ``agent`` with ``threads`` threads in this process.
+
+    Every thread drives its own GameBoard (seeded ``seed + i``) through a
+    shallow copy of the agent: the Q-table is shared and written without
+    locks, Hogwild-style as in train_parallel, while the epsilon schedule
+    and the random.Random behind every draw belong to the thread, so no
+    two threads contend on one generator. A frozen agent or a PolicyAgent
+    with ``play`` gives a parallel evaluation.
+
+    C episodes (``play`` None) run with the GIL released, as every ctypes
+    call does, and so overlap on any build. Python episodes only overlap
+    on a free-threaded build (see gil_enabled); elsewhere the threads take
+    turns and the run costs about what a single thread would.
+
+    Args:
+        agent: Agent to train (dict or dense table, not memory-mapped) or
+            a PolicyAgent to evaluate
+        episodes: Episodes played in total, split evenly across threads
+        threads: Number of threads
+        max_steps: Step limit per episode
+        size: Board size
+        seed: Base seed; thread ``i`` uses ``seed + i``
+        engine: Board storage engine
+        play: ``play(board, agent, max_steps, learn) -> stats`` running
+            one episode in Python (train.py's run_episode); None plays
+            the episodes in C with train_native
+
+    Returns:
+        list[dict[str, float]]: Per-episode stats (with the ``worker``
+        index of the thread and the ``epsilon`` after that episode),
+        interleaved across threads in round-robin order
+
+    Raises:
+        ValueError: If threads is not positive, the agent's table is
+            read-only, or a C run is asked of a symmetric agent or of a
+            compiled policy
+    """
+    if threads <= 0:
+        raise ValueError("threads must be positive")
+    if getattr(getattr(agent, "q_table", None), "readonly", False):
+        raise ValueError("A memory-mapped Q-table is read-only")
+    if play is None and not hasattr(agent, "train_native"):
+        raise ValueError("a compiled policy needs a Python play function")
+    if play is None and agent.symmetric:
+        raise ValueError("train_native does not canonicalise states")
+    if seed is None:
+        seed = random.getrandbits(32)
+    shared = agent
+    if not getattr(agent, "dense", True):
+        # Dense rows exist up front, so no thread ever grows a shared dict.
+        shared = type(agent)(dense=True)
+        shared._apply_hyperparameters(agent._hyperparameters())
+        shared.q_table.update(agent.q_table)
+    locals_ = []
+    for index in range(threads):
+        local = copy.copy(shared)
+        local.rng = random.Random(seed + index)
+        local._np_rng = None
+        locals_.append(local)
+    board_kwargs = {"size": size, "engine": engine}
+    with ThreadPoolExecutor(threads) as pool:
+        futures = [
+            pool.submit(
+                _thread,
+                local,
+                episodes // threads + (index < episodes % threads),
+                seed + index,
+                board_kwargs,
+                max_steps,
+                play,
+            )
+            for index, local in enumerate(locals_)
+        ]
+        histories = [future.result() for future in futures]
+    if shared is not agent:
+        agent.q_table.clear()
+        agent.q_table.update(shared.q_table.items())
+    return _merge_histories(agent, histories)
@@ -0,0 +1,222 @@
+"""Greedy policies compiled into a flat per-state action table."""
+
+from __future__ import annotations
+
+import random
+import struct
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, Sequence
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+from .core.qlearn import QTABLE_STATES
+from .symmetry import (
+    ACTION_FROM_CANONICAL,
+    CANONICAL_STATES,
+    CANONICAL_TRANSFORMS,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .agent import QLearningAgent
+
+__all__ = ["POLICY_MAGIC", "PolicyAgent", "is_policy_file"]
+
+POLICY_MAGIC = b"L2SP"
+POLICY_VERSION = 1
+
+# magic, version, num_actions, states (all little-endian)
+_HEADER = struct.Struct("<4sHHI")
+
+
+def is_policy_file(path: str | Path) -> bool:
+    """True if ``path`` starts with the compiled policy magic."""
+    with open(path, "rb") as handle:
+        return handle.read(len(POLICY_MAGIC)) == POLICY_MAGIC
+
+
+def _tie_mask(values: Sequence[float]) -> int:
+    best = max(values)
+    mask = 0
+    for action, value in enumerate(values):
+        if value == best:
+            mask |= 1 << action
+    return mask
+
+
+class PolicyAgent:
+    """
+    Frozen greedy agent serving actions from a compiled table.
+
+    ``masks[state]`` holds the set of greedy actions of every state as a
+    bit mask (bit ``a`` set when action ``a`` ties for the best Q-value;
+    all bits for a state the model never saw), so an action is one index
+    plus, only on ties, one random draw. It plays exactly like the source
+    agent after ``set_learning(False)`` and stands in for it wherever a
+    frozen agent is driven (``select_action``, ``select_actions``; the
+    learning calls are no-ops).
+
+    Attributes:
+        num_actions: Actions per state
+        masks: One greedy-action bit mask per state
+        epsilon: Always 0.0
+        learning_enabled: Always False
+        rng: Source of the tie-break draws (the ``random`` module unless
+            given a random.Random)
+    """
+
+    __slots__ = ("num_actions", "masks", "epsilon", "learning_enabled",
+                 "rng", "_choices", "_nth", "_counts", "_np_rng")
+
+    def __init__(self, masks: Sequence[int], num_actions: int = 4) -> None:
+        """
+        Args:
+            masks: Greedy-action bit mask of every state
+            num_actions: Actions per state (at most 8)
+
+        Raises:
+            ValueError: If a mask is empty or names an unknown action
+        """
+        if not 0 < num_actions <= 8:
+            raise ValueError("num_actions must be between 1 and 8")
+        full = (1 << num_actions) - 1
+        if any(not 0 < mask <= full for mask in masks):
+            raise ValueError("every state needs at least one valid action")
+        self.num_actions = num_actions
+        self.masks = array("B", masks)
+        self.epsilon = 0.0
+        self.learning_enabled = False
+        self.rng = random
+        # Per mask: its actions, and the same flattened for NumPy lookups
+        # (_nth[mask * num_actions + k] is the k-th action of the mask).
+        per_mask = [
+            tuple(a for a in range(num_actions) if mask >> a & 1)
+            for mask in range(full + 1)
+        ]
+        self._choices = [per_mask[mask] for mask in self.masks]
+        self._nth = array("B", bytes(len(per_mask) * num_actions))
+        self._counts = array("B", map(len, per_mask))
+        for mask, actions in enumerate(per_mask):
+            for k, action in enumerate(actions):
+                self._nth[mask * num_actions + k] = action
+        self._np_rng = None
+
+    def __repr__(self) -> str:
+        ties = sum(1 for choices in self._choices if len(choices) > 1)
+        return f"<PolicyAgent states={len(self.masks)} ties={ties}>"
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_agent(cls, agent: "QLearningAgent") -> "PolicyAgent":
+        """Compile the greedy policy of ``agent`` (symmetric agents too)."""
+        table = agent.q_table
+        zeros = [0.0] * agent.num_actions
+        masks = []
+        for state in range(QTABLE_STATES):
+            row = state
+            if agent.symmetric:
+                row = CANONICAL_STATES[state]
+            mask = _tie_mask(table[row] if row in table else zeros)
+            if agent.symmetric:
+                offset = CANONICAL_TRANSFORMS[state] * agent.num_actions
+                mask = sum(
+                    1 << ACTION_FROM_CANONICAL[offset + action]
+                    for action in range(agent.num_actions)
+                    if mask >> action & 1
+                )
+            masks.append(mask)
+        return cls(masks, agent.num_actions)
+
+    # ------------------------------------------------------------------
+    def select_action(self, state: int, explore: bool = True) -> int:
+        """Greedy action of ``state``; ``explore`` is ignored."""
+        choices = self._choices[state]
+        if len(choices) == 1:
+            return choices[0]
+        return self.rng.choice(choices)
+
+    best_action = select_action
+
+    def select_actions(
+        self,
+        states: Sequence[int],
+        explore: bool = True,
+        out=None,
+    ) -> Sequence[int]:
+        """
+        Greedy action of every state (see QLearningAgent.select_actions).
+
+        With NumPy installed this is three array lookups and one bulk
+        random draw for the tie-breaks.
+        """
+        if np is None:
+            actions = out if out is not None else [0] * len(states)
+            for index, state in enumerate(states):
+                actions[index] = self.select_action(state)
+            return actions
+        if self._np_rng is None:
+            self._np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        masks = np.frombuffer(self.masks, dtype=np.uint8)[
+            np.asarray(states, dtype=np.intp)
+        ]
+        counts = np.frombuffer(self._counts, dtype=np.uint8)[masks]
+        picks = (self._np_rng.random(len(masks)) * counts).astype(np.intp)
+        offsets = masks.astype(np.intp) * self.num_actions + picks
+        actions = np.frombuffer(self._nth, dtype=np.uint8)[offsets]
+        if out is None:
+            return actions
+        np.frombuffer(out, dtype=np.intc)[:] = actions
+        return out
+
+    # ------------------------------------------------------------------
+    def update(self, *transition) -> None:
+        """No-op: a compiled policy does not learn."""
+
+    def update_batch(self, *transitions) -> None:
+        """No-op: a compiled policy does not learn."""
+
+    def decay_epsilon(self) -> None:
+        """No-op: a compiled policy never explores."""
+
+    def set_learning(self, enabled: bool) -> None:
+        """
+        Raises:
+            ValueError: If asked to learn
+        """
+        if enabled:
+            raise ValueError("a compiled policy cannot learn")
+
+    # ------------------------------------------------------------------
+    def save(self, path: str | Path) -> Path:
+        """Write the policy: a small header, then one mask byte per state."""
+        file_path = Path(path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        header = _HEADER.pack(
+            POLICY_MAGIC, POLICY_VERSION, self.num_actions, len(self.masks)
+        )
+        file_path.write_bytes(header + self.masks.tobytes())
+        return file_path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "PolicyAgent":
+        """
+        Read a policy written by save().
+
+        Raises:
+            ValueError: If the file is not a policy of a known version
+        """
+        data = Path(path).read_bytes()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path} is too short for a policy")
+        magic, version, num_actions, states = _HEADER.unpack_from(data)
+        if magic != POLICY_MAGIC or version != POLICY_VERSION:
+            raise ValueError(
+                f"{path} is not a version {POLICY_VERSION} policy"
+            )
+        masks = data[_HEADER.size:]
+        if len(masks) != states:
+            raise ValueError(f"{path} is truncated")
+        return cls(masks, num_actions)
@@ -0,0 +1,262 @@
+"""Dense Q-table storage for the 12-bit board state and its binary file."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import random
+import struct
+import sys
+from array import array
+from collections.abc import Iterator, MutableMapping
+from operator import countOf, indexOf
+from pathlib import Path
+
+from .core.qlearn import QTABLE_ACTIONS, QTABLE_STATES
+
+__all__ = [
+    "BINARY_MAGIC",
+    "BINARY_VERSION",
+    "DenseQTable",
+    "is_binary_model",
+    "read_binary_model",
+    "write_binary_model",
+]
+
+BINARY_MAGIC = b"L2SQ"
+BINARY_VERSION = 1
+
+# magic, version, num_actions, states, alpha, gamma, epsilon, min_epsilon,
+# epsilon_decay, learning_enabled, symmetric, metadata length (all
+# little-endian)
+_HEADER = struct.Struct("<4sHHI5dBB2xI")
+_HYPERPARAMETERS = (
+    "alpha", "gamma", "epsilon", "min_epsilon", "epsilon_decay"
+)
+
+
+class DenseQTable(MutableMapping):
+    """
+    Q-values for every 12-bit state in one flat ``array('d')``.
+
+    Row ``state`` holds the ``num_actions`` values of that state and
+    ``visited`` marks the states the dict-backed table would contain, so the
+    table still behaves like ``dict[int, list[float]]`` (and saves to the
+    same JSON) while lookups are index arithmetic. The default 4096 x 4
+    table takes a fixed 128 KB. ``values`` and ``visited`` are the buffers
+    ``board_qlearn_run`` trains in place.
+
+    A table read with ``read_binary_model(..., mapped=True)`` wraps
+    read-only memoryviews of the file instead (see ``readonly``).
+
+    Attributes:
+        num_actions: Values per state
+        values: Row-major Q-values, ``states * num_actions`` doubles
+        visited: One byte per state, 1 once the state has been seen
+    """
+
+    __slots__ = ("num_actions", "values", "visited")
+
+    def __init__(
+        self,
+        num_actions: int = QTABLE_ACTIONS,
+        states: int = QTABLE_STATES,
+    ) -> None:
+        self.num_actions = num_actions
+        self.values = array("d", bytes(8 * states * num_actions))
+        self.visited = bytearray(states)
+
+    # ------------------------------------------------------------------
+    def __getitem__(self, state: int) -> list[float]:
+        if state not in self:
+            raise KeyError(state)
+        base = state * self.num_actions
+        return self.values[base:base + self.num_actions].tolist()
+
+    def __setitem__(self, state: int, values: list[float]) -> None:
+        if len(values) != self.num_actions:
+            raise ValueError(
+                f"Expected {self.num_actions} values, got {len(values)}"
+            )
+        base = state * self.num_actions
+        self.values[base:base + self.num_actions] = array("d", values)
+        self.visited[state] = 1
+
+    def __delitem__(self, state: int) -> None:
+        if state not in self:
+            raise KeyError(state)
+        base = state * self.num_actions
+        for index in range(base, base + self.num_actions):
+            self.values[index] = 0.0
+        self.visited[state] = 0
+
+    def __contains__(self, state: object) -> bool:
+        return (
+            isinstance(state, int)
+            and 0 <= state < len(self.visited)
+            and self.visited[state] == 1
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        visited = self.visited
+        return (state for state in range(len(visited)) if visited[state])
+
+    def __len__(self) -> int:
+        return countOf(self.visited, 1)
+
+    def __repr__(self) -> str:
+        return (
+            f"DenseQTable(states={len(self)}/{len(self.visited)}, "
+            f"num_actions={self.num_actions})"
+        )
+
+    # ------------------------------------------------------------------
+    @property
+    def readonly(self) -> bool:
+        """True for a table memory-mapped from a binary model."""
+        return isinstance(self.values, memoryview) and self.values.readonly
+
+    def max_value(self, state: int) -> float:
+        """Largest Q-value of ``state``."""
+        base = state * self.num_actions
+        return max(self.values[base:base + self.num_actions])
+
+    def best_action(self, state: int, rng=random) -> int:
+        """Greedy action of ``state``, ties broken uniformly at random by
+        ``rng`` (the ``random`` module or a random.Random)."""
+        base = state * self.num_actions
+        row = self.values[base:base + self.num_actions]
+        if isinstance(row, memoryview):
+            # A slice of shared memory is live: other processes may write
+            # to it between the reads below.
+            row = row.tolist()
+        best = max(row)
+        ties = countOf(row, best)
+        if ties == 1:
+            return indexOf(row, best)
+        pick = rng.randrange(ties)
+        for action, value in enumerate(row):
+            if value == best:
+                if pick == 0:
+                    return action
+                pick -= 1
+        return 0
+
+
+# ----------------------------------------------------------------------
+def _align8(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def is_binary_model(path: str | Path) -> bool:
+    """True if ``path`` starts with the binary model magic."""
+    with open(path, "rb") as handle:
+        return handle.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+def write_binary_model(
+    path: str | Path,
+    table: DenseQTable,
+    params: dict[str, object],
+    metadata: dict[str, object],
+) -> None:
+    """
+    Write a versioned binary model.
+
+    Layout: a fixed header (magic, version, table shape, hyperparameters),
+    the metadata as UTF-8 JSON, then the visited flags and the raw
+    little-endian float64 table, each starting on an 8-byte boundary so the
+    table can be memory-mapped and used in place.
+
+    Args:
+        path: Destination file
+        table: Q-values to store
+        params: Hyperparameters, as in the JSON model
+        metadata: Free-form training metadata
+    """
+    blob = json.dumps(metadata).encode("utf-8")
+    states = len(table.visited)
+    header = _HEADER.pack(
+        BINARY_MAGIC,
+        BINARY_VERSION,
+        table.num_actions,
+        states,
+        *(float(params[name]) for name in _HYPERPARAMETERS),
+        bool(params["learning_enabled"]),
+        bool(params.get("symmetric", False)),
+        len(blob),
+    )
+    values = array("d", table.values)
+    if sys.byteorder == "big":  # pragma: no cover - little-endian hosts
+        values.byteswap()
+    visited_at = _align8(len(header) + len(blob))
+    values_at = _align8(visited_at + states)
+    with open(path, "wb") as handle:
+        handle.write(header + blob)
+        handle.write(bytes(visited_at - len(header) - len(blob)))
+        handle.write(bytes(table.visited))
+        handle.write(bytes(values_at - visited_at - states))
+        handle.write(values.tobytes())
+
+
+def read_binary_model(
+    path: str | Path,
+    mapped: bool = False,
+) -> tuple[dict[str, object], dict[str, object], DenseQTable]:
+    """
+    Read a binary model written by ``write_binary_model``.
+
+    Args:
+        path: Model file
+        mapped: Memory-map the file read-only and use the table in place,
+            so processes loading the same model share one page-cache copy.
+            Otherwise the table is copied into a writable DenseQTable.
+
+    Returns:
+        tuple: (hyperparameters, metadata, table)
+
+    Raises:
+        ValueError: If the file is not a binary model of a known version
+    """
+    with open(path, "rb") as handle:
+        data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(data)
+    try:
+        if len(view) < _HEADER.size:
+            raise ValueError(f"{path} is too short for a binary model")
+        header = _HEADER.unpack_from(view)
+        magic, version, num_actions, states, *rest = header
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError(
+                f"{path} is not a version {BINARY_VERSION} model"
+            )
+        *floats, learning_enabled, symmetric, blob_size = rest
+        params: dict[str, object] = dict(zip(_HYPERPARAMETERS, floats))
+        params["num_actions"] = num_actions
+        params["learning_enabled"] = bool(learning_enabled)
+        params["symmetric"] = bool(symmetric)
+        blob_end = _HEADER.size + blob_size
+        blob = bytes(view[_HEADER.size:blob_end])
+        metadata = json.loads(blob or b"{}")
+        visited_at = _align8(blob_end)
+        values_at = _align8(visited_at + states)
+        values_end = values_at + 8 * states * num_actions
+        if len(view) < values_end:
+            raise ValueError(f"{path} is truncated")
+    except ValueError:
+        view.release()
+        data.close()
+        raise
+    table = DenseQTable.__new__(DenseQTable)
+    table.num_actions = num_actions
+    if mapped and sys.byteorder == "little":
+        table.visited = view[visited_at:visited_at + states]
+        table.values = view[values_at:values_end].cast("d")
+        return params, metadata, table
+    table.visited = bytearray(view[visited_at:visited_at + states])
+    table.values = array("d", bytes(view[values_at:values_end]))
+    if sys.byteorder == "big":  # pragma: no cover - little-endian hosts
+        table.values.byteswap()
+    view.release()
+    data.close()
+    return params, metadata, table
@@ -0,0 +1,305 @@
+"""Experience replay for the tabular agent."""
+
+from __future__ import annotations
+
+import random
+import struct
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+
+__all__ = ["REPLAY_MAGIC", "ReplayBatch", "ReplayBuffer"]
+
+REPLAY_MAGIC = b"L2SR"
+REPLAY_VERSION = 1
+
+# magic, version, prioritized, capacity, size, cursor, priority_alpha,
+# max_priority (all little-endian)
+_HEADER = struct.Struct("<4sHH3Idd")
+_PRIORITY_EPS = 1e-6
+
+
+@dataclass(frozen=True)
+class ReplayBatch:
+    """
+    Transitions drawn by ReplayBuffer.sample().
+
+    The first five fields line up with QLearningAgent.update_batch().
+    ``indices`` are the buffer slots (for update_priorities) and
+    ``weights`` the importance-sampling weights of a prioritized draw
+    (None for uniform sampling).
+    """
+
+    states: array
+    actions: array
+    rewards: array
+    next_states: array
+    dones: array
+    indices: list[int]
+    weights: list[float] | None = None
+
+
+class ReplayBuffer:
+    """
+    Fixed-capacity ring of (state, action, reward, next_state, done).
+
+    Each field is a preallocated typed array (uint16 states, uint8 actions
+    and done flags, float32 rewards), 10 bytes per transition: a million
+    transitions take 10 MB. Once full, new transitions overwrite the oldest.
+
+    With ``prioritized=True`` a sum tree over the slots holds each
+    transition's priority ``(|td_error| + eps) ** priority_alpha`` and
+    sample() draws proportionally to it (new transitions get the current
+    maximum, so each is seen at least once). The tree adds 16 bytes per
+    slot, rounded up to a power of two.
+
+    Attributes:
+        capacity: Number of slots
+        states, actions, rewards, next_states, dones: Ring storage
+        cursor: Slot the next transition is written to
+        size: Number of stored transitions
+        priority_alpha: Priority exponent (0 = uniform)
+    """
+
+    __slots__ = (
+        "capacity",
+        "states",
+        "actions",
+        "rewards",
+        "next_states",
+        "dones",
+        "cursor",
+        "size",
+        "priority_alpha",
+        "_tree",
+        "_leaves",
+        "_max_priority",
+    )
+
+    def __init__(
+        self,
+        capacity: int,
+        prioritized: bool = False,
+        priority_alpha: float = 0.6,
+    ) -> None:
+        """
+        Allocate the ring.
+
+        Args:
+            capacity: Number of transitions kept
+            prioritized: Sample proportionally to priority (sum tree)
+            priority_alpha: How strongly priorities skew sampling
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.states = array("H", bytes(2 * capacity))
+        self.actions = array("B", bytes(capacity))
+        self.rewards = array("f", bytes(4 * capacity))
+        self.next_states = array("H", bytes(2 * capacity))
+        self.dones = array("B", bytes(capacity))
+        self.cursor = 0
+        self.size = 0
+        self.priority_alpha = priority_alpha
+        self._tree: array | None = None
+        self._leaves = 1
+        self._max_priority = 1.0
+        if prioritized:
+            while self._leaves < capacity:
+                self._leaves *= 2
+            self._tree = array("d", bytes(16 * self._leaves))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        kind = "prioritized" if self.prioritized else "uniform"
+        return f"<ReplayBuffer {self.size}/{self.capacity} {kind}>"
+
+    @property
+    def prioritized(self) -> bool:
+        """True when sampling follows priorities."""
+        return self._tree is not None
+
+    # ------------------------------------------------------------------
+    def add(
+        self,
+        state: int,
+        action: int,
+        reward: float,
+        next_state: int,
+        done: bool,
+    ) -> int:
+        """
+        Store one transition, overwriting the oldest when full.
+
+        Returns:
+            int: Slot the transition was written to
+        """
+        slot = self.cursor
+        self.states[slot] = state
+        self.actions[slot] = action
+        self.rewards[slot] = reward
+        self.next_states[slot] = next_state
+        self.dones[slot] = done
+        self.cursor = (slot + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+        if self._tree is not None:
+            self._set_priority(slot, self._max_priority)
+        return slot
+
+    # ------------------------------------------------------------------
+    def sample(self, batch_size: int, beta: float = 0.4) -> ReplayBatch:
+        """
+        Draw ``batch_size`` transitions (with replacement).
+
+        Args:
+            batch_size: Number of transitions
+            beta: Importance-sampling exponent of prioritized draws
+                (1 = full correction)
+
+        Returns:
+            ReplayBatch: The transitions, their slots and, when
+            prioritized, their normalised importance weights
+
+        Raises:
+            ValueError: If the buffer is empty
+        """
+        if self.size == 0:
+            raise ValueError("sample from an empty ReplayBuffer")
+        weights = None
+        if self._tree is None:
+            size = self.size
+            indices = [int(random.random() * size) for _ in range(batch_size)]
+        else:
+            indices, weights = self._sample_prioritized(batch_size, beta)
+        return ReplayBatch(
+            states=array("H", [self.states[i] for i in indices]),
+            actions=array("B", [self.actions[i] for i in indices]),
+            rewards=array("f", [self.rewards[i] for i in indices]),
+            next_states=array("H", [self.next_states[i] for i in indices]),
+            dones=array("B", [self.dones[i] for i in indices]),
+            indices=indices,
+            weights=weights,
+        )
+
+    # ------------------------------------------------------------------
+    def update_priorities(self, indices, errors) -> None:
+        """
+        Set new priorities from TD errors (no-op for a uniform buffer).
+
+        Args:
+            indices: Slots, as returned in ReplayBatch.indices
+            errors: TD error of each slot
+        """
+        if self._tree is None:
+            return
+        for slot, error in zip(indices, errors):
+            priority = (abs(error) + _PRIORITY_EPS) ** self.priority_alpha
+            if priority > self._max_priority:
+                self._max_priority = priority
+            self._set_priority(slot, priority)
+
+    # ------------------------------------------------------------------
+    def _set_priority(self, slot: int, priority: float) -> None:
+        tree = self._tree
+        node = self._leaves + slot
+        change = priority - tree[node]
+        while node >= 1:
+            tree[node] += change
+            node //= 2
+
+    def _sample_prioritized(
+        self, batch_size: int, beta: float
+    ) -> tuple[list[int], list[float]]:
+        # One draw per equal slice of the total mass (stratified), each
+        # found by walking the tree from the root.
+        tree = self._tree
+        leaves = self._leaves
+        total = tree[1]
+        segment = total / batch_size
+        indices = []
+        weights = []
+        for k in range(batch_size):
+            mass = (k + random.random()) * segment
+            node = 1
+            while node < leaves:
+                node *= 2
+                if mass > tree[node] and tree[node + 1] > 0.0:
+                    mass -= tree[node]
+                    node += 1
+            indices.append(node - leaves)
+            weights.append((self.size * tree[node] / total) ** -beta)
+        largest = max(weights)
+        return indices, [weight / largest for weight in weights]
+
+    # ------------------------------------------------------------------
+    def save(self, path: str | Path) -> Path:
+        """
+        Write the buffer (and its priorities) to a binary file.
+
+        Args:
+            path: Destination file
+
+        Returns:
+            Path: The written file
+        """
+        file_path = Path(path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        header = _HEADER.pack(
+            REPLAY_MAGIC,
+            REPLAY_VERSION,
+            self.prioritized,
+            self.capacity,
+            self.size,
+            self.cursor,
+            self.priority_alpha,
+            self._max_priority,
+        )
+        with open(file_path, "wb") as handle:
+            handle.write(header)
+            for column in self._columns():
+                handle.write(column.tobytes())
+        return file_path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ReplayBuffer":
+        """
+        Read a buffer written by save().
+
+        Raises:
+            ValueError: If the file is not a replay buffer of a known
+                version
+        """
+        data = Path(path).read_bytes()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path} is too short for a replay buffer")
+        (magic, version, prioritized, capacity, size, cursor,
+         priority_alpha, max_priority) = _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(
+                f"{path} is not a version {REPLAY_VERSION} buffer"
+            )
+        buffer = cls(capacity, bool(prioritized), priority_alpha)
+        buffer.size = size
+        buffer.cursor = cursor
+        buffer._max_priority = max_priority
+        offset = _HEADER.size
+        for column in buffer._columns():
+            end = offset + len(column) * column.itemsize
+            if len(data) < end:
+                raise ValueError(f"{path} is truncated")
+            column[:] = array(column.typecode, data[offset:end])
+            offset = end
+        return buffer
+
+    def _columns(self) -> list[array]:
+        columns = [self.states, self.actions, self.rewards,
+                   self.next_states, self.dones]
+        if self._tree is not None:
+            columns.append(self._tree)
+        return columns
@@ -0,0 +1,144 @@
+"""Lock-free single-producer/single-consumer transition ring."""
+
+from __future__ import annotations
+
+import time
+
+__all__ = ["TransitionRing"]
+
+# Counters: head (written by the producer) and its stall count share the
+# first cache line, tail (written by the consumer) sits alone on the second.
+_HEAD, _STALLS, _TAIL = 0, 1, 8
+_HEADER_BYTES = 128
+_BACKOFF = 0.0005
+
+
+class TransitionRing:
+    """
+    Fixed-capacity ring of (state, action, reward, next_state, done).
+
+    The ring lives in a caller-provided buffer (normally a slice of a
+    ``multiprocessing.shared_memory`` segment) laid out as a 128-byte
+    counter header followed by one column per field (float32 rewards,
+    uint16 states, uint8 actions and done flags), like ReplayBuffer.
+
+    One process pushes and one process pops. ``head`` and ``tail`` only
+    ever grow and each is written by one side alone: the producer fills a
+    slot and then publishes it by bumping ``head``; the consumer copies
+    slots out and then frees them by bumping ``tail``. No lock is needed:
+    aligned 8-byte stores are atomic, and x86 keeps them in program order
+    (weakly ordered CPUs rely on the interpreter's own barriers).
+
+    Attributes:
+        capacity: Number of slots
+    """
+
+    __slots__ = (
+        "capacity",
+        "_counters",
+        "_rewards",
+        "_states",
+        "_next_states",
+        "_actions",
+        "_dones",
+    )
+
+    def __init__(self, buffer: memoryview, capacity: int) -> None:
+        """
+        Args:
+            buffer: At least ``TransitionRing.nbytes(capacity)`` writable
+                bytes, zeroed for a new ring
+            capacity: Number of slots
+        """
+        self.capacity = capacity
+        offset = _HEADER_BYTES
+        self._counters = buffer[:offset].cast("Q")
+        columns = []
+        for code, size in (("f", 4), ("H", 2), ("H", 2), ("B", 1), ("B", 1)):
+            end = offset + size * capacity
+            columns.append(buffer[offset:end].cast(code))
+            offset = end
+        (self._rewards, self._states, self._next_states,
+         self._actions, self._dones) = columns
+
+    @staticmethod
+    def nbytes(capacity: int) -> int:
+        """Buffer size of a ring of ``capacity`` slots (64-byte multiple)."""
+        return (_HEADER_BYTES + 10 * capacity + 63) & ~63
+
+    def __len__(self) -> int:
+        return self._counters[_HEAD] - self._counters[_TAIL]
+
+    @property
+    def pushed(self) -> int:
+        """Transitions pushed since the ring was created."""
+        return self._counters[_HEAD]
+
+    @property
+    def stalls(self) -> int:
+        """Times the producer found the ring full and had to wait."""
+        return self._counters[_STALLS]
+
+    # ------------------------------------------------------------------
+    def push(
+        self,
+        state: int,
+        action: int,
+        reward: float,
+        next_state: int,
+        done: bool,
+    ) -> None:
+        """
+        Append one transition, waiting while the ring is full.
+
+        Waiting is the backpressure: a producer can never run more than
+        ``capacity`` transitions ahead of its consumer.
+        """
+        counters = self._counters
+        head = counters[_HEAD]
+        if head - counters[_TAIL] >= self.capacity:
+            counters[_STALLS] += 1
+            while head - counters[_TAIL] >= self.capacity:
+                time.sleep(_BACKOFF)
+        slot = head % self.capacity
+        self._states[slot] = state
+        self._actions[slot] = action
+        self._rewards[slot] = reward
+        self._next_states[slot] = next_state
+        self._dones[slot] = done
+        counters[_HEAD] = head + 1
+
+    def pop(self, limit: int) -> tuple[list, list, list, list, list] | None:
+        """
+        Remove up to ``limit`` transitions, oldest first.
+
+        Returns:
+            tuple | None: (states, actions, rewards, next_states, dones)
+            lists, the argument order of QLearningAgent.update_batch, or
+            None when the ring is empty
+        """
+        counters = self._counters
+        tail = counters[_TAIL]
+        count = min(counters[_HEAD] - tail, limit)
+        if count <= 0:
+            return None
+        start = tail % self.capacity
+        end = start + count
+        columns = (self._states, self._actions, self._rewards,
+                   self._next_states, self._dones)
+        if end <= self.capacity:
+            batch = tuple(column[start:end].tolist() for column in columns)
+        else:
+            end -= self.capacity
+            batch = tuple(
+                column[start:].tolist() + column[:end].tolist()
+                for column in columns
+            )
+        counters[_TAIL] = tail + count
+        return batch
+
+    def release(self) -> None:
+        """Release the views so the underlying buffer can be closed."""
+        for view in (self._counters, self._rewards, self._states,
+                     self._next_states, self._actions, self._dones):
+            view.release()
@@ -0,0 +1,106 @@
+"""Dihedral symmetries of the 12-bit vision state."""
+
+from __future__ import annotations
+
+from array import array
+
+from .core.qlearn import QTABLE_ACTIONS, QTABLE_STATES
+
+__all__ = [
+    "ACTION_FROM_CANONICAL",
+    "ACTION_TO_CANONICAL",
+    "CANONICAL_STATES",
+    "CANONICAL_TRANSFORMS",
+    "TRANSFORMS",
+    "canonicalize",
+    "transform_action",
+    "transform_state",
+]
+
+# Four rotations, each with and without a left/right mirror.
+TRANSFORMS = 8
+_RAY_BITS = 3
+_RAY_MASK = (1 << _RAY_BITS) - 1
+
+
+def transform_action(action: int, transform: int) -> int:
+    """
+    Direction ``action`` after applying ``transform``.
+
+    Directions are numbered counter-clockwise (UP, LEFT, DOWN, RIGHT), so
+    transforms 0-3 rotate by that many quarter turns and 4-7 mirror
+    LEFT/RIGHT first.
+    """
+    if transform >= 4:
+        action = -action
+    return (action + transform) % QTABLE_ACTIONS
+
+
+def transform_state(state: int, transform: int) -> int:
+    """
+    Vision state seen after applying ``transform`` to the board.
+
+    The ray of direction ``d`` (bits ``9 - 3 * d``) moves to direction
+    ``transform_action(d, transform)``.
+    """
+    out = 0
+    for direction in range(QTABLE_ACTIONS):
+        shift = (QTABLE_ACTIONS - 1 - direction) * _RAY_BITS
+        ray = (state >> shift) & _RAY_MASK
+        target = transform_action(direction, transform)
+        out |= ray << ((QTABLE_ACTIONS - 1 - target) * _RAY_BITS)
+    return out
+
+
+def _build_tables() -> tuple[array, array]:
+    images = []
+    for transform in range(TRANSFORMS):
+        # (source shift, destination shift) of each of the four rays
+        a, b, c, d = (
+            (
+                (QTABLE_ACTIONS - 1 - direction) * _RAY_BITS,
+                (QTABLE_ACTIONS - 1 - transform_action(direction, transform))
+                * _RAY_BITS,
+            )
+            for direction in range(QTABLE_ACTIONS)
+        )
+        images.append([
+            ((s >> a[0]) & _RAY_MASK) << a[1]
+            | ((s >> b[0]) & _RAY_MASK) << b[1]
+            | ((s >> c[0]) & _RAY_MASK) << c[1]
+            | ((s >> d[0]) & _RAY_MASK) << d[1]
+            for s in range(QTABLE_STATES)
+        ])
+    per_state = list(zip(*images))
+    canonical = list(map(min, per_state))
+    transforms = list(map(tuple.index, per_state, canonical))
+    return array("H", canonical), array("B", transforms)
+
+
+# CANONICAL_STATES[s] is the smallest of the 8 images of ``s`` and
+# CANONICAL_TRANSFORMS[s] the transform producing it.
+CANONICAL_STATES, CANONICAL_TRANSFORMS = _build_tables()
+
+# ACTION_TO_CANONICAL[t * 4 + a]: action ``a`` seen through transform ``t``;
+# ACTION_FROM_CANONICAL undoes it.
+ACTION_TO_CANONICAL = array("B", [
+    transform_action(action, t)
+    for t in range(TRANSFORMS)
+    for action in range(QTABLE_ACTIONS)
+])
+ACTION_FROM_CANONICAL = array("B", bytes(len(ACTION_TO_CANONICAL)))
+for _index, _action in enumerate(ACTION_TO_CANONICAL):
+    _base = _index - _index % QTABLE_ACTIONS
+    ACTION_FROM_CANONICAL[_base + _action] = _index % QTABLE_ACTIONS
+del _index, _action, _base
+
+
+def canonicalize(state: int) -> tuple[int, int]:
+    """
+    Canonical representative of ``state`` and the transform mapping it there.
+
+    Returns:
+        tuple: (canonical state, transform); map actions into the canonical
+        frame with ``ACTION_TO_CANONICAL[transform * 4 + action]``
+    """
+    return CANONICAL_STATES[state], CANONICAL_TRANSFORMS[state]
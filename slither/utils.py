@@ -37,20 +37,13 @@ def get_direction(action_idx: int) -> int:
 
 def get_vision_cells(board) -> dict[str, int]:
     size = board.size
-    head_x, head_y = -1, -1
-
-    for y in range(size):
-        for x in range(size):
-            if board.get_cell(x, y) == BoardCell.SNAKE_HEAD:
-                head_x, head_y = x, y
-                break
-        if head_x >= 0:
-            break
+    cells = board.grid
+    head_x, head_y = board.head or (-1, -1)
 
     def get_cell_safe(x: int, y: int) -> int:
         if x < 0 or x >= size or y < 0 or y >= size:
             return BoardCell.WALL
-        return board.get_cell(x, y)
+        return cells[y, x]
 
     return {
         "up": get_cell_safe(head_x, head_y - 1),
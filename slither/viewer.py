@@ -188,6 +188,7 @@ class Viewer:
             return None
 
         size = board.size
+        cells = board.grid
         visible: set[tuple[int, int]] = {head}
         directions = ((0, -1), (-1, 0), (0, 1), (1, 0))
 
@@ -199,7 +200,7 @@ class Viewer:
                 if x < 0 or x >= size or y < 0 or y >= size:
                     break
                 visible.add((x, y))
-                cell = board.get_cell(x, y)
+                cell = cells[y, x]
                 if cell in (
                     BoardCell.WALL,
                     BoardCell.SNAKE_BODY,
@@ -212,12 +213,7 @@ class Viewer:
 
     # ------------------------------------------------------------------
     def _find_head(self, board: "GameBoard") -> tuple[int, int] | None:
-        size = board.size
-        for y in range(size):
-            for x in range(size):
-                if board.get_cell(x, y) == BoardCell.SNAKE_HEAD:
-                    return (x, y)
-        return None
+        return board.head
 
     # ------------------------------------------------------------------
     def show_splash(self, board_size: int = 10) -> bool:
@@ -18,6 +18,7 @@ from statistics import mean
 
 from slither import GameBoard
 from slither.agent import QLearningAgent
+from slither.policy import PolicyAgent, is_policy_file
 from slither.utils import get_direction, print_vision
 
 # Runtime imports for optional viewer (pygame may not be available)
@@ -69,6 +70,22 @@ Examples:
         action="store_true",
         help="Run without updating the Q-table (evaluation mode)",
     )
+    parser.add_argument(
+        "-dense",
+        action="store_true",
+        help="Keep the Q-table in a flat 4096x4 array instead of a dict",
+    )
+    parser.add_argument(
+        "-symmetric",
+        action="store_true",
+        help="Share one Q-table row between rotated/mirrored states",
+    )
+    parser.add_argument(
+        "-policy",
+        action="store_true",
+        help="Play from the loaded model compiled to a greedy lookup table "
+        "(implies -dontlearn; -save then writes the compiled policy)",
+    )
     parser.add_argument(
         "-step-by-step",
         action="store_true",
@@ -100,7 +117,7 @@ Examples:
         "-seed",
         type=int,
         default=None,
-        help="Random seed for reproducibility",
+        help="Random seed for reproducibility (agent and board)",
     )
     parser.add_argument(
         "-verbose",
@@ -208,11 +225,12 @@ def run_episode_headless(
         if done:
             break
 
+    status = board.status()
     return {
         "steps": steps,
         "reward": total_reward,
-        "length": board.length,
-        "max_length": board.max_length,
+        "length": status.length,
+        "max_length": status.max_length,
     }
 
 
@@ -226,7 +244,8 @@ def run_episode_visual(
 ) -> dict:
     """Run a single episode with visualization."""
     board.reset()
-    state = board.state
+    status = board.status()
+    state = status.state
     total_reward = 0.0
     steps = 0
 
@@ -235,8 +254,8 @@ def run_episode_visual(
         episode=episode,
         step=0,
         reward=0.0,
-        length=board.length,
-        score=board.score,
+        length=status.length,
+        score=status.score,
         done=False,
         fps=args.fps,
     )
@@ -253,7 +272,8 @@ def run_episode_visual(
             print_vision(board, action, 0.0)
 
         # Execute action
-        next_state, reward, done = board.step(get_direction(action))
+        step = board.step_info(get_direction(action))
+        next_state, reward, done = step.state, step.reward, step.done
 
         if learn:
             agent.update(state, action, reward, next_state, done)
@@ -266,8 +286,8 @@ def run_episode_visual(
             episode=episode,
             step=steps,
             reward=reward,
-            length=board.length,
-            score=board.score,
+            length=step.length,
+            score=step.score,
             done=done,
             fps=args.fps,
         )
@@ -283,11 +303,12 @@ def run_episode_visual(
             if not viewer.wait_for_step():
                 break
 
+    status = board.status()
     return {
         "steps": steps,
         "reward": total_reward,
-        "length": board.length,
-        "max_length": board.max_length,
+        "length": status.length,
+        "max_length": status.max_length,
     }
 
 
@@ -318,23 +339,32 @@ def main() -> int:
         epsilon=args.epsilon,
         min_epsilon=args.min_epsilon,
         epsilon_decay=args.epsilon_decay,
+        dense=args.dense,
+        symmetric=args.symmetric,
     )
 
     # Load existing model if specified
     if args.load is not None:
-        if args.load.exists():
-            agent.load_model(args.load)
+        if args.load.exists() and is_policy_file(args.load):
+            agent = PolicyAgent.load(args.load)
+            print(f"Load compiled policy from {args.load}")
+        elif args.load.exists():
+            # Frozen runs map binary models read-only (shared page cache)
+            agent.load_model(args.load, mmap=args.dontlearn)
             print(f"Load trained model from {args.load}")
         else:
             print(f"Warning: Model file {args.load} not found, starting fresh")
 
-    # Set learning mode
-    learn = not args.dontlearn
-    if args.dontlearn:
+    if args.policy and not isinstance(agent, PolicyAgent):
+        agent = PolicyAgent.from_agent(agent)
+
+    # Set learning mode (a compiled policy is always frozen)
+    learn = not args.dontlearn and not isinstance(agent, PolicyAgent)
+    if not learn:
         agent.set_learning(False)
 
     # Create board and viewer
-    board = GameBoard(size=args.size)
+    board = GameBoard(size=args.size, seed=args.seed)
     viewer = create_viewer(args)
 
     # Show splash screen if visual
@@ -402,8 +432,12 @@ def main() -> int:
             "max_length": max_length_overall,
             "avg_reward": mean(h["reward"] for h in history) if history else 0,
         }
-        path = agent.save_model(args.save, metadata=metadata)
-        print(f"Save learning state in {path}")
+        if isinstance(agent, PolicyAgent):
+            path = agent.save(args.save)
+            print(f"Save compiled policy in {path}")
+        else:
+            path = agent.save_model(args.save, metadata=metadata)
+            print(f"Save learning state in {path}")
 
     return 0
 
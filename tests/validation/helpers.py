@@ -6,7 +6,7 @@ import io
 from typing import Iterable, List, Tuple
 
 from slither.core.board import GameBoard
-from slither.core._types import Actions, BoardCell, Direction
+from slither.core._types import Actions, BoardCell, BoardEngine, Direction
 
 CELL_TO_ACTION = {
     BoardCell.GREEN_APPLE: Actions.ATE_GREEN_APPLE,
@@ -14,18 +14,17 @@ CELL_TO_ACTION = {
 }
 
 
-def new_board(size: int = 10) -> GameBoard:
+def new_board(size: int = 10, engine: int = BoardEngine.GRID) -> GameBoard:
     """Create a new board instance for tests."""
-    return GameBoard(size=size)
+    return GameBoard(size=size, engine=engine)
 
 
 def get_head_position(board: GameBoard) -> Tuple[int, int]:
     """Return the (x, y) coordinates of the snake head."""
-    for y in range(board.size):
-        for x in range(board.size):
-            if board.get_cell(x, y) == BoardCell.SNAKE_HEAD:
-                return x, y
-    raise RuntimeError("Head position not found on board")
+    head = board.head
+    if head is None:
+        raise RuntimeError("Head position not found on board")
+    return head
 
 
 def capture_board_print(board: GameBoard) -> str:
@@ -73,9 +72,10 @@ def consume_row_aligned_cell(
         board.reset()
     while attempts < max_attempts:
         head_x, head_y = get_head_position(board)
+        row = board.grid.tolist()[head_y]
         targets: List[int] = [
             x for x in range(board.size)
-            if x != head_x and board.get_cell(x, head_y) == cell_type
+            if x != head_x and row[x] == cell_type
         ]
         for target_x in targets:
             if target_x > head_x:
@@ -107,6 +107,7 @@ def make_moves(board: GameBoard, directions: Iterable[int]) -> List[int]:
 __all__ = [
     "Actions",
     "BoardCell",
+    "BoardEngine",
     "Direction",
     "CELL_TO_ACTION",
     "capture_board_print",
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+from array import array
 from pathlib import Path
 
+import pytest
+
 from slither.agent import QLearningAgent
+from slither.core import DoneFlag, GameBoard
+from slither.qtable import is_binary_model, read_binary_model
 
 
 def test_best_action_prefers_highest_value() -> None:
@@ -37,3 +42,244 @@ def test_save_and_load_roundtrip(tmp_path: Path) -> None:
     restored.load_model(path)
     assert restored.q_table == agent.q_table
     assert restored.epsilon == agent.epsilon
+
+
+def test_train_native_learns_and_saves(tmp_path: Path) -> None:
+    agent = QLearningAgent(epsilon=1.0, min_epsilon=0.2, epsilon_decay=0.9)
+    agent.q_table = {7: [1.0, 2.0, 3.0, 4.0]}
+    history = agent.train_native(GameBoard(seed=3), 50, 100, seed=1)
+    assert len(history) == 50
+    assert all(0 < item["steps"] <= 100 for item in history)
+    assert history[0]["epsilon"] == 0.9
+    assert agent.epsilon == 0.2
+    assert agent.q_table[7] == [1.0, 2.0, 3.0, 4.0]
+    assert len(agent.q_table) > 1
+
+    path = agent.save_model(tmp_path / "native.json")
+    restored = QLearningAgent()
+    restored.load_model(path)
+    assert restored.q_table == agent.q_table
+
+
+def test_train_native_is_reproducible() -> None:
+    runs = []
+    for _ in range(2):
+        agent = QLearningAgent()
+        history = agent.train_native(GameBoard(seed=9), 20, 50, seed=4)
+        runs.append((history, agent.q_table))
+    assert runs[0] == runs[1]
+
+
+def test_train_native_frozen_agent_keeps_values() -> None:
+    for dense in (False, True):
+        agent = QLearningAgent(dense=dense)
+        agent.q_table[3] = [0.5, 0.0, 0.0, 0.0]
+        agent.set_learning(False)
+        agent.train_native(GameBoard(seed=2), 10, 50, seed=0)
+        assert dict(agent.q_table) == {3: [0.5, 0.0, 0.0, 0.0]}
+
+
+def test_dense_agent_matches_dict_agent() -> None:
+    agents = [QLearningAgent(alpha=0.5, gamma=0.9, dense=dense)
+              for dense in (False, True)]
+    for agent in agents:
+        agent.q_table[7] = [1.0, 2.0, 3.0, 4.0]
+        agent.update(5, 2, reward=1.0, next_state=7, done=False)
+        agent.update(7, 0, reward=-10.0, next_state=0, done=True)
+        assert agent.best_action(7) == 3
+        assert 0 not in agent.q_table
+    assert dict(agents[1].q_table) == agents[0].q_table
+    assert agents[1].q_table[5][2] == 0.5 * (1.0 + 0.9 * 4.0)
+
+
+def test_dense_best_action_breaks_ties() -> None:
+    agent = QLearningAgent(epsilon=0.0, dense=True)
+    agent.q_table[0] = [1.0, 2.0, 1.5, 2.0]
+    assert {agent.best_action(0) for _ in range(50)} == {1, 3}
+
+
+def test_dense_table_uses_json_format(tmp_path: Path) -> None:
+    agent = QLearningAgent(dense=True)
+    agent.q_table[4095] = [0.1, 0.2, 0.3, 0.4]
+    path = agent.save_model(tmp_path / "dense.json")
+
+    restored = QLearningAgent()
+    restored.load_model(path)
+    assert restored.q_table == {4095: [0.1, 0.2, 0.3, 0.4]}
+    dense = QLearningAgent(dense=True)
+    dense.load_model(path)
+    assert dense.q_table == restored.q_table
+    assert len(dense.q_table) == 1
+
+
+def test_train_native_trains_dense_table_in_place() -> None:
+    runs = []
+    for dense in (False, True):
+        agent = QLearningAgent(dense=dense)
+        values = agent.q_table
+        history = agent.train_native(GameBoard(seed=9), 20, 50, seed=4)
+        runs.append((history, dict(agent.q_table)))
+        if dense:
+            assert agent.q_table is values
+    assert runs[0] == runs[1]
+
+
+def test_binary_model_roundtrip(tmp_path: Path) -> None:
+    agent = QLearningAgent(alpha=0.3, epsilon=0.25)
+    agent.q_table = {1: [0.1, 0.2, 0.3, 0.4], 4095: [-1.0, 0.0, 2.5, 0.0]}
+    path = agent.save_model(tmp_path / "model.bin", metadata={"episodes": 7})
+    assert is_binary_model(path)
+    assert read_binary_model(path)[1] == {"episodes": 7}
+
+    for dense in (False, True):
+        restored = QLearningAgent(dense=dense)
+        restored.load_model(path)
+        assert restored.q_table == agent.q_table
+        assert (restored.alpha, restored.epsilon) == (0.3, 0.25)
+
+    exported = QLearningAgent()
+    exported.load_model(path)
+    json_path = exported.save_model(tmp_path / "model.json")
+    assert not is_binary_model(json_path)
+
+
+def test_mapped_binary_model_is_frozen_and_shared(tmp_path: Path) -> None:
+    agent = QLearningAgent(dense=True)
+    agent.q_table[9] = [0.0, 5.0, 0.0, 0.0]
+    path = agent.save_model(tmp_path / "checkpoint", binary=True)
+
+    mapped = QLearningAgent()
+    mapped.load_model(path, mmap=True)
+    assert mapped.q_table.readonly
+    assert not mapped.learning_enabled
+    assert mapped.select_action(9) == 1
+    assert mapped.select_action(123) in range(4)
+    assert mapped.q_table == agent.q_table
+    with pytest.raises(ValueError):
+        mapped.train_native(GameBoard(seed=1), 1, 10)
+
+
+def test_binary_model_rejects_unknown_version(tmp_path: Path) -> None:
+    path = QLearningAgent().save_model(tmp_path / "model.bin")
+    raw = bytearray(path.read_bytes())
+    raw[4] = 99
+    path.write_bytes(bytes(raw))
+    with pytest.raises(ValueError):
+        QLearningAgent().load_model(path)
+
+
+def test_rejected_binary_model_is_unmapped(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import mmap
+
+    maps = []
+    original = mmap.mmap
+
+    def tracked(*args, **kwargs):
+        maps.append(original(*args, **kwargs))
+        return maps[-1]
+
+    monkeypatch.setattr("slither.qtable.mmap.mmap", tracked)
+    path = tmp_path / "model.bin"
+    path.write_bytes(b"XXXX" * 64)
+    with pytest.raises(ValueError):
+        read_binary_model(path)
+    assert maps and maps[0].closed
+
+
+def test_update_batch_matches_sequential_updates() -> None:
+    pytest.importorskip("numpy")
+    batch = ([5, 6, 6, 8, 9], [2, 1, 1, 0, 3], [1.0, -0.1, -0.1, -50.0, 2.0],
+             [7, 7, 7, 9, 9], [False, False, False, True, DoneFlag.TRUNCATED])
+    agents = [QLearningAgent(alpha=0.5, gamma=0.9, dense=True)
+              for _ in range(2)]
+    for agent in agents:
+        agent.q_table[7] = [1.0, 2.0, 3.0, 4.0]
+    agents[0].update_batch(*batch)
+    for transition in zip(*batch):
+        if transition[4] != DoneFlag.TRUNCATED:
+            agents[1].update(*transition)
+    assert dict(agents[0].q_table) == pytest.approx(dict(agents[1].q_table))
+    assert 9 not in agents[0].q_table
+
+
+def test_update_batch_scales_steps_by_weights() -> None:
+    batch = ([5, 6, 8], [2, 1, 0], [1.0, -0.1, -50.0], [7, 7, 9],
+             [False, False, True])
+    weights = [1.0, 0.25, 0.5]
+    pytest.importorskip("numpy")
+    for is_dense in (True, False):
+        agents = [QLearningAgent(alpha=0.5, gamma=0.9, dense=is_dense)
+                  for _ in range(2)]
+        for agent in agents:
+            agent.q_table[7] = [1.0, 2.0, 3.0, 4.0]
+        agents[0].update_batch(*batch, weights)
+        for transition, weight in zip(zip(*batch), weights):
+            agents[1].update(*transition, weight=weight)
+        assert dict(agents[0].q_table) == pytest.approx(
+            dict(agents[1].q_table)
+        )
+        assert agents[0].q_table[6][1] == pytest.approx(
+            0.125 * (-0.1 + 0.9 * 4.0)
+        )
+
+
+def test_select_actions_is_epsilon_greedy() -> None:
+    pytest.importorskip("numpy")
+    agent = QLearningAgent(epsilon=0.0, dense=True)
+    agent.q_table[3] = [0.0, 1.0, 0.0, 1.0]
+    agent.q_table[4] = [0.0, 0.0, 5.0, 0.0]
+    actions = agent.select_actions([3] * 200 + [4] * 50)
+    assert set(actions[:200].tolist()) == {1, 3}
+    assert set(actions[200:].tolist()) == {2}
+    agent.epsilon = 1.0
+    out = array("i", bytes(4 * 400))
+    assert agent.select_actions([4] * 400, out=out) is out
+    assert set(out) == {0, 1, 2, 3}
+
+
+def test_batched_calls_fall_back_to_dict_table() -> None:
+    agent = QLearningAgent(alpha=0.5, gamma=0.9, epsilon=0.0)
+    agent.q_table[7] = [1.0, 2.0, 3.0, 4.0]
+    assert list(agent.select_actions([7, 7])) == [3, 3]
+    agent.update_batch([5, 6], [2, 0], [1.0, 1.0], [7, 7],
+                       [DoneFlag.RUNNING, DoneFlag.TRUNCATED])
+    assert agent.q_table[5][2] == 0.5 * (1.0 + 0.9 * 4.0)
+    assert 6 not in agent.q_table
+
+
+def test_td_errors_leave_table_untouched() -> None:
+    for dense in (False, True):
+        agent = QLearningAgent(alpha=0.5, gamma=0.9, epsilon=0.0, dense=dense)
+        agent.q_table[7] = [1.0, 2.0, 3.0, 4.0]
+        errors = agent.td_errors([7, 5], [1, 0], [1.0, -2.0], [7, 9],
+                                 [False, True])
+        assert errors == [1.0 + 0.9 * 4.0 - 2.0, -2.0]
+        assert 5 not in agent.q_table and 9 not in agent.q_table
+
+
+def test_symmetric_agent_shares_rows(tmp_path: Path) -> None:
+    from slither.symmetry import transform_action, transform_state
+
+    state = (3 << 9) | (1 << 6) | 5
+    for dense in (False, True):
+        agent = QLearningAgent(alpha=0.5, gamma=0.9, epsilon=0.0,
+                               dense=dense, symmetric=True)
+        agent.update(state, 0, 10.0, state, True)
+        assert len(agent.q_table) == 1
+        for transform in range(8):
+            image = transform_state(state, transform)
+            assert agent.best_action(image) == transform_action(0, transform)
+            assert agent.select_action(image) == transform_action(0, transform)
+            assert list(agent.select_actions([image, image])) == [
+                transform_action(0, transform)
+            ] * 2
+        for suffix in (".json", ".bin"):
+            path = agent.save_model(tmp_path / f"model{suffix}")
+            loaded = QLearningAgent(dense=dense)
+            loaded.load_model(path)
+            assert loaded.symmetric
+            assert loaded.best_action(transform_state(state, 6)) == 2
+    with pytest.raises(ValueError):
+        agent.train_native(GameBoard(), 1, 10)
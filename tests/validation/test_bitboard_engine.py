@@ -0,0 +1,92 @@
+"""Bitboard engine validation tests."""
+import unittest
+from collections import Counter
+
+from slither.core import VecGameBoard
+
+from tests.validation.helpers import (
+    Actions,
+    BoardCell,
+    BoardEngine,
+    Direction,
+    consume_row_aligned_cell,
+    move_until_wall,
+    new_board,
+    trigger_self_collision,
+)
+
+
+def _cell_counts(board) -> Counter:
+    return Counter(
+        board.get_cell(x, y)
+        for y in range(board.size)
+        for x in range(board.size)
+    )
+
+
+class TestBitboardEngine(unittest.TestCase):
+    """The bitboard engine must behave like the grid engine."""
+
+    def test_engine_selection(self) -> None:
+        self.assertEqual(new_board().engine, BoardEngine.GRID)
+        board = new_board(engine=BoardEngine.BITBOARD)
+        self.assertEqual(board.engine, BoardEngine.BITBOARD)
+        self.assertEqual(new_board(engine=99).engine, BoardEngine.GRID)
+
+    def test_initial_cells(self) -> None:
+        for size in (8, 10, 20):
+            board = new_board(size=size, engine=BoardEngine.BITBOARD)
+            counts = _cell_counts(board)
+            self.assertEqual(counts[BoardCell.SNAKE_HEAD], 1)
+            self.assertEqual(counts[BoardCell.SNAKE_BODY], 2)
+            self.assertEqual(
+                counts[BoardCell.GREEN_APPLE], 2 + int((size - 10) / 3)
+            )
+            self.assertEqual(
+                counts[BoardCell.RED_APPLE], 1 + int((size - 10) / 5)
+            )
+
+    def test_collisions(self) -> None:
+        board = new_board(engine=BoardEngine.BITBOARD)
+        self.assertEqual(
+            move_until_wall(board, Direction.RIGHT), Actions.HIT_WALL
+        )
+        self.assertEqual(trigger_self_collision(board), Actions.HIT_SELF)
+
+    def test_eats_green_apple(self) -> None:
+        board = new_board(engine=BoardEngine.BITBOARD)
+        result = consume_row_aligned_cell(board, BoardCell.GREEN_APPLE)
+        self.assertEqual(result, Actions.ATE_GREEN_APPLE)
+        self.assertEqual(board.length, 4)
+
+    def test_same_snake_start_as_grid(self) -> None:
+        grid = new_board(size=12)
+        bits = new_board(size=12, engine=BoardEngine.BITBOARD)
+        grid.seed(9)
+        bits.seed(9)
+        grid.reset()
+        bits.reset()
+        for board in (grid, bits):
+            self.assertEqual(board.step(Direction.LEFT)[2], False)
+
+        def snake(board):
+            return [
+                (x, y, board.get_cell(x, y))
+                for y in range(board.size)
+                for x in range(board.size)
+                if board.get_cell(x, y)
+                in (BoardCell.SNAKE_HEAD, BoardCell.SNAKE_BODY)
+            ]
+
+        self.assertEqual(snake(grid), snake(bits))
+
+    def test_vec_board_engine(self) -> None:
+        envs = VecGameBoard(3, engine=BoardEngine.BITBOARD, seed=1)
+        states = envs.reset()
+        self.assertEqual(len(states), 3)
+        _, _, dones = envs.step([Direction.UP] * 3)
+        self.assertEqual(len(dones), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""Board clone/copy validation tests."""
+import unittest
+
+from tests.validation.helpers import BoardEngine, Direction, new_board
+
+PATTERN = (Direction.LEFT, Direction.DOWN, Direction.RIGHT, Direction.DOWN)
+
+
+def _future(board, moves: int = 200) -> list[tuple]:
+    out = []
+    for index in range(moves):
+        state, reward, done = board.step(PATTERN[index % 4])
+        out.append((state, reward, done, board.length, board.score))
+        if done:
+            board.reset()
+    return out
+
+
+class TestClone(unittest.TestCase):
+    """Copies must share the future of their source, RNG included."""
+
+    def test_clone_replays_future(self) -> None:
+        for engine in (BoardEngine.GRID, BoardEngine.BITBOARD):
+            board = new_board(size=12, engine=engine)
+            board.seed(21)
+            board.reset()
+            board.step(Direction.LEFT)
+            copy = board.clone()
+            self.assertEqual(copy.engine, engine)
+            self.assertEqual(copy.last_step.state, board.last_step.state)
+            self.assertEqual(_future(board), _future(copy))
+
+    def test_clone_is_independent(self) -> None:
+        board = new_board()
+        copy = board.clone()
+        state = copy.state
+        board.move(Direction.UP)
+        board.reset()
+        self.assertEqual(copy.state, state)
+        self.assertEqual(copy.moves, 0)
+
+    def test_copy_from_restores_snapshot(self) -> None:
+        board = new_board()
+        board.seed(8)
+        board.reset()
+        snapshot = board.clone()
+        first = _future(board, 50)
+        board.copy_from(snapshot)
+        self.assertEqual(_future(board, 50), first)
+
+    def test_copy_from_rejects_mismatch(self) -> None:
+        board = new_board(size=10)
+        with self.assertRaises(ValueError):
+            board.copy_from(new_board(size=12))
+        with self.assertRaises(ValueError):
+            board.copy_from(new_board(engine=BoardEngine.BITBOARD))
+
+
+if __name__ == "__main__":
+    unittest.main()
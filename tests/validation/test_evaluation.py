@@ -0,0 +1,146 @@
+"""Seeded model evaluation validation tests."""
+import tempfile
+import unittest
+from pathlib import Path
+
+from slither.agent import QLearningAgent
+from slither.core.board import GameBoard
+from slither.evaluation import (
+    compare,
+    describe,
+    discover_models,
+    evaluate,
+    evaluate_many,
+    load_cache,
+    load_policy,
+    paired_difference,
+    save_cache,
+    summarize,
+    tournament,
+)
+from slither.policy import PolicyAgent
+
+
+def _policy() -> PolicyAgent:
+    agent = QLearningAgent(dense=True)
+    agent.train_native(GameBoard(seed=3), 300, 200, seed=3)
+    return PolicyAgent.from_agent(agent)
+
+
+class TestEvaluate(unittest.TestCase):
+    """Episodes are fixed by their seed, whatever the pool size."""
+
+    def test_results_do_not_depend_on_workers(self) -> None:
+        policy = _policy()
+        alone = evaluate(policy, 30, workers=1, seed=7, max_steps=100)
+        pooled = evaluate(policy, 30, workers=2, seed=7, max_steps=100)
+        self.assertEqual(alone, pooled)
+        tail = evaluate(policy, 10, workers=1, seed=27, max_steps=100)
+        self.assertEqual(alone.steps[20:], tail.steps)
+        self.assertEqual(alone.reward[20:], tail.reward)
+
+    def test_summary_counts_every_episode(self) -> None:
+        episodes = evaluate(_policy(), 40, workers=1, max_steps=50)
+        report = summarize(episodes)
+        self.assertEqual(report["episodes"], 40)
+        self.assertEqual(sum(report["deaths"].values()), 40)
+        self.assertEqual(
+            set(report["deaths"]),
+            {"HIT_WALL", "HIT_SELF", "LENGTH_ZERO", "MAX_STEPS"},
+        )
+        steps = report["metrics"]["steps"]
+        self.assertLessEqual(steps["p5"], steps["median"])
+        self.assertLessEqual(steps["median"], steps["p95"])
+        self.assertLessEqual(steps["p95"], 50)
+
+    def test_describe_interval_brackets_mean(self) -> None:
+        stats = describe([1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(stats["mean"], 2.5)
+        self.assertEqual(stats["median"], 2.5)
+        low, high = stats["ci"]
+        self.assertAlmostEqual(high - 2.5, 2.5 - low)
+        self.assertAlmostEqual(high - low, 2 * 1.959964 * stats["stdev"] / 2)
+
+    def test_load_policy_reads_tables_and_policies(self) -> None:
+        policy = _policy()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = policy.save(Path(tmp) / "policy.bin")
+            self.assertEqual(load_policy(path).masks, policy.masks)
+            agent = QLearningAgent()
+            agent.q_table[5] = [0.0, 0.0, 1.0, 0.0]
+            path = agent.save_model(Path(tmp) / "model.json")
+            self.assertEqual(load_policy(path).masks[5], 1 << 2)
+
+
+class TestCompare(unittest.TestCase):
+    """Paired differences over common random numbers."""
+
+    def test_same_model_ties_every_episode(self) -> None:
+        policy = _policy()
+        first = evaluate(policy, 20, workers=1, seed=4, max_steps=80)
+        again = evaluate(policy, 20, workers=1, seed=4, max_steps=80)
+        result = compare(first, again)
+        self.assertEqual(result["length"]["ties"], 20)
+        self.assertEqual(result["reward"]["p_value"], 1.0)
+        self.assertIsNone(result["steps"]["z"])
+        self.assertIsNone(result["steps"]["variance_reduction"])
+        other = evaluate(policy, 20, workers=1, seed=5, max_steps=80)
+        with self.assertRaises(ValueError):
+            compare(first, other)
+
+    def test_pairing_removes_shared_noise(self) -> None:
+        baseline = [1.0, 5.0, 9.0, 3.0, 7.0]
+        candidate = [2.0, 6.0, 10.0, 4.0, 7.5]
+        result = paired_difference(baseline, candidate)
+        self.assertAlmostEqual(result["mean"], 0.9)
+        self.assertEqual((result["wins"], result["losses"]), (5, 0))
+        self.assertLess(result["p_value"], 0.001)
+        self.assertGreater(result["variance_reduction"], 100)
+
+
+class TestTournament(unittest.TestCase):
+    """Checkpoints are ranked, and only new or changed ones are played."""
+
+    def test_reruns_play_only_changed_checkpoints(self) -> None:
+        strong = _policy()
+        weak = PolicyAgent([1] * len(strong.masks))
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            strong.save(directory / "strong.bin")
+            weak.save(directory / "weak.bin")
+            (directory / "notes.txt").write_text("not a model")
+            cache_path = save_cache(directory / ".cache.json", {})
+            models = discover_models(directory)
+            self.assertEqual([p.name for p in models],
+                             ["strong.bin", "weak.bin"])
+            kwargs = {"episodes": 12, "workers": 1, "max_steps": 60}
+            cache = load_cache(cache_path)
+            board = tournament(models, cache=cache, **kwargs)
+            self.assertEqual([e["model"] for e in board],
+                             [str(directory / "strong.bin"),
+                              str(directory / "weak.bin")])
+            self.assertEqual([e["cached"] for e in board], [False, False])
+            save_cache(cache_path, cache)
+            cache = load_cache(cache_path)
+            PolicyAgent([4] * len(weak.masks)).save(directory / "weak.bin")
+            board = tournament(models, cache=cache, **kwargs)
+            cached = {Path(e["model"]).name: e["cached"] for e in board}
+            self.assertEqual(cached, {"strong.bin": True, "weak.bin": False})
+            strong.save(directory / "copy.bin")
+            board = tournament(discover_models(directory), cache=cache,
+                               **kwargs)
+            self.assertTrue(all(entry["cached"] for entry in board))
+            with self.assertRaises(ValueError):
+                tournament(models, metric="score", **kwargs)
+
+    def test_shared_pool_matches_single_evaluations(self) -> None:
+        policy = _policy()
+        weak = PolicyAgent([1] * len(policy.masks))
+        both = evaluate_many([policy, weak], 9, workers=2, seed=3,
+                             max_steps=60)
+        self.assertEqual(both[0], evaluate(policy, 9, 1, 3, max_steps=60))
+        self.assertEqual(both[1], evaluate(weak, 9, 1, 3, max_steps=60))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""Zero-copy grid/body view validation tests."""
+import gc
+import unittest
+from unittest import mock
+
+from slither.core.board import board_lib
+from tests.validation.helpers import (
+    BoardCell,
+    BoardEngine,
+    Direction,
+    new_board,
+)
+
+PATTERN = (Direction.LEFT, Direction.DOWN, Direction.RIGHT, Direction.DOWN)
+
+
+def _cells(board) -> list[list[int]]:
+    return [
+        [board.get_cell(x, y) for x in range(board.size)]
+        for y in range(board.size)
+    ]
+
+
+class TestGridView(unittest.TestCase):
+    """Views over C memory must agree with get_cell()."""
+
+    def test_grid_matches_get_cell(self) -> None:
+        for engine in (BoardEngine.GRID, BoardEngine.BITBOARD):
+            board = new_board(size=13, engine=engine)
+            board.seed(2)
+            board.reset()
+            for index in range(200):
+                self.assertEqual(board.grid.tolist(), _cells(board))
+                if board.step(PATTERN[index % 4])[2]:
+                    board.reset()
+
+    def test_grid_view_is_live_and_read_only(self) -> None:
+        board = new_board()
+        grid = board.grid
+        self.assertEqual(grid.shape, (board.size, board.size))
+        self.assertTrue(grid.readonly)
+        board.reset()
+        self.assertEqual(grid.tolist(), _cells(board))
+
+    def test_views_keep_the_board_alive(self) -> None:
+        board = new_board()
+        board.seed(1)
+        board.reset()
+        expected = _cells(board)
+        grid = board.grid
+        body = board.body
+        board.close()
+        self.assertEqual(board.address, 0)
+        del board
+        gc.collect()
+        self.assertEqual(grid.tolist(), expected)
+        self.assertEqual(len(body), 99)
+
+    def test_last_view_frees_a_closed_board(self) -> None:
+        with new_board() as board:
+            address = board.address
+            expected = _cells(board)
+            grid = board.grid
+            body = board.body
+        self.assertEqual(board.address, 0)
+        self.assertEqual(grid.tolist(), expected)
+        destroy = mock.Mock(wraps=board_lib.board_destroy)
+        with mock.patch.object(board_lib, "board_destroy", destroy):
+            del grid
+            gc.collect()
+            destroy.assert_not_called()
+            del body
+            gc.collect()
+        destroy.assert_called_once_with(address)
+
+    def test_head_and_snake(self) -> None:
+        board = new_board()
+        board.seed(9)
+        board.reset()
+        board.move(Direction.LEFT)
+        snake = board.snake
+        self.assertEqual(len(snake), board.length)
+        self.assertEqual(snake[0], board.head)
+        x, y = board.head
+        self.assertEqual(board.get_cell(x, y), BoardCell.SNAKE_HEAD)
+        for x, y in snake[1:]:
+            self.assertEqual(board.get_cell(x, y), BoardCell.SNAKE_BODY)
+        self.assertEqual(len(board.body), board.size * board.size - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Native extension validation tests (skipped when it is not built)."""
+import unittest
+
+from slither.core.board import NATIVE, GameBoard, StepInfo, _CtypesBoard
+
+from tests.validation.helpers import BoardEngine, Direction
+
+
+class _CtypesGameBoard(_CtypesBoard):
+    __slots__ = ()
+
+    def __init__(self, size: int, seed: int, engine: int) -> None:
+        super().__init__(size, engine, StepInfo())
+        self.seed(seed)
+        self.reset()
+
+
+def _play(board, moves: int = 400) -> list[tuple]:
+    out = []
+    for index in range(moves):
+        state, reward, done = board.step((index * 7 + index // 5) % 4)
+        info = board.last_step
+        out.append((state, reward, done, info.result, info.length,
+                    board.score, board.moves, board.get_cell(index % 10, 3)))
+        if done:
+            board.reset()
+    return out
+
+
+@unittest.skipUnless(NATIVE, "slither.core._board is not built (make ext)")
+class TestNativeBoard(unittest.TestCase):
+    """The extension must match the ctypes bindings call for call."""
+
+    def test_matches_ctypes(self) -> None:
+        for engine in (BoardEngine.GRID, BoardEngine.BITBOARD):
+            native = GameBoard(size=10, seed=42, engine=engine)
+            fallback = _CtypesGameBoard(10, 42, engine)
+            self.assertEqual(native.state, fallback.state)
+            self.assertEqual(_play(native), _play(fallback))
+
+    def test_step_info_is_last_step(self) -> None:
+        board = GameBoard(seed=1)
+        info = board.step_info(Direction.LEFT)
+        self.assertIs(info, board.last_step)
+        self.assertEqual(info.state, board.state)
+
+    def test_closed_board_raises(self) -> None:
+        board = GameBoard()
+        board.close()
+        self.assertEqual(board.address, 0)
+        with self.assertRaises(RuntimeError):
+            board.move(Direction.UP)
+        with self.assertRaises(RuntimeError):
+            _ = board.size
+
+    def test_bad_arguments(self) -> None:
+        board = GameBoard()
+        with self.assertRaises(TypeError):
+            board.get_cell(1)
+        with self.assertRaises(TypeError):
+            board.move("up")
+
+
+if __name__ == "__main__":
+    unittest.main()
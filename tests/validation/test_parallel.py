@@ -0,0 +1,201 @@
+"""Shared-memory parallel training validation tests."""
+import os
+import random
+import threading
+import unittest
+from array import array
+from unittest import mock
+
+from slither import parallel
+from slither.agent import QLearningAgent
+from slither.parallel import (
+    train_actor_learner,
+    train_parallel,
+    train_threaded,
+)
+from slither.policy import PolicyAgent
+from slither.ring import TransitionRing
+
+SHM_DIR = "/dev/shm"
+
+
+def _play(board, agent, max_steps, learn) -> dict:
+    board.reset()
+    state = board.state
+    steps = 0
+    done = False
+    while not done and steps < max_steps:
+        action = agent.select_action(state, explore=learn)
+        next_state, reward, done = board.step(action)
+        agent.update(state, action, reward, next_state, done)
+        state = next_state
+        steps += 1
+    return {"steps": steps, "max_length": board.max_length}
+
+
+def _crash(board, agent, max_steps, learn) -> dict:
+    raise RuntimeError("worker crashed")
+
+
+def _die(*args) -> list:
+    os._exit(1)
+
+
+class TestTrainParallel(unittest.TestCase):
+    """Workers must all train the one shared table."""
+
+    def test_native_workers_train_shared_table(self) -> None:
+        for dense in (False, True):
+            agent = QLearningAgent(dense=dense, epsilon_decay=0.99)
+            agent.q_table[7] = [1.0, 2.0, 3.0, 4.0]
+            history = train_parallel(agent, 101, 3, max_steps=200, seed=5)
+            self.assertEqual(len(history), 101)
+            self.assertEqual(
+                [item["worker"] for item in history[:6]], [0, 1, 2, 0, 1, 2]
+            )
+            self.assertEqual(sum(h["worker"] == 0 for h in history), 34)
+            self.assertGreater(len(agent.q_table), 50)
+            self.assertIn(7, agent.q_table)
+            # Each worker decays its own schedule; the agent keeps the
+            # least decayed one (workers 1 and 2 played 33 episodes).
+            self.assertAlmostEqual(agent.epsilon, 0.99 ** 33)
+
+    def test_python_workers_and_cleanup(self) -> None:
+        agent = QLearningAgent(symmetric=True)
+        has_shm = os.path.isdir(SHM_DIR)
+        segments = set(os.listdir(SHM_DIR)) if has_shm else set()
+        history = train_parallel(
+            agent, 40, 2, max_steps=100, seed=1, play=_play
+        )
+        self.assertEqual(len(history), 40)
+        self.assertTrue(all("epsilon" in item for item in history))
+        self.assertTrue(agent.q_table)
+        if has_shm:
+            self.assertEqual(set(os.listdir(SHM_DIR)), segments)
+        with self.assertRaises(ValueError):
+            train_parallel(agent, 10, 2)
+        with self.assertRaises(ValueError):
+            train_parallel(QLearningAgent(), 10, 0)
+
+    def test_compiled_policy_is_rejected(self) -> None:
+        policy = PolicyAgent.from_agent(QLearningAgent(dense=True))
+        for play in (None, _play):
+            with self.assertRaises(ValueError):
+                train_parallel(policy, 4, 2, seed=1, play=play)
+
+    def test_failed_worker_leaves_no_segment(self) -> None:
+        has_shm = os.path.isdir(SHM_DIR)
+        segments = set(os.listdir(SHM_DIR)) if has_shm else set()
+        with self.assertRaises(RuntimeError):
+            train_parallel(QLearningAgent(), 4, 2, seed=1, play=_crash)
+        if has_shm:
+            self.assertEqual(set(os.listdir(SHM_DIR)), segments)
+
+
+class TestTrainThreaded(unittest.TestCase):
+    """Threads share the table but never a random generator."""
+
+    def test_threads_train_shared_table(self) -> None:
+        for play in (None, _play):
+            agent = QLearningAgent(epsilon_decay=0.99)
+            history = train_threaded(
+                agent, 40, 3, max_steps=200, seed=5, play=play
+            )
+            self.assertEqual(len(history), 40)
+            self.assertEqual(sum(h["worker"] == 0 for h in history), 14)
+            self.assertAlmostEqual(agent.epsilon, 0.99 ** 13)
+            self.assertIs(agent.rng, random)
+            self.assertGreater(len(agent.q_table), 10)
+
+    def test_seeded_policy_evaluation_is_reproducible(self) -> None:
+        agent = QLearningAgent(dense=True)
+        train_threaded(agent, 200, 2, max_steps=200, seed=1)
+        policy = PolicyAgent.from_agent(agent)
+        runs = [
+            train_threaded(policy, 20, 4, max_steps=100, seed=9, play=_play)
+            for _ in range(2)
+        ]
+        self.assertEqual(runs[0], runs[1])
+        with self.assertRaises(ValueError):
+            train_threaded(policy, 20, 4)
+
+
+class TestTransitionRing(unittest.TestCase):
+    """The ring must hand over transitions in order and apply backpressure."""
+
+    def test_wraps_in_order_and_blocks_when_full(self) -> None:
+        buffer = memoryview(bytearray(TransitionRing.nbytes(4)))
+        ring = TransitionRing(buffer, 4)
+        self.assertIsNone(ring.pop(8))
+        for index in range(3):
+            ring.push(index, index % 4, -1.5, index + 1, False)
+        self.assertEqual(ring.pop(2), ([0, 1], [0, 1], [-1.5] * 2, [1, 2],
+                                       [0, 0]))
+        for index in range(3, 6):
+            ring.push(index, index % 4, 0.5, index + 1, index == 5)
+        self.assertEqual(len(ring), 4)
+        # Full: the producer waits until the consumer frees a slot.
+        pusher = threading.Thread(target=ring.push, args=(6, 2, 0.0, 7, True))
+        pusher.start()
+        pusher.join(0.05)
+        self.assertTrue(pusher.is_alive())
+        self.assertEqual(ring.stalls, 1)
+        batch = ring.pop(3)
+        pusher.join(5)
+        self.assertFalse(pusher.is_alive())
+        self.assertEqual(batch[0], [2, 3, 4])
+        self.assertEqual(ring.pop(8), ([5, 6], [1, 2], [0.5, 0.0], [6, 7],
+                                       [1, 1]))
+        self.assertEqual(ring.pushed, 7)
+        ring.release()
+
+
+class TestActorLearner(unittest.TestCase):
+    """Actors stream every transition to the learner."""
+
+    def test_learner_sees_every_transition(self) -> None:
+        for dense in (False, True):
+            agent = QLearningAgent(dense=dense, epsilon_decay=0.99)
+            history, counters = train_actor_learner(
+                agent, 60, 2, max_steps=100, seed=3, ring_capacity=64,
+                batch_size=16, sync_every=2,
+            )
+            self.assertEqual(len(history), 60)
+            self.assertEqual(
+                counters["transitions"], sum(h["steps"] for h in history)
+            )
+            self.assertGreater(counters["syncs"], 0)
+            self.assertGreater(len(agent.q_table), 10)
+            self.assertAlmostEqual(agent.epsilon, 0.99 ** 30)
+
+    def test_compiled_policy_is_rejected(self) -> None:
+        policy = PolicyAgent.from_agent(QLearningAgent(dense=True))
+        with self.assertRaises(ValueError):
+            train_actor_learner(policy, 4, 1, seed=1)
+
+    def test_dead_actor_stops_the_learner(self) -> None:
+        has_shm = os.path.isdir(SHM_DIR)
+        segments = set(os.listdir(SHM_DIR)) if has_shm else set()
+        with mock.patch.object(parallel, "_actor", _die):
+            with self.assertRaises(RuntimeError):
+                train_actor_learner(QLearningAgent(), 4, 2, seed=1)
+        if has_shm:
+            self.assertEqual(set(os.listdir(SHM_DIR)), segments)
+
+    def test_policy_copy_waits_for_a_stable_version(self) -> None:
+        version = memoryview(array("Q", [1]))
+        policy = memoryview(array("d", [1.0, 2.0]))
+        local = memoryview(array("d", [0.0, 0.0]))
+        finish = threading.Timer(0.05, lambda: version.__setitem__(0, 2))
+        finish.start()
+        self.assertEqual(parallel._read_policy(version, policy, local), 2)
+        finish.join()
+        self.assertEqual(local.tolist(), [1.0, 2.0])
+        parallel._publish_policy(version, policy, array("d", [3.0, 4.0]))
+        self.assertEqual(version[0], 4)
+        self.assertEqual(parallel._read_policy(version, policy, local), 4)
+        self.assertEqual(local.tolist(), [3.0, 4.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
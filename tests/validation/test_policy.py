@@ -0,0 +1,65 @@
+"""Compiled policy validation tests."""
+import random
+import tempfile
+import unittest
+from array import array
+from pathlib import Path
+
+from slither.agent import QLearningAgent
+from slither.policy import PolicyAgent, is_policy_file
+from slither.symmetry import transform_action, transform_state
+
+
+def _trained_agent(**kwargs) -> QLearningAgent:
+    rng = random.Random(4)
+    agent = QLearningAgent(epsilon=0.0, **kwargs)
+    for state in rng.sample(range(4096), 300):
+        agent.q_table[state] = [float(rng.randrange(3)) for _ in range(4)]
+    return agent
+
+
+class TestPolicyAgent(unittest.TestCase):
+    """A compiled table must play like the frozen source agent."""
+
+    def test_matches_greedy_agent(self) -> None:
+        agent = _trained_agent()
+        policy = PolicyAgent.from_agent(agent)
+        agent.set_learning(False)
+        for state in range(4096):
+            values = agent.q_table.get(state, [0.0] * 4)
+            top = max(values)
+            best = sum(1 << a for a, v in enumerate(values) if v == top)
+            self.assertEqual(policy.masks[state], best, state)
+            self.assertTrue(best >> policy.select_action(state) & 1)
+        states = array("H", range(4096))
+        out = array("i", bytes(4 * 4096))
+        self.assertIs(policy.select_actions(states, out=out), out)
+        for state, action in zip(states, out):
+            self.assertTrue(policy.masks[state] >> action & 1)
+
+    def test_symmetric_agent_compiles_to_raw_states(self) -> None:
+        agent = QLearningAgent(epsilon=0.0, symmetric=True)
+        state = (3 << 9) | (1 << 6) | 5
+        agent.update(state, 0, 10.0, state, True)
+        policy = PolicyAgent.from_agent(agent)
+        for transform in range(8):
+            self.assertEqual(
+                policy.select_action(transform_state(state, transform)),
+                transform_action(0, transform),
+            )
+
+    def test_save_and_load_round_trip(self) -> None:
+        policy = PolicyAgent.from_agent(_trained_agent(dense=True))
+        with tempfile.TemporaryDirectory() as directory:
+            path = policy.save(Path(directory) / "policy.bin")
+            self.assertTrue(is_policy_file(path))
+            self.assertEqual(PolicyAgent.load(path).masks, policy.masks)
+            path.write_bytes(path.read_bytes()[:-1])
+            with self.assertRaises(ValueError):
+                PolicyAgent.load(path)
+        with self.assertRaises(ValueError):
+            policy.set_learning(True)
+
+
+if __name__ == "__main__":
+    unittest.main()
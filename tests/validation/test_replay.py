@@ -0,0 +1,75 @@
+"""Replay buffer validation tests."""
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from slither.replay import ReplayBuffer
+
+
+def _fill(buffer: ReplayBuffer, count: int) -> None:
+    for index in range(count):
+        buffer.add(index, index % 4, -0.5 * index, index + 1, index % 7 == 0)
+
+
+class TestReplayBuffer(unittest.TestCase):
+    """Ring storage, sampling and persistence."""
+
+    def test_ring_overwrites_oldest(self) -> None:
+        buffer = ReplayBuffer(8)
+        _fill(buffer, 11)
+        self.assertEqual(len(buffer), 8)
+        self.assertEqual(buffer.cursor, 3)
+        self.assertEqual(list(buffer.states[:3]), [8, 9, 10])
+        self.assertEqual(list(buffer.states[3:]), [3, 4, 5, 6, 7])
+        self.assertEqual(buffer.rewards[0], -4.0)
+        batch = buffer.sample(64)
+        for position, slot in enumerate(batch.indices):
+            self.assertEqual(batch.states[position], buffer.states[slot])
+            self.assertEqual(
+                batch.next_states[position], buffer.states[slot] + 1
+            )
+            self.assertEqual(batch.actions[position], buffer.actions[slot])
+        self.assertIsNone(batch.weights)
+        with self.assertRaises(ValueError):
+            ReplayBuffer(4).sample(1)
+
+    def test_prioritized_sampling_follows_priorities(self) -> None:
+        random.seed(3)
+        buffer = ReplayBuffer(5, prioritized=True, priority_alpha=1.0)
+        _fill(buffer, 5)
+        buffer.update_priorities(range(5), [0.0, 0.0, 9.0, 1.0, 0.0])
+        batch = buffer.sample(1000, beta=1.0)
+        counts = [batch.indices.count(slot) for slot in range(5)]
+        self.assertEqual(counts[0] + counts[1] + counts[4], 0)
+        self.assertAlmostEqual(counts[2] / 1000, 0.9, delta=0.01)
+        # The rarer slot gets the full weight, the common one a tenth.
+        weights = dict(zip(batch.indices, batch.weights))
+        self.assertAlmostEqual(weights[3], 1.0)
+        self.assertAlmostEqual(weights[2], 1 / 9, places=5)
+
+    def test_save_and_load_round_trip(self) -> None:
+        for prioritized in (False, True):
+            buffer = ReplayBuffer(6, prioritized=prioritized)
+            _fill(buffer, 9)
+            buffer.update_priorities([1], [4.0])
+            with tempfile.TemporaryDirectory() as directory:
+                path = buffer.save(Path(directory) / "replay.bin")
+                loaded = ReplayBuffer.load(path)
+                path.write_bytes(path.read_bytes()[:-1])
+                with self.assertRaises(ValueError):
+                    ReplayBuffer.load(path)
+            self.assertEqual(loaded.prioritized, prioritized)
+            self.assertEqual((loaded.size, loaded.cursor), (6, 3))
+            for name in (
+                "states", "actions", "rewards", "next_states", "dones"
+            ):
+                self.assertEqual(getattr(loaded, name), getattr(buffer, name))
+            random.seed(5)
+            first = buffer.sample(16)
+            random.seed(5)
+            self.assertEqual(loaded.sample(16), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
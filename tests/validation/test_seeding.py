@@ -0,0 +1,59 @@
+"""Per-board RNG seeding validation tests."""
+import unittest
+
+from slither.core import GameBoard, VecGameBoard
+
+from tests.validation.helpers import Direction, new_board
+
+
+def _snapshot(board) -> list[int]:
+    return [
+        board.get_cell(x, y)
+        for y in range(board.size)
+        for x in range(board.size)
+    ]
+
+
+PATTERN = (Direction.LEFT, Direction.DOWN, Direction.RIGHT)
+
+
+def _trajectory(board, moves: int = 30) -> list[tuple]:
+    out = []
+    for index in range(moves):
+        state, reward, done = board.step(PATTERN[index % 3])
+        out.append((state, reward, done, board.length))
+        if done:
+            board.reset()
+    return out
+
+
+class TestSeeding(unittest.TestCase):
+    """Seeded boards must replay identical episodes."""
+
+    def test_same_seed_same_board(self) -> None:
+        first = new_board(size=14)
+        first.seed(2024)
+        first.reset()
+        second = new_board(size=14)
+        second.seed(2024)
+        second.reset()
+        self.assertEqual(_snapshot(first), _snapshot(second))
+        self.assertEqual(_trajectory(first), _trajectory(second))
+
+    def test_constructor_seed_resets_board(self) -> None:
+        self.assertEqual(
+            _snapshot(GameBoard(seed=5)), _snapshot(GameBoard(seed=5))
+        )
+
+    def test_vec_board_seed(self) -> None:
+        first = VecGameBoard(4, seed=11)
+        second = VecGameBoard(4, seed=11)
+        self.assertEqual(first.reset().tolist(), second.reset().tolist())
+        actions = [Direction.LEFT] * 4
+        self.assertEqual(
+            first.step(actions)[0].tolist(), second.step(actions)[0].tolist()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
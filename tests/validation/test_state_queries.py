@@ -36,6 +36,28 @@ class TestStateQueries(unittest.TestCase):
         self.assertGreaterEqual(state, 0)
         self.assertLessEqual(state, 0xFFF)
 
+    def test_status_matches_properties(self) -> None:
+        board = new_board(size=12)
+        board.move(Direction.LEFT)
+        status = board.status()
+        self.assertEqual(
+            (status.score, status.length, status.max_length, status.moves,
+             status.size, status.state, status.game_over),
+            (board.score, board.length, board.max_length, board.moves,
+             board.size, board.state, board.is_game_over),
+        )
+        board.reset()
+        self.assertEqual(status.moves, 1)
+        self.assertEqual(board.status().moves, 0)
+
+    def test_closed_board_queries_raise(self) -> None:
+        board = new_board()
+        board.close()
+        with self.assertRaises(RuntimeError):
+            board.status()
+        with self.assertRaises(RuntimeError):
+            _ = board.head
+
     def test_get_cell_boundaries(self) -> None:
         board = new_board()
         self.assertEqual(board.get_cell(-1, 0), BoardCell.WALL)
@@ -73,6 +95,23 @@ class TestStateQueries(unittest.TestCase):
             Actions.LENGTH_ZERO,
         })
 
+    def test_step_info_matches_board_queries(self) -> None:
+        board = new_board()
+        info = board.step_info(Direction.LEFT)
+        self.assertIs(info, board.last_step)
+        self.assertEqual(info.state, board.state)
+        self.assertEqual(info.length, board.length)
+        self.assertEqual(info.score, board.score)
+        self.assertEqual(info.done, board.is_game_over)
+        self.assertNotEqual(info.result, -1)
+
+    def test_step_info_reports_death(self) -> None:
+        board = new_board()
+        info = board.step_info(Direction.UP)
+        self.assertEqual(info.result, Actions.HIT_SELF)
+        self.assertTrue(info.done)
+        self.assertAlmostEqual(info.reward, REWARD_DEATH, places=5)
+
 
 if __name__ == "__main__":
     unittest.main()
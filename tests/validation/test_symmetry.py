@@ -0,0 +1,53 @@
+"""State symmetry validation tests."""
+import unittest
+
+from slither.core import Direction
+from slither.symmetry import (
+    ACTION_FROM_CANONICAL,
+    ACTION_TO_CANONICAL,
+    CANONICAL_STATES,
+    TRANSFORMS,
+    canonicalize,
+    transform_action,
+    transform_state,
+)
+
+# UP=green apple (3), LEFT=danger (1), DOWN=clear (0), RIGHT=body (5)
+STATE = (3 << 9) | (1 << 6) | (0 << 3) | 5
+
+
+class TestSymmetry(unittest.TestCase):
+    """Transforms must move rays and actions together."""
+
+    def test_quarter_turn_and_mirror(self) -> None:
+        # A quarter turn counter-clockwise: what was up is now left.
+        turned = transform_state(STATE, 1)
+        self.assertEqual(turned, (5 << 9) | (3 << 6) | (1 << 3) | 0)
+        self.assertEqual(transform_action(Direction.UP, 1), Direction.LEFT)
+        # The mirror swaps left and right only.
+        mirrored = transform_state(STATE, 4)
+        self.assertEqual(mirrored, (3 << 9) | (5 << 6) | (0 << 3) | 1)
+        self.assertEqual(transform_action(Direction.LEFT, 4), Direction.RIGHT)
+        self.assertEqual(transform_action(Direction.UP, 4), Direction.UP)
+
+    def test_symmetric_states_share_a_frame(self) -> None:
+        self.assertEqual(len(set(CANONICAL_STATES)), 666)
+        canonical, transform = canonicalize(STATE)
+        self.assertEqual(transform_state(STATE, transform), canonical)
+        for image in range(TRANSFORMS):
+            other = transform_state(STATE, image)
+            other_canonical, other_transform = canonicalize(other)
+            self.assertEqual(other_canonical, canonical)
+            # The action towards the green apple lands on the same column.
+            apple = transform_action(Direction.UP, image)
+            self.assertEqual(
+                ACTION_TO_CANONICAL[other_transform * 4 + apple],
+                ACTION_TO_CANONICAL[transform * 4 + Direction.UP],
+            )
+        for index, action in enumerate(ACTION_TO_CANONICAL):
+            base = index - index % 4
+            self.assertEqual(ACTION_FROM_CANONICAL[base + action], index % 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Move undo (push_move/pop_move) validation tests."""
+import unittest
+
+from tests.validation.helpers import BoardEngine, Direction, new_board
+
+PATTERN = (Direction.LEFT, Direction.DOWN, Direction.RIGHT, Direction.UP,
+           Direction.LEFT)
+
+
+def _snapshot(board) -> tuple:
+    cells = tuple(
+        board.get_cell(x, y)
+        for y in range(board.size)
+        for x in range(board.size)
+    )
+    return (cells, board.score, board.length, board.max_length,
+            board.moves, board.is_game_over)
+
+
+class TestUndo(unittest.TestCase):
+    """pop_move must put the board back exactly, RNG included."""
+
+    def test_pop_restores_each_move(self) -> None:
+        for engine in (BoardEngine.GRID, BoardEngine.BITBOARD):
+            board = new_board(engine=engine)
+            board.seed(4)
+            board.reset()
+            for index in range(300):
+                before = _snapshot(board)
+                board.push_move(PATTERN[index % 5])
+                board.pop_move()
+                self.assertEqual(_snapshot(board), before)
+                board.move(PATTERN[index % 5])
+                if board.is_game_over:
+                    board.reset()
+
+    def test_undo_then_replay(self) -> None:
+        board = new_board(size=12)
+        board.seed(11)
+        board.reset()
+        start = _snapshot(board)
+        first = [board.push_move(PATTERN[i % 5]) for i in range(40)]
+        self.assertEqual(board.undo_depth, 40)
+        while board.undo_depth:
+            board.pop_move()
+        self.assertEqual(_snapshot(board), start)
+        self.assertEqual(
+            [board.push_move(PATTERN[i % 5]) for i in range(40)], first)
+
+    def test_pop_on_empty_stack_raises(self) -> None:
+        board = new_board()
+        with self.assertRaises(IndexError):
+            board.pop_move()
+        board.push_move(Direction.UP)
+        board.reset()
+        self.assertEqual(board.undo_depth, 0)
+        with self.assertRaises(IndexError):
+            board.pop_move()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Batched board (VecGameBoard) validation tests."""
+import unittest
+
+from slither.core import DoneFlag, VecGameBoard
+from slither.core.rewards import (
+    REWARD_DEATH,
+    REWARD_GREEN_APPLE,
+    REWARD_RED_APPLE,
+    REWARD_STEP,
+)
+
+from tests.validation.helpers import Direction
+
+
+class TestVecGameBoard(unittest.TestCase):
+    """Ensure the batched engine behaves like independent boards."""
+
+    def test_reset_returns_one_state_per_env(self) -> None:
+        envs = VecGameBoard(8, size=12)
+        states = envs.reset()
+        self.assertEqual(len(states), 8)
+        self.assertEqual(envs.size, 12)
+        for state in states:
+            self.assertLessEqual(state, 0xFFF)
+
+    def test_step_fills_buffers(self) -> None:
+        envs = VecGameBoard(16)
+        envs.reset()
+        states, rewards, dones = envs.step([Direction.RIGHT] * 16)
+        self.assertEqual(len(states), 16)
+        for reward in rewards:
+            self.assertIn(round(reward, 4), {
+                round(REWARD_GREEN_APPLE, 4),
+                round(REWARD_RED_APPLE, 4),
+                round(REWARD_DEATH, 4),
+                round(REWARD_STEP, 4),
+            })
+        for done in dones:
+            self.assertIn(done, {DoneFlag.RUNNING, DoneFlag.TERMINAL})
+
+    def test_self_collision_auto_resets(self) -> None:
+        envs = VecGameBoard(4)
+        envs.reset()
+        _, rewards, dones = envs.step([Direction.UP] * 4)
+        self.assertEqual(list(dones), [DoneFlag.TERMINAL] * 4)
+        self.assertAlmostEqual(rewards[0], REWARD_DEATH, places=5)
+        self.assertEqual(list(envs.lengths), [3] * 4)
+        # Fresh boards can always step left without dying.
+        _, _, dones = envs.step([Direction.LEFT] * 4)
+        self.assertEqual(list(dones), [DoneFlag.RUNNING] * 4)
+
+    def test_max_steps_truncates(self) -> None:
+        envs = VecGameBoard(4, max_steps=1)
+        envs.reset()
+        _, _, dones = envs.step([Direction.DOWN] * 4)
+        for done in dones:
+            self.assertIn(done, {DoneFlag.TERMINAL, DoneFlag.TRUNCATED})
+
+    def test_invalid_env_count_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            VecGameBoard(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,8 +7,17 @@ import random
 from pathlib import Path
 from statistics import mean
 
-from slither import GameBoard
+from slither import GameBoard, VecGameBoard
 from slither.agent import QLearningAgent
+from slither.core import BoardEngine, DoneFlag
+from slither.parallel import (
+    gil_enabled,
+    train_actor_learner,
+    train_parallel,
+    train_threaded,
+)
+from slither.policy import PolicyAgent, is_policy_file
+from slither.replay import ReplayBuffer
 
 
 def parse_args() -> argparse.Namespace:
@@ -26,7 +35,77 @@ def parse_args() -> argparse.Namespace:
     add("--save", type=Path, default=None, help="Save path")
     add("--load", type=Path, default=None, help="Load path")
     add("--dontlearn", action="store_true", help="Skip updates")
-    return parser.parse_args()
+    add("--envs", type=int, default=1, help="Boards stepped per C call")
+    add("--workers", type=int, default=1, help="Processes sharing the table")
+    add("--actors", type=int, default=0, help="Actor processes, one learner")
+    add("--threads", type=int, default=1, help="Threads sharing the agent")
+    add("--bitboard", action="store_true", help="Use the bitboard engine")
+    add("--dense", action="store_true", help="Array-backed Q-table")
+    add("--symmetric", action="store_true", help="Canonicalise states")
+    add("--policy", action="store_true", help="Play a compiled greedy table")
+    add("--export-policy", type=Path, default=None, help="Policy save path")
+    add("--replay", type=int, default=0, help="Replay buffer capacity")
+    add("--replay-batch", type=int, default=32, help="Replayed per step")
+    add("--prioritized", action="store_true", help="Prioritized replay")
+    add("--replay-file", type=Path, default=None, help="Replay load/save")
+    add(
+        "--engine",
+        choices=("python", "native"),
+        default="python",
+        help="Run the training loop in Python or entirely in C",
+    )
+    args = parser.parse_args()
+    replay = bool(args.replay) or args.replay_file is not None
+    if args.prioritized and not replay:
+        parser.error("--prioritized needs --replay or --replay-file")
+    args.replay_buffer = None
+    if args.replay_file is not None and args.replay_file.exists():
+        try:
+            args.replay_buffer = ReplayBuffer.load(args.replay_file)
+        except ValueError as error:
+            parser.error(str(error))
+        saved = args.replay_buffer
+        if saved.prioritized and not args.prioritized:
+            parser.error("--replay-file is prioritized; add --prioritized")
+        if args.prioritized and not saved.prioritized:
+            parser.error("--replay-file is uniform; drop --prioritized")
+        if args.replay and args.replay != saved.capacity:
+            parser.error(
+                f"--replay-file holds {saved.capacity} transitions, "
+                f"not --replay {args.replay}"
+            )
+    if args.engine == "native" and args.envs > 1:
+        parser.error("--engine native plays a single board; drop --envs")
+    if args.engine == "native" and replay:
+        parser.error("--engine native does not use a replay buffer")
+    if args.engine == "native" and args.symmetric:
+        parser.error("--engine native does not canonicalise states")
+    if args.policy:
+        args.dontlearn = True
+    if args.engine == "native" and args.policy:
+        parser.error("--engine native plays its own table; drop --policy")
+    if args.workers > 1 and (args.envs > 1 or args.policy or replay):
+        parser.error("--workers runs one board per process without replay")
+    loads_policy = (
+        args.load is not None
+        and args.load.exists()
+        and is_policy_file(args.load)
+    )
+    if (args.workers > 1 or args.actors) and loads_policy:
+        parser.error("--workers and --actors train a Q-table, not a policy")
+    if args.actors and (
+        args.workers > 1
+        or args.envs > 1
+        or args.policy
+        or replay
+        or args.engine == "native"
+    ):
+        parser.error("--actors plays Python boards into a single learner")
+    if args.threads > 1 and (
+        args.workers > 1 or args.actors or args.envs > 1 or replay
+    ):
+        parser.error("--threads runs one board per thread without replay")
+    return args
 
 
 def run_episode(
@@ -34,6 +113,8 @@ def run_episode(
     agent: QLearningAgent,
     max_steps: int,
     learn: bool,
+    replay: ReplayBuffer | None = None,
+    replay_batch: int = 32,
 ) -> dict[str, float]:
     board.reset()
     state = board.state
@@ -45,20 +126,110 @@ def run_episode(
         next_state, reward, done = board.step(action)
         if learn:
             agent.update(state, action, reward, next_state, done)
+            if replay is not None:
+                replay.add(state, action, reward, next_state, done)
+                learn_from_replay(agent, replay, replay_batch)
         total_reward += reward
         state = next_state
         steps += 1
         if done:
             break
 
+    status = board.status()
     return {
         "steps": steps,
         "reward": total_reward,
-        "length": board.length,
-        "max_length": board.max_length,
+        "length": status.length,
+        "max_length": status.max_length,
     }
 
 
+def learn_from_replay(
+    agent: QLearningAgent,
+    replay: ReplayBuffer,
+    batch_size: int,
+) -> None:
+    """Replay one sampled batch, weighted by its importance-sampling
+    weights, and refresh its priorities."""
+    batch = replay.sample(batch_size)
+    fields = (
+        batch.states,
+        batch.actions,
+        batch.rewards,
+        batch.next_states,
+        batch.dones,
+    )
+    agent.update_batch(*fields, batch.weights)
+    if replay.prioritized:
+        replay.update_priorities(batch.indices, agent.td_errors(*fields))
+
+
+def print_episode(
+    episode: int, stats: dict[str, float], epsilon: float
+) -> None:
+    """Print one line of end-of-episode stats."""
+    print(
+        f"Episode {episode:04d} - steps={stats['steps']:.0f} "
+        f"reward={stats['reward']:.2f} length={stats['length']} "
+        f"max_length={stats['max_length']} epsilon={epsilon:.3f}"
+    )
+
+
+def run_vectorized(
+    envs: VecGameBoard,
+    agent: QLearningAgent,
+    sessions: int,
+    learn: bool,
+    replay: ReplayBuffer | None = None,
+    replay_batch: int = 32,
+) -> list[dict[str, float]]:
+    """Play ``sessions`` episodes across all boards of ``envs``."""
+    states = envs.reset()
+    actions = envs.actions
+    totals = [0.0] * envs.num_envs
+    steps = [0] * envs.num_envs
+    history: list[dict[str, float]] = []
+
+    while len(history) < sessions:
+        previous = states[:]
+        agent.select_actions(previous, explore=learn, out=actions)
+        states, rewards, dones = envs.step(actions)
+        # Truncated boards were already reset: update_batch skips them.
+        if learn:
+            agent.update_batch(previous, actions, rewards, states, dones)
+            if replay is not None:
+                for index, done in enumerate(dones):
+                    if done != DoneFlag.TRUNCATED:
+                        replay.add(
+                            previous[index],
+                            actions[index],
+                            rewards[index],
+                            states[index],
+                            done,
+                        )
+                learn_from_replay(agent, replay, replay_batch)
+
+        for index, done in enumerate(dones):
+            reward = rewards[index]
+            totals[index] += reward
+            steps[index] += 1
+            if done == DoneFlag.RUNNING:
+                continue
+            if learn:
+                agent.decay_epsilon()
+            history.append({
+                "steps": steps[index],
+                "reward": totals[index],
+                "length": envs.lengths[index],
+                "max_length": envs.max_lengths[index],
+                "epsilon": agent.epsilon,
+            })
+            totals[index] = 0.0
+            steps[index] = 0
+
+    return history[:sessions]
+
+
 def main() -> None:
     args = parse_args()
 
@@ -71,25 +242,111 @@ def main() -> None:
         epsilon=args.epsilon,
         min_epsilon=args.min_epsilon,
         epsilon_decay=args.epsilon_decay,
+        dense=args.dense,
+        symmetric=args.symmetric,
     )
-    agent.load_or_initialize(args.load)
+    load = args.load
+    if load is not None and load.exists() and is_policy_file(load):
+        if args.engine == "native":
+            raise SystemExit("--engine native cannot play a compiled policy")
+        agent = PolicyAgent.load(load)
+        args.dontlearn = True
+    else:
+        agent.load_or_initialize(args.load)
     if args.dontlearn:
         agent.set_learning(False)
+    if args.policy and not isinstance(agent, PolicyAgent):
+        agent = PolicyAgent.from_agent(agent)
 
-    board = GameBoard(size=args.size)
+    replay = args.replay_buffer
+    if replay is None and (args.replay or args.replay_file is not None):
+        replay = ReplayBuffer(args.replay or 100_000, args.prioritized)
 
     history: list[dict[str, float]] = []
-    for episode in range(1, args.sessions + 1):
-        learn = not args.dontlearn
-        stats = run_episode(board, agent, args.max_steps, learn)
-        history.append(stats)
-        if not args.dontlearn:
-            agent.decay_epsilon()
+    engine = BoardEngine.BITBOARD if args.bitboard else BoardEngine.GRID
+    if args.actors:
+        history, counters = train_actor_learner(
+            agent,
+            args.sessions,
+            args.actors,
+            max_steps=args.max_steps,
+            size=args.size,
+            seed=args.seed,
+            engine=engine,
+        )
+        for episode, stats in enumerate(history, start=1):
+            print_episode(episode, stats, stats["epsilon"])
         print(
-            f"Episode {episode:04d} - steps={stats['steps']:.0f} "
-            f"reward={stats['reward']:.2f} length={stats['length']} "
-            f"max_length={stats['max_length']} epsilon={agent.epsilon:.3f}"
+            f"Learner: {counters['transitions']} transitions in "
+            f"{counters['updates']} batches "
+            f"({counters['transitions_per_second']:.0f}/s), "
+            f"{counters['syncs']} policy syncs, "
+            f"{counters['stalls']} full-ring stalls"
+        )
+    elif args.workers > 1:
+        history = train_parallel(
+            agent,
+            args.sessions,
+            args.workers,
+            max_steps=args.max_steps,
+            size=args.size,
+            seed=args.seed,
+            engine=engine,
+            play=run_episode if args.engine == "python" else None,
+        )
+        for episode, stats in enumerate(history, start=1):
+            print_episode(episode, stats, stats["epsilon"])
+    elif args.threads > 1:
+        history = train_threaded(
+            agent,
+            args.sessions,
+            args.threads,
+            max_steps=args.max_steps,
+            size=args.size,
+            seed=args.seed,
+            engine=engine,
+            play=run_episode if args.engine == "python" else None,
+        )
+        for episode, stats in enumerate(history, start=1):
+            print_episode(episode, stats, stats["epsilon"])
+        gil = "on" if gil_enabled() else "off"
+        print(f"Threads: {args.threads} sharing the agent (GIL {gil})")
+    elif args.envs > 1:
+        envs = VecGameBoard(
+            args.envs,
+            size=args.size,
+            max_steps=args.max_steps,
+            seed=args.seed,
+            engine=engine,
+        )
+        history = run_vectorized(
+            envs,
+            agent,
+            args.sessions,
+            not args.dontlearn,
+            replay,
+            args.replay_batch,
+        )
+        for episode, stats in enumerate(history, start=1):
+            print_episode(episode, stats, stats["epsilon"])
+    elif args.engine == "native":
+        board = GameBoard(size=args.size, seed=args.seed, engine=engine)
+        history = agent.train_native(
+            board, args.sessions, args.max_steps, seed=args.seed
         )
+        for episode, stats in enumerate(history, start=1):
+            print_episode(episode, stats, stats["epsilon"])
+    else:
+        board = GameBoard(size=args.size, seed=args.seed, engine=engine)
+        for episode in range(1, args.sessions + 1):
+            learn = not args.dontlearn
+            stats = run_episode(
+                board, agent, args.max_steps, learn, replay, args.replay_batch
+            )
+            history.append(stats)
+            if not args.dontlearn:
+                agent.decay_epsilon()
+            print_episode(episode, stats, agent.epsilon)
 
     avg_reward = mean(item["reward"] for item in history)
     best_length = max(item["max_length"] for item in history)
@@ -98,7 +355,16 @@ def main() -> None:
     print(f"Average reward: {avg_reward:.2f}")
     print(f"Best length: {best_length}")
 
-    if args.save is not None:
+    if args.export_policy is not None:
+        policy = agent
+        if not isinstance(policy, PolicyAgent):
+            policy = PolicyAgent.from_agent(agent)
+        path = policy.save(args.export_policy)
+        print(f"Policy saved to {path}")
+    if args.save is not None and isinstance(agent, PolicyAgent):
+        path = agent.save(args.save)
+        print(f"Policy saved to {path}")
+    elif args.save is not None:
         metadata = {
             "episodes": args.sessions,
             "max_length": best_length,
@@ -106,6 +372,9 @@ def main() -> None:
         }
         path = agent.save_model(args.save, metadata=metadata)
         print(f"Model saved to {path}")
+    if replay is not None and args.replay_file is not None:
+        path = replay.save(args.replay_file)
+        print(f"Replay buffer saved to {path}")
 
 
 if __name__ == "__main__":